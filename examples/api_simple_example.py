@@ -5,13 +5,16 @@ Simple Example for splurge-sql-generator
 This example demonstrates the simplified logger approach with a working database setup.
 """
 
+import contextlib
+import importlib
 import logging
 import os
 import shutil
 import sys
 import tempfile
+from collections.abc import Iterator
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 
 from splurge_sql_generator import generate_class
 from splurge_sql_generator.utils import to_snake_case
@@ -19,6 +22,49 @@ from splurge_sql_generator.utils import to_snake_case
 # Add the project root to the path so we can import from 'output' and the package
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
+# SQL used to build the test database, built once at module load
+_CREATE_USERS_TABLE = text(
+    """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        username TEXT UNIQUE NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        status TEXT DEFAULT 'active',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+)
+# Seed rows are passed as a list of parameter sets so SQLAlchemy uses executemany
+_INSERT_TEST_USER = text(
+    "INSERT INTO users (id, username, email, password_hash, status) "
+    "VALUES (:id, :username, :email, :password_hash, :status)"
+)
+_TEST_USERS = [
+    {
+        "id": 1,
+        "username": "john_doe",
+        "email": "john@example.com",
+        "password_hash": "hashed_password_123",
+        "status": "active",
+    },
+    {
+        "id": 2,
+        "username": "jane_smith",
+        "email": "jane@example.com",
+        "password_hash": "hashed_password_456",
+        "status": "active",
+    },
+    {
+        "id": 3,
+        "username": "bob_wilson",
+        "email": "bob@example.com",
+        "password_hash": "hashed_password_789",
+        "status": "inactive",
+    },
+]
+
 
 def _generate_classes_to_temp() -> str:
     """Generate required example classes into a temporary directory.
@@ -28,11 +74,7 @@ def _generate_classes_to_temp() -> str:
     """
     temp_dir = tempfile.mkdtemp()
 
-    # Create __init__.py to make it a package
-    init_file = os.path.join(temp_dir, "__init__.py")
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write("")
-
+    # No __init__.py needed: the directory is put on sys.path and its modules are imported directly
     # Generate User class
     sql_path = os.path.join(PROJECT_ROOT, "examples", "User.sql")
     schema_path = os.path.join(PROJECT_ROOT, "examples", "User.schema")
@@ -43,48 +85,58 @@ def _generate_classes_to_temp() -> str:
     return temp_dir
 
 
+# Each example runs as a standalone script, so this helper is duplicated on purpose;
+# keep it identical to the copies in api_usage_example.py and cli_usage_example.py.
+@contextlib.contextmanager
+def _on_sys_path(path: str) -> Iterator[None]:
+    """Temporarily prepend a directory to sys.path, restoring the original list on exit.
+
+    Args:
+        path: Directory to make importable
+    """
+    saved_path = sys.path[:]
+    sys.path.insert(0, path)
+    importlib.invalidate_caches()
+    try:
+        yield
+    finally:
+        sys.path[:] = saved_path
+
+
 def setup_logging():
-    """Configure logging to see the class-level logger in action."""
+    """Configure logging; set SPLURGE_LOG_LEVEL=DEBUG to see the class-level logger in action."""
+    level = getattr(logging, os.environ.get("SPLURGE_LOG_LEVEL", "INFO").upper(), logging.INFO)
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
 
 def create_test_database():
-    """Create a test database with the correct schema."""
-    engine = create_engine("sqlite:///:memory:")
+    """Create a test database with the correct schema.
 
-    with engine.connect() as conn:
+    Seed rows are inserted with executemany inside a single transaction, so larger seeds
+    pay for one commit rather than one per row.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    file_backed = engine.url.database not in (None, "", ":memory:")
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune every new SQLite connection; WAL only applies to file-backed databases."""
+        cursor = dbapi_connection.cursor()
+        if file_backed:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    with engine.begin() as conn:
         # Create users table with all required columns
-        conn.execute(
-            text(
-                """
-            CREATE TABLE users (
-                id INTEGER PRIMARY KEY,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                status TEXT DEFAULT 'active',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-            )
-        )
+        conn.execute(_CREATE_USERS_TABLE)
 
         # Insert test data
-        conn.execute(
-            text(
-                """
-            INSERT INTO users (id, username, email, password_hash, status) VALUES 
-            (1, 'john_doe', 'john@example.com', 'hashed_password_123', 'active'),
-            (2, 'jane_smith', 'jane@example.com', 'hashed_password_456', 'active'),
-            (3, 'bob_wilson', 'bob@example.com', 'hashed_password_789', 'inactive')
-        """
-            )
-        )
-        conn.commit()
+        conn.execute(_INSERT_TEST_USER, _TEST_USERS)
 
     return engine
 
@@ -101,15 +153,16 @@ def demonstrate_simplified_logger():
     temp_dir = _generate_classes_to_temp()
 
     try:
-        # Add temp directory to path so we can import
-        sys.path.insert(0, temp_dir)
-        from user import User
+        # Import the generated class with the temp directory on the path
+        with _on_sys_path(temp_dir):
+            from user import User
 
         # Create database
         engine = create_test_database()
 
-        with engine.connect() as connection:
-            print("1. Fetching user by ID (notice the logger output above):")
+        # One connection and one outer transaction for all six steps; writes use savepoints
+        with engine.begin() as connection:
+            print("1. Fetching user by ID (run with SPLURGE_LOG_LEVEL=DEBUG to see the logger output):")
             users = User.get_user_by_id(connection=connection, user_id=1)
 
             if users:
@@ -130,25 +183,23 @@ def demonstrate_simplified_logger():
                 print(f"   - {status_count.status}: {status_count.user_count}")
             print()
 
-            print("4. Creating a new user (with transaction):")
-            with engine.connect() as tx_conn:
-                with tx_conn.begin():
-                    result = User.create_user(
-                        connection=tx_conn,
-                        username="alice_jones",
-                        email="alice@example.com",
-                        password_hash="hashed_password_999",
-                        status="active",
-                    )
-                    new_user_id = result.fetchone()[0]
-                    print(f"   Created user with ID: {new_user_id}")
+            print("4. Creating a new user (with savepoint):")
+            with connection.begin_nested():
+                result = User.create_user(
+                    connection=connection,
+                    username="alice_jones",
+                    email="alice@example.com",
+                    password_hash="hashed_password_999",
+                    status="active",
+                )
+                new_user_id = result.scalar()
+                print(f"   Created user with ID: {new_user_id}")
             print()
 
             print("5. Updating user status:")
-            with engine.connect() as tx_conn:
-                with tx_conn.begin():
-                    User.update_user_status(connection=tx_conn, user_id=3, new_status="active")
-                    print("   Updated user status")
+            with connection.begin_nested():
+                User.update_user_status(connection=connection, user_id=3, new_status="active")
+                print("   Updated user status")
             print()
 
             print("6. Verifying the update:")
@@ -156,9 +207,7 @@ def demonstrate_simplified_logger():
             print(f"   Now have {len(updated_users)} active users")
 
     finally:
-        # Remove from path and cleanup
-        if temp_dir in sys.path:
-            sys.path.remove(temp_dir)
+        # Cleanup
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
@@ -5,35 +5,163 @@ Usage Example for splurge-sql-generator
 This example demonstrates how to use the generated classes with the simplified logger approach.
 """
 
+import contextlib
+import functools
+import hashlib
+import importlib
 import logging
 import os
 import shutil
 import sys
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import StaticPool
 
-from splurge_sql_generator import generate_class
+import splurge_sql_generator
+from splurge_sql_generator import __version__, generate_class
 from splurge_sql_generator.utils import to_snake_case
 
 # Add the project root to the path so we can import from the package
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
+# Persistent cache of generated modules, reused across runs of this example
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "splurge-sql-generator")
+# The generator's sources and templates are part of the cache key, so any change to how code is
+# generated invalidates cached modules even without a version bump
+_PACKAGE_DIR = os.path.dirname(splurge_sql_generator.__file__)
+_GENERATOR_FILE_SUFFIXES = (".py", ".j2", ".yaml")
+# generate_class() resolves its type mapping file against the working directory
+_TYPE_MAPPING_FILE = "types.yaml"
+
+# Bulk inserts for the demonstrations; executed with a list of parameter sets (executemany)
+_INSERT_USERS = text(
+    "INSERT INTO users (username, email, password_hash, status) VALUES (:username, :email, :password_hash, :status)"
+)
+_INSERT_PRODUCTS = text(
+    "INSERT INTO products (name, description, price, category_id, stock_quantity) "
+    "VALUES (:name, :description, :price, :category_id, :stock_quantity)"
+)
+
+# Example schema, executed as a single script by setup_database()
+SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    description TEXT,
+    price DECIMAL(10,2) NOT NULL,
+    category_id INTEGER,
+    stock_quantity INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    total_amount DECIMAL(10,2) NOT NULL,
+    status TEXT DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users (id)
+);
+
+CREATE TABLE IF NOT EXISTS order_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    price DECIMAL(10,2) NOT NULL,
+    FOREIGN KEY (order_id) REFERENCES orders (id),
+    FOREIGN KEY (product_id) REFERENCES products (id)
+);
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _generator_fingerprint() -> bytes:
+    """Hash everything besides the inputs that shapes generated code.
+
+    Covers the package version, every source, template and mapping file of the installed
+    package (including the built-in type mapping) and the working directory's type mapping
+    file when one exists.
+
+    Returns:
+        Digest identifying the generator
+    """
+    digest = hashlib.blake2b(__version__.encode("utf-8"))
+    generator_files = sorted(
+        os.path.join(root, name)
+        for root, _dirs, names in os.walk(_PACKAGE_DIR)
+        for name in names
+        if name.endswith(_GENERATOR_FILE_SUFFIXES)
+    )
+    if os.path.isfile(_TYPE_MAPPING_FILE):
+        generator_files.append(os.path.abspath(_TYPE_MAPPING_FILE))
+    for path in generator_files:
+        with open(path, "rb") as f:
+            digest.update(b"\0".join((path.encode("utf-8"), f.read(), b"")))
+    return digest.digest()
+
 
-def _ensure_generated_classes() -> str:
-    """Generate all example classes into a temporary directory.
+def _cache_key(sql_path: str, schema_path: str) -> str:
+    """Compute a cache key from the SQL and schema contents and the generator fingerprint.
+
+    Args:
+        sql_path: Path to the SQL template file
+        schema_path: Path to the schema file
 
     Returns:
-        Path to the temporary directory containing generated classes
+        Hex digest identifying the generated module
+    """
+    with open(sql_path, "rb") as f:
+        sql_bytes = f.read()
+    with open(schema_path, "rb") as f:
+        schema_bytes = f.read()
+    return hashlib.blake2b(b"\0".join((sql_bytes, schema_bytes, _generator_fingerprint()))).hexdigest()
+
+
+def _generate_cached_module(job: tuple[str, str, str]) -> None:
+    """Generate a single module into the cache (runs in a worker process).
+
+    The module is written to a temporary file in the cache directory and moved into place
+    atomically, so an interrupted run never leaves a truncated module under its cache key.
+
+    Args:
+        job: Tuple of (sql_path, schema_path, cached_path)
     """
-    temp_dir = tempfile.mkdtemp()
+    sql_path, schema_path, cached_path = job
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cached_path), suffix=".py.tmp")
+    os.close(fd)
+    try:
+        generate_class(sql_path, output_file_path=temp_path, schema_file_path=schema_path)
+        os.replace(temp_path, cached_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
 
-    # Create __init__.py to make it a package
-    init_file = os.path.join(temp_dir, "__init__.py")
-    with open(init_file, "w", encoding="utf-8") as f:
-        f.write("")
+def _populate_generated_classes(temp_dir: str) -> None:
+    """Generate all example classes into the given directory.
 
+    Args:
+        temp_dir: Directory to write the generated modules into
+    """
+    # No __init__.py needed: the directory is put on sys.path and its modules are imported directly
     # Generate each required module
     mapping = {
         "User": (
@@ -50,98 +178,98 @@ def _ensure_generated_classes() -> str:
         ),
     }
 
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    cached_paths: dict[str, str] = {}
+    misses: list[tuple[str, str, str]] = []
     for module_name, (sql_path, schema_path) in mapping.items():
+        cached_path = os.path.join(CACHE_DIR, f"{_cache_key(sql_path, schema_path)}.py")
+        cached_paths[module_name] = cached_path
+        if not os.path.exists(cached_path):
+            misses.append((sql_path, schema_path, cached_path))
+
+    # Cache misses are independent and CPU-bound, so generate them in parallel processes
+    if misses:
+        max_workers = min(len(misses), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_generate_cached_module, misses))
+
+    for module_name, cached_path in cached_paths.items():
         snake_case_name = to_snake_case(module_name)
-        py_path = os.path.join(temp_dir, f"{snake_case_name}.py")
-        generate_class(sql_path, output_file_path=py_path, schema_file_path=schema_path)
+        shutil.copy(cached_path, os.path.join(temp_dir, f"{snake_case_name}.py"))
 
-    return temp_dir
 
+# Each example runs as a standalone script, so this helper is duplicated on purpose;
+# keep it identical to the copies in api_simple_example.py and cli_usage_example.py.
+@contextlib.contextmanager
+def _on_sys_path(path: str) -> Iterator[None]:
+    """Temporarily prepend a directory to sys.path, restoring the original list on exit.
 
-def setup_database():
-    """Create a test database and tables. Resets DB file each run for repeatability."""
-    db_path = os.path.join(PROJECT_ROOT, "example.db")
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    Args:
+        path: Directory to make importable
+    """
+    saved_path = sys.path[:]
+    sys.path.insert(0, path)
+    importlib.invalidate_caches()
+    try:
+        yield
+    finally:
+        sys.path[:] = saved_path
 
-    engine = create_engine(f"sqlite:///{db_path}")
 
-    with engine.connect() as conn:
-        # Create tables
-        conn.execute(
-            text(
-                """
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                status TEXT DEFAULT 'active',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-            )
-        )
+@contextlib.contextmanager
+def _generated_classes_dir() -> Iterator[str]:
+    """Provide a temporary directory holding all generated example classes.
 
-        conn.execute(
-            text(
-                """
-            CREATE TABLE IF NOT EXISTS products (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                price DECIMAL(10,2) NOT NULL,
-                category_id INTEGER,
-                stock_quantity INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-            )
-        )
+    Yields:
+        Path to the temporary directory; it is removed when the context exits
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _populate_generated_classes(temp_dir)
+        yield temp_dir
 
-        conn.execute(
-            text(
-                """
-            CREATE TABLE IF NOT EXISTS orders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                total_amount DECIMAL(10,2) NOT NULL,
-                status TEXT DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        """
-            )
-        )
 
-        conn.execute(
-            text(
-                """
-            CREATE TABLE IF NOT EXISTS order_items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                order_id INTEGER NOT NULL,
-                product_id INTEGER NOT NULL,
-                quantity INTEGER NOT NULL,
-                price DECIMAL(10,2) NOT NULL,
-                FOREIGN KEY (order_id) REFERENCES orders (id),
-                FOREIGN KEY (product_id) REFERENCES products (id)
-            )
-        """
-            )
-        )
+def _tune_sqlite(engine: Engine) -> None:
+    """Apply SQLite PRAGMAs that avoid a full fsync on every commit.
+
+    WAL journaling only applies to file-backed databases; in-memory databases keep their memory journal.
+
+    Args:
+        engine: SQLite engine to tune
+    """
+    with engine.connect() as conn:
+        if engine.url.database not in (None, "", ":memory:"):
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+        conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+        conn.exec_driver_sql("PRAGMA temp_store=MEMORY")
+
+
+def setup_database():
+    """Create an in-memory test database and tables. Starts empty each run for repeatability."""
+    # StaticPool keeps a single DBAPI connection so every engine.connect() sees the same in-memory DB
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    _tune_sqlite(engine)
 
-        conn.commit()
+    # Run all DDL as one script on the raw DBAPI connection
+    raw_connection = engine.raw_connection()
+    try:
+        raw_connection.driver_connection.executescript(SCHEMA_DDL)
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
 
     return engine
 
 
 def setup_logging():
-    """Configure logging to see the class-level logger in action."""
+    """Configure logging; set SPLURGE_LOG_LEVEL=DEBUG to see the class-level logger in action."""
+    level = getattr(logging, os.environ.get("SPLURGE_LOG_LEVEL", "INFO").upper(), logging.INFO)
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
@@ -151,25 +279,26 @@ def demonstrate_user_operations(connection: Connection) -> None:
     print("\n=== User Operations ===")
     from user import User  # local import after generation
 
-    # Create users
-    with connection.begin():
-        result = User.create_user(
-            connection=connection,
-            username="john_doe",
-            email="john@example.com",
-            password_hash="hashed_password_123",
-            status="active",
+    # Create users in one executemany round-trip (generated methods insert one row per call)
+    with connection.begin_nested():
+        result = connection.execute(
+            _INSERT_USERS,
+            [
+                {
+                    "username": "john_doe",
+                    "email": "john@example.com",
+                    "password_hash": "hashed_password_123",
+                    "status": "active",
+                },
+                {
+                    "username": "jane_smith",
+                    "email": "jane@example.com",
+                    "password_hash": "hashed_password_456",
+                    "status": "active",
+                },
+            ],
         )
-        print(f"Created user with ID: {result.fetchone()[0]}")
-
-        result = User.create_user(
-            connection=connection,
-            username="jane_smith",
-            email="jane@example.com",
-            password_hash="hashed_password_456",
-            status="active",
-        )
-        print(f"Created user with ID: {result.fetchone()[0]}")
+        print(f"Created {result.rowcount} users")
 
     # Fetch users
     users = User.get_users_by_status(connection=connection, status="active")
@@ -191,27 +320,28 @@ def demonstrate_product_operations(connection: Connection) -> None:
         ProductRepository,
     )  # local import after generation
 
-    # Create products
-    with connection.begin():
-        result = ProductRepository.create_product(
-            connection=connection,
-            name="Laptop",
-            description="High-performance laptop",
-            price=999.99,
-            category_id=1,
-            stock_quantity=10,
-        )
-        print(f"Created product with ID: {result.fetchone()[0]}")
-
-        result = ProductRepository.create_product(
-            connection=connection,
-            name="Mouse",
-            description="Wireless mouse",
-            price=29.99,
-            category_id=1,
-            stock_quantity=50,
+    # Create products in one executemany round-trip (generated methods insert one row per call)
+    with connection.begin_nested():
+        result = connection.execute(
+            _INSERT_PRODUCTS,
+            [
+                {
+                    "name": "Laptop",
+                    "description": "High-performance laptop",
+                    "price": 999.99,
+                    "category_id": 1,
+                    "stock_quantity": 10,
+                },
+                {
+                    "name": "Mouse",
+                    "description": "Wireless mouse",
+                    "price": 29.99,
+                    "category_id": 1,
+                    "stock_quantity": 50,
+                },
+            ],
         )
-        print(f"Created product with ID: {result.fetchone()[0]}")
+        print(f"Created {result.rowcount} products")
 
     # Search products
     products = ProductRepository.search_products(connection=connection, search_term="%laptop%")
@@ -232,9 +362,9 @@ def demonstrate_order_operations(connection: Connection) -> None:
     from order_service import OrderService  # local import after generation
 
     # Create an order
-    with connection.begin():
+    with connection.begin_nested():
         result = OrderService.create_order(connection=connection, user_id=1, total_amount=1029.98, status="pending")
-        order_id = result.fetchone()[0]
+        order_id = result.scalar()
         print(f"Created order with ID: {order_id}")
 
     # Get order details
@@ -270,26 +400,18 @@ def main():
     setup_logging()
 
     # Generate classes to temporary directory
-    temp_dir = _ensure_generated_classes()
-
-    try:
-        # Add temp directory to path so we can import
-        sys.path.insert(0, temp_dir)
-
+    with _generated_classes_dir() as temp_dir, _on_sys_path(temp_dir):
         # Create database and tables
         engine = setup_database()
 
         # Demonstrate the simplified logger approach
         demonstrate_logger_behavior()
 
-        # Use separate connections to avoid nested/implicit transaction conflicts
-        with engine.connect() as connection:
+        # Share one connection and one outer transaction across all demonstrations;
+        # each one scopes its writes with a SAVEPOINT so everything commits together at the end
+        with engine.begin() as connection:
             demonstrate_user_operations(connection)
-
-        with engine.connect() as connection:
             demonstrate_product_operations(connection)
-
-        with engine.connect() as connection:
             demonstrate_order_operations(connection)
 
         print("\n" + "=" * 50)
@@ -300,12 +422,6 @@ def main():
         print("- Class-level logger follows Python best practices")
         print("- Reduced complexity in generated code")
 
-    finally:
-        # Remove from path and cleanup
-        if temp_dir in sys.path:
-            sys.path.remove(temp_dir)
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
 
 if __name__ == "__main__":
     main()
@@ -6,48 +6,122 @@ This example demonstrates how to use the splurge-sql-generator via the command l
 It shows various CLI options and how to integrate CLI usage into Python scripts.
 """
 
+import contextlib
+import functools
+import importlib
+import io
+import itertools
 import logging
 import os
 import subprocess
 import sys
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
-from sqlalchemy import create_engine, text
-
 # Add the project root to the path so we can import from 'output' and the package
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 
+# Example SQL files used by the demonstrations
+_EXAMPLES_DIR = Path(PROJECT_ROOT) / "examples"
+_USER_SQL = str(_EXAMPLES_DIR / "User.sql")
+_PRODUCT_SQL = str(_EXAMPLES_DIR / "ProductRepository.sql")
+_ORDER_SQL = str(_EXAMPLES_DIR / "OrderService.sql")
+
+# SQL used by the integration demonstration; wrapped in text() there once SQLAlchemy is imported
+_CREATE_USERS_TABLE_SQL = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        username TEXT UNIQUE NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        status TEXT DEFAULT 'active',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+# Each example runs as a standalone script, so this helper is duplicated on purpose;
+# keep it identical to the copies in api_simple_example.py and api_usage_example.py.
+@contextlib.contextmanager
+def _on_sys_path(path: str) -> Iterator[None]:
+    """Temporarily prepend a directory to sys.path, restoring the original list on exit.
+
+    Args:
+        path: Directory to make importable
+    """
+    saved_path = sys.path[:]
+    sys.path.insert(0, path)
+    importlib.invalidate_caches()
+    try:
+        yield
+    finally:
+        sys.path[:] = saved_path
+
 
 def setup_logging():
-    """Configure logging to see the class-level logger in action."""
+    """Configure logging; set SPLURGE_LOG_LEVEL=DEBUG to see the class-level logger in action."""
+    level = getattr(logging, os.environ.get("SPLURGE_LOG_LEVEL", "INFO").upper(), logging.INFO)
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
 
-def run_cli_command(args: list[str]) -> tuple[int, str, str]:
+# Set by the --subprocess flag to run every CLI command in a fresh interpreter
+USE_SUBPROCESS = False
+
+
+def _decode(output: str | bytes) -> str:
+    """Decode captured CLI output; subprocess output stays as bytes until it is actually printed."""
+    return output.decode() if isinstance(output, bytes) else output
+
+
+def run_cli_command(args: list[str]) -> tuple[int, str | bytes, str | bytes]:
     """
     Run the splurge-sql-generator CLI command.
 
+    Runs in-process by default; pass --subprocess to this script when full isolation is needed.
+
     Args:
         args: List of command line arguments
 
     Returns:
-        Tuple of (return_code, stdout, stderr)
+        Tuple of (return_code, stdout, stderr); stdout/stderr are undecoded bytes in subprocess mode
     """
-    cmd = [sys.executable, "-m", "splurge_sql_generator.cli"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode, result.stdout, result.stderr
+    if USE_SUBPROCESS:
+        cmd = [sys.executable, "-m", "splurge_sql_generator.cli"] + args
+        result = subprocess.run(cmd, capture_output=True)
+        return result.returncode, result.stdout, result.stderr
+
+    from splurge_sql_generator.cli import main as cli_main
+
+    out, err = io.StringIO(), io.StringIO()
+    return_code = 0
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            cli_main(args)
+    except SystemExit as e:
+        return_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return return_code, out.getvalue(), err.getvalue()
+
+
+@functools.cache
+def _help_text() -> str:
+    """Return the CLI help text, formatted once straight from the argument parser."""
+    from splurge_sql_generator.cli import build_parser
+
+    return build_parser().format_help()
 
 
 def demonstrate_cli_help():
     """Demonstrate CLI help functionality."""
     print("=== CLI Help Demonstration ===")
 
-    return_code, stdout, stderr = run_cli_command(["--help"])
+    # --help output is static for a given version, so skip running the CLI for it
+    return_code, stdout = 0, _help_text()
 
     print(f"Return code: {return_code}")
     print("Help output:")
@@ -60,17 +134,17 @@ def demonstrate_dry_run():
     print("=== CLI Dry-Run Demonstration ===")
 
     # Use the User.sql example
-    sql_file = os.path.join(PROJECT_ROOT, "examples", "User.sql")
+    sql_file = _USER_SQL
 
     return_code, stdout, stderr = run_cli_command([sql_file, "--dry-run"])
 
     print(f"Return code: {return_code}")
     if return_code == 0:
         print("Generated code (dry-run):")
-        print(stdout)
+        print(_decode(stdout))
     else:
         print("Error:")
-        print(stderr)
+        print(_decode(stderr))
     print()
 
 
@@ -80,14 +154,14 @@ def demonstrate_output_directory():
 
     # Create a temporary directory for output
     with tempfile.TemporaryDirectory() as temp_dir:
-        sql_file = os.path.join(PROJECT_ROOT, "examples", "User.sql")
+        sql_file = _USER_SQL
 
         return_code, stdout, stderr = run_cli_command([sql_file, "-o", temp_dir])
 
         print(f"Return code: {return_code}")
         if return_code == 0:
             print("Generated files:")
-            print(stdout)
+            print(_decode(stdout))
 
             # List generated files
             output_files = list(Path(temp_dir).glob("*.py"))
@@ -96,13 +170,13 @@ def demonstrate_output_directory():
                 print(f"  - {file_path.name}")
                 # Show first few lines of generated file
                 with open(file_path) as f:
-                    lines = f.readlines()[:10]
+                    lines = list(itertools.islice(f, 10))
                     print("    First 10 lines:")
                     for line in lines:
                         print(f"      {line.rstrip()}")
         else:
             print("Error:")
-            print(stderr)
+            print(_decode(stderr))
     print()
 
 
@@ -113,18 +187,14 @@ def demonstrate_multiple_files():
     # Create a temporary directory for output
     with tempfile.TemporaryDirectory() as temp_dir:
         # Use multiple SQL files
-        sql_files = [
-            os.path.join(PROJECT_ROOT, "examples", "User.sql"),
-            os.path.join(PROJECT_ROOT, "examples", "ProductRepository.sql"),
-            os.path.join(PROJECT_ROOT, "examples", "OrderService.sql"),
-        ]
+        sql_files = [_USER_SQL, _PRODUCT_SQL, _ORDER_SQL]
 
         return_code, stdout, stderr = run_cli_command(sql_files + ["-o", temp_dir])
 
         print(f"Return code: {return_code}")
         if return_code == 0:
             print("Generated files:")
-            print(stdout)
+            print(_decode(stdout))
 
             # List generated files
             output_files = list(Path(temp_dir).glob("*.py"))
@@ -133,7 +203,7 @@ def demonstrate_multiple_files():
                 print(f"  - {file_path.name}")
         else:
             print("Error:")
-            print(stderr)
+            print(_decode(stderr))
     print()
 
 
@@ -171,10 +241,10 @@ SELECT id, name, is_active, data FROM custom_table WHERE type = :type;
             print(f"Return code: {return_code}")
             if return_code == 0:
                 print("Generated files with custom SQL types:")
-                print(stdout)
+                print(_decode(stdout))
             else:
                 print("Error:")
-                print(stderr)
+                print(_decode(stderr))
 
     finally:
         # Clean up temporary files
@@ -198,14 +268,14 @@ def demonstrate_strict_mode():
 
         print(f"Return code: {return_code}")
         print("Strict mode error (expected):")
-        print(stderr)
+        print(_decode(stderr))
 
         # Now try without strict mode
         return_code, stdout, stderr = run_cli_command([non_sql_file])
 
         print(f"\nWithout strict mode - Return code: {return_code}")
         print("Warning (non-strict mode):")
-        print(stderr)
+        print(_decode(stderr))
 
     finally:
         os.unlink(non_sql_file)
@@ -222,7 +292,7 @@ def demonstrate_error_handling():
 
     print(f"Return code: {return_code}")
     print("Error handling:")
-    print(stderr)
+    print(_decode(stderr))
     print()
 
 
@@ -230,9 +300,12 @@ def demonstrate_integration_with_generated_code():
     """Demonstrate using CLI-generated code in a Python script."""
     print("=== CLI Integration with Generated Code ===")
 
+    # SQLAlchemy is only needed here, so defer its import until this demonstration runs
+    from sqlalchemy import create_engine, text
+
     # Create a temporary directory for output
     with tempfile.TemporaryDirectory() as temp_dir:
-        sql_file = os.path.join(PROJECT_ROOT, "examples", "User.sql")
+        sql_file = _USER_SQL
 
         # Generate the code using CLI
         return_code, stdout, stderr = run_cli_command([sql_file, "-o", temp_dir])
@@ -240,48 +313,29 @@ def demonstrate_integration_with_generated_code():
         if return_code == 0:
             print("Successfully generated code using CLI")
 
-            # Add the output directory to Python path
-            sys.path.insert(0, temp_dir)
-
-            # Import and use the generated class
+            # Import and use the generated class with the output directory on the Python path
             try:
-                from user import User
+                with _on_sys_path(temp_dir):
+                    from user import User
 
                 print("Successfully imported generated User class")
 
                 # Create a test database
                 engine = create_engine("sqlite:///:memory:")
 
-                with engine.connect() as conn:
+                with engine.begin() as conn:
                     # Create users table
-                    conn.execute(
-                        text("""
-                        CREATE TABLE users (
-                            id INTEGER PRIMARY KEY,
-                            username TEXT UNIQUE NOT NULL,
-                            email TEXT UNIQUE NOT NULL,
-                            password_hash TEXT NOT NULL,
-                            status TEXT DEFAULT 'active',
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
+                    conn.execute(text(_CREATE_USERS_TABLE_SQL))
+
+                    # Use the generated class: create_user inserts and returns the new ID in one round-trip
+                    result = User.create_user(
+                        connection=conn,
+                        username="john_doe",
+                        email="john@example.com",
+                        password_hash="hashed_password_123",
+                        status="active",
                     )
-
-                    # Insert test data
-                    conn.execute(
-                        text("""
-                        INSERT INTO users (id, username, email, password_hash, status) VALUES 
-                        (1, 'john_doe', 'john@example.com', 'hashed_password_123', 'active')
-                    """)
-                    )
-                    conn.commit()
-
-                    # Use the generated class
-                    users = User.get_user_by_id(connection=conn, user_id=1)
-                    if users:
-                        user = users[0]
-                        print(f"Retrieved user via CLI-generated code: {user.username}")
+                    print(f"Created user via CLI-generated code with ID: {result.scalar()}")
 
                 print("CLI integration test completed successfully!")
 
@@ -293,11 +347,14 @@ def demonstrate_integration_with_generated_code():
                 print(f"Unexpected error using generated class: {e}")
         else:
             print("Failed to generate code using CLI")
-            print(stderr)
+            print(_decode(stderr))
 
 
 def main():
     """Main example function."""
+    global USE_SUBPROCESS
+    USE_SUBPROCESS = "--subprocess" in sys.argv[1:]
+
     print("splurge-sql-generator CLI Usage Example")
     print("=" * 60)
     print()
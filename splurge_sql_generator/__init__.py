@@ -117,6 +117,7 @@ def generate_multiple_classes(
     *,
     output_dir: str | None = None,
     schema_file_path: str,
+    jobs: int = 1,
 ) -> dict[str, str]:
     """
     Convenience function to generate multiple Python classes from SQL files.
@@ -125,12 +126,15 @@ def generate_multiple_classes(
         sql_files: List of SQL file paths
         output_dir: Optional directory to save generated files
         schema_file_path: Path to a shared schema file (required)
+        jobs: Number of worker processes (default: 1; 0 or less uses one per CPU)
 
     Returns:
         Dictionary mapping class names to generated code
     """
     generator = PythonCodeGenerator()
-    return generator.generate_multiple_classes(sql_files, output_dir=output_dir, schema_file_path=schema_file_path)
+    return generator.generate_multiple_classes(
+        sql_files, output_dir=output_dir, schema_file_path=schema_file_path, jobs=jobs
+    )
 
 
 def generate_types_file(*, output_path: str | None = None) -> str:
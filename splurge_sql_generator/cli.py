@@ -7,22 +7,54 @@ This module is licensed under the MIT License.
 """
 
 import argparse
+import os
+import stat
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from . import __version__
 from .code_generator import PythonCodeGenerator
 from .exceptions import SplurgeSqlGeneratorFileNotFoundError, SplurgeSqlGeneratorOSError
-from .utils import find_files_by_extension, to_snake_case
+from .utils import to_snake_case
 
 DOMAINS = ["cli"]
 
 
+def _first_schema_in(directory: str) -> str | None:
+    """
+    Return the first *.schema file in a directory by sorted path.
+
+    Not memoized across calls: main() runs in-process, so a schema file created between
+    runs (or a relative directory after a chdir) must be seen by the next lookup.
+
+    Uses a single ``os.scandir`` pass and keeps only the running minimum rather than
+    globbing and sorting a list. Like pathlib's ``glob("*.schema")``, names starting
+    with "." are included.
+
+    Args:
+        directory: Directory to search
+
+    Returns:
+        Path of the first schema file, or None if there is none or the directory cannot be read
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return min(
+                (entry.path for entry in entries if entry.name.endswith(".schema") and entry.is_file()),
+                default=None,
+            )
+    except OSError:
+        return None
+
+
 def _find_schema_files(sql_files: list[str]) -> str | None:
     """
     Find schema files when no --schema option is specified.
 
     Looks for *.schema files in the current directory and directories containing SQL files.
+    The current directory is searched first, then SQL file directories in sorted order,
+    so the result is deterministic.
 
     Args:
         sql_files: List of SQL file paths
@@ -30,21 +62,50 @@ def _find_schema_files(sql_files: list[str]) -> str | None:
     Returns:
         Path to the first found schema file, or None if no schema files found
     """
-    # Get unique directories from SQL files
-    sql_dirs = {Path(sql_file).parent for sql_file in sql_files}
-    # Add current directory
-    search_dirs = {Path.cwd()} | sql_dirs
+    # Get unique directories from SQL files, searched after the current directory
+    cwd = Path.cwd()
+    sql_dirs = sorted({Path(sql_file).parent for sql_file in sql_files} - {cwd})
 
     # Look for *.schema files in each directory
-    for search_dir in search_dirs:
-        schema_files = find_files_by_extension(search_dir, ".schema")
-        if schema_files:
+    for search_dir in (cwd, *sql_dirs):
+        schema_file = _first_schema_in(str(search_dir))
+        if schema_file is not None:
             # Return the first schema file found
-            return str(schema_files[0])
+            return schema_file
 
     return None
 
 
+def _iter_sql_files(root: Path) -> Iterator[str]:
+    """
+    Recursively yield ``.sql`` file paths under a directory.
+
+    Uses an explicit stack over ``os.scandir`` so directory entries reuse the type
+    information returned by the directory listing instead of an extra stat per path.
+    Symlinked directories are not descended into. Directories that cannot be read are
+    skipped, as ``Path.rglob`` does.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Normalized paths of ``.sql`` files as strings (matching ``str(Path)`` formatting)
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".sql") and entry.is_file():
+                        yield os.path.normpath(entry.path)
+        except OSError:
+            # Unreadable directory (e.g. PermissionError): skip it and keep walking
+            continue
+
+
 def _expand_and_validate_inputs(
     input_paths: list[str],
     *,
@@ -67,12 +128,15 @@ def _expand_and_validate_inputs(
 
     for file_path in input_paths:
         path = Path(file_path)
-        if not path.exists():
+        # One stat per argument instead of separate exists/is_dir/is_file checks
+        try:
+            mode = path.stat().st_mode
+        except OSError:
             print(f"Error: SQL file not found: {file_path}", file=sys.stderr)
             sys.exit(1)
 
-        if path.is_dir():
-            discovered = [str(p) for p in path.rglob("*.sql")]
+        if stat.S_ISDIR(mode):
+            discovered = list(_iter_sql_files(path))
             if not discovered:
                 msg = f"Warning: No .sql files found in directory {file_path}"
                 if strict:
@@ -83,7 +147,7 @@ def _expand_and_validate_inputs(
             sql_files.extend(discovered)
             continue
 
-        if path.is_file():
+        if stat.S_ISREG(mode):
             if path.suffix.lower() != ".sql":
                 msg = f"Warning: File {file_path} doesn't have .sql extension"
                 if strict:
@@ -167,21 +231,16 @@ def _report_generated_classes(
                 print(f"    - {class_name}: {snake_case_name}.py")
 
 
-def main() -> None:
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main CLI entry point for the SQL code generator.
-
-    Parses command line arguments and generates Python SQLAlchemy classes from SQL template files.
-    Supports single file generation, multiple file processing, and custom output directories.
+    Build the argument parser for the SQL code generator CLI.
 
-    Command line options:
-        sql_files: One or more SQL template files to process
-        -o, --output: Output directory for generated Python files
-        --dry-run: Print generated code to stdout without saving files
-        --strict: Treat warnings as errors
-        -t, --types: Path to custom SQL type mapping YAML file
+    Returns:
+        Configured ArgumentParser instance
     """
     parser = argparse.ArgumentParser(
+        # Explicit prog so usage lines do not depend on sys.argv[0] of the importing process
+        prog="splurge-sql-generator",
         description="Generate Python SQLAlchemy classes from SQL template files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -241,6 +300,21 @@ Examples:
         help="Path to schema file to use for all SQL files (default: look for *.schema files in current directory and SQL file directories)",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes for generating multiple classes (default: 1; 0 uses all CPUs)",
+    )
+
+    parser.add_argument(
+        "--fast-codegen",
+        action="store_true",
+        help="Render classes with plain string assembly instead of the Jinja template (same output, faster startup)",
+    )
+
     parser.add_argument(
         "--generate-types",
         nargs="?",
@@ -249,7 +323,34 @@ Examples:
         help="Generate default SQL type mapping file. If no file specified, creates 'types.yaml' in current directory",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import; build_parser() still returns a fresh instance for callers that need one
+_PARSER = build_parser()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Main CLI entry point for the SQL code generator.
+
+    Parses command line arguments and generates Python SQLAlchemy classes from SQL template files.
+    Supports single file generation, multiple file processing, and custom output directories.
+
+    Args:
+        argv: Optional argument list to parse instead of sys.argv[1:] (allows in-process invocation)
+
+    Command line options:
+        sql_files: One or more SQL template files to process
+        -o, --output: Output directory for generated Python files
+        --dry-run: Print generated code to stdout without saving files
+        --strict: Treat warnings as errors
+        -t, --types: Path to custom SQL type mapping YAML file
+        -j, --jobs: Number of worker processes for multi-file generation
+        --fast-codegen: Render without the Jinja template
+    """
+    parser = _PARSER
+    args = parser.parse_args(argv)
 
     # Handle --generate-types option
     if args.generate_types is not None:
@@ -286,7 +387,7 @@ Examples:
         return
 
     # Generate classes
-    generator = PythonCodeGenerator(sql_type_mapping_file=args.types)
+    generator = PythonCodeGenerator(sql_type_mapping_file=args.types, fast_codegen=args.fast_codegen)
 
     try:
         if len(sql_files) == 1 and args.dry_run:
@@ -301,6 +402,7 @@ Examples:
                 sql_files,
                 output_dir=args.output if not args.dry_run else None,
                 schema_file_path=schema_file if schema_file is not None else "",
+                jobs=args.jobs,
             )
 
             # Report generated classes
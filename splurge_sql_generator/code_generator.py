@@ -6,11 +6,14 @@ Copyright (c) 2025, Jim Schilling
 This module is licensed under the MIT License.
 """
 
-from dataclasses import dataclass
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from .exceptions import (
     SplurgeSqlGeneratorFileError,
@@ -20,21 +23,172 @@ from .exceptions import (
 )
 from .file_utils import SafeTextFileIoAdapter
 from .schema_parser import SchemaParser
+from .sql_helper import extract_table_names
 from .sql_parser import SqlParser
+from .type_definitions import MethodInfo
 from .type_inference import ParameterTypeInferrer
 from .utils import to_snake_case
 
 DOMAINS = ["code", "generator"]
 
+# Guards one-time construction of the shared Jinja environment and class template
+_TEMPLATE_LOCK = threading.Lock()
+
+# Batch template and the separator it emits between classes. The NUL bytes keep the
+# separator from colliding with generated code.
+_BATCH_TEMPLATE_NAME = "python_classes_batch.j2"
+_CLASS_SEPARATOR = "\x00splurge-sql-generator-class\x00"
+
+# File name pattern for compiled template bytecode in Jinja's per-user temp cache directory
+_BYTECODE_CACHE_PATTERN = "splurge_sql_generator_%s.cache"
+
+
+def _create_bytecode_cache() -> BytecodeCache | None:
+    """
+    Create the on-disk Jinja bytecode cache shared across generator processes.
+
+    Returns:
+        FileSystemBytecodeCache in Jinja's per-user temp directory, or None if it cannot be used
+    """
+    try:
+        return FileSystemBytecodeCache(pattern=_BYTECODE_CACHE_PATTERN)
+    except (OSError, RuntimeError):
+        # Unwritable or unsafe temp directory: fall back to compiling templates in memory
+        return None
+
+
+# Static parts of python_class.j2 for the pure-Python renderer. They must stay
+# byte-for-byte in sync with the template (see _render_python_class_fast).
+_FAST_CLASS_HEADER = '''"""
+Auto-generated {class_name} class with SQLAlchemy methods.
+
+This class is generated by splurge-sql-generator.
+Do not edit this file manually - it will be overwritten.
+"""
+
+import logging
+from typing import Optional, List, Dict, Any
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Result
+from sqlalchemy.engine.row import Row
+
+
+class {class_name}:
+    """
+    {class_name} with SQLAlchemy-based database operations.
+    
+    This class provides only class methods (for explicit connection and transaction control).
+    
+    Attributes:
+        logger: Class-level logger used by default for all operations.
+    """
+
+    logger = logging.getLogger(f"{{__name__}}.{class_name}")
+    # Attach a NullHandler to avoid 'No handler' warnings in CLI/standalone usage
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+
+'''
+_FAST_SQL_INDENT = "\n" + " " * 8
+_FAST_FETCH_BODY = """            # Fetch results
+            rows = result.fetchall()
+            if debug_enabled:
+                logger.debug("Fetched %d rows", len(rows))
+            return rows
+"""
+_FAST_EXECUTE_BODY = """            # Execute non-select operation
+            if debug_enabled:
+                logger.debug("Executed non-select operation")
+            return result
+"""
+
+
+def _render_python_class_fast(class_name: str, methods: list[dict[str, Any]]) -> str:
+    """
+    Render a class with plain string assembly instead of the Jinja template.
+
+    Produces the same output as python_class.j2 for the method data built by
+    ``_prepare_method_data``, without creating a Jinja environment.
+
+    Args:
+        class_name: Name of the class to generate
+        methods: Method data dictionaries, as passed to the template
+
+    Returns:
+        Generated Python code
+    """
+    parts = [_FAST_CLASS_HEADER.format(class_name=class_name)]
+    append = parts.append
+    for method in methods:
+        name = method["name"]
+        params = method["parameters_list"]
+        param_types = method["param_types"]
+
+        append(f"    @classmethod\n    def {name}(\n        cls,\n        *,\n        connection: Connection,\n")
+        for param in params:
+            append(f"        {param}: {param_types.get(param, '')},\n")
+        append(
+            f"    ) -> {method['return_type']}:\n"
+            f'        """\n'
+            f"        {method['type'].title()} operation: {name} (class method).\n"
+            f"        Statement type: {method['statement_type']}\n"
+            "        Args:\n"
+            "            connection: SQLAlchemy database connection\n"
+        )
+        for param in params:
+            append(f"            {param}: Parameter for {param}\n")
+        append("\n        Returns:\n")
+        append("            List of result rows\n" if method["is_fetch"] else "            SQLAlchemy Result object\n")
+        # Same line handling as Jinja's indent(8, blank=True) filter
+        sql = _FAST_SQL_INDENT.join((method["sql"] + "\n").splitlines())
+        append(
+            '        """\n'
+            "        logger = cls.logger\n"
+            "        # Check the level once per call instead of on every debug statement\n"
+            "        debug_enabled = logger.isEnabledFor(logging.DEBUG)\n"
+            "\n"
+            "        if debug_enabled:\n"
+            f'            logger.debug("Executing {name} operation")\n'
+            "        \n"
+            '        sql = """\n'
+            f"        {sql}\n"
+            '        """\n'
+            "\n"
+        )
+        if params:
+            append("        # Prepare parameters\n        params = {\n")
+            for sql_param, python_param in method["param_mapping"].items():
+                append(f'            "{sql_param}": {python_param},\n')
+            append('        }\n        if debug_enabled:\n            logger.debug("Parameters: %s", params)\n\n')
+        append("        # Execute SQL query\n        try:\n")
+        append(
+            "            result = connection.execute(text(sql), params)\n\n"
+            if params
+            else "            result = connection.execute(text(sql))\n\n"
+        )
+        append(_FAST_FETCH_BODY if method["is_fetch"] else _FAST_EXECUTE_BODY)
+        append(
+            "        except Exception as e:\n"
+            f'            logger.error("Error in {name} operation: %s", str(e))\n'
+            "            raise\n\n"
+        )
+    # The template ends with a single space after its closing loop tag
+    append(" ")
+    return "".join(parts)
+
 
 class PythonCodeGenerator:
     """Generator for Python classes with SQLAlchemy methods using Jinja2 templates."""
 
+    # Compiled class template shared by all instances (see _get_template)
+    _shared_template: Template | None = None
+
     def __init__(
         self,
         *,
         sql_type_mapping_file: str | None = None,
         validate_parameters: bool = False,
+        fast_codegen: bool = False,
     ) -> None:
         """
         Initialize the Python code generator.
@@ -43,20 +197,56 @@ class PythonCodeGenerator:
             sql_type_mapping_file: Optional path to custom SQL type mapping YAML file.
                 If None, uses default "types.yaml"
             validate_parameters: Whether to validate SQL parameters against schema (default: False)
+            fast_codegen: Render classes with plain string assembly instead of the Jinja
+                template, skipping Jinja setup entirely (default: False)
         """
+        self._sql_type_mapping_file = sql_type_mapping_file
         self._parser = SqlParser()
         self._schema_parser = SchemaParser(sql_type_mapping_file=sql_type_mapping_file or "types.yaml")
         self._type_inferrer = ParameterTypeInferrer(self._schema_parser)
         self._validate_parameters = validate_parameters
-        # Set up Jinja2 environment with templates directory
-        template_dir = Path(__file__).parent / "templates"
-        self._jinja_env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        # Preload template once for reuse
-        self._template = self._jinja_env.get_template("python_class.j2")
+        self._fast_codegen = fast_codegen
+        # Shared, lazily compiled template; the fast path never needs it
+        self._template: Template | None = None if fast_codegen else self._get_template()
+
+    @classmethod
+    def _get_template(cls) -> Template:
+        """
+        Return the class template, building the Jinja environment on first use.
+
+        The environment and compiled template are shared by all generator instances.
+
+        Returns:
+            Compiled python_class.j2 template
+        """
+        template = cls._shared_template
+        if template is None:
+            with _TEMPLATE_LOCK:
+                template = cls._shared_template
+                if template is None:
+                    # Set up Jinja2 environment with templates directory. Templates ship with the
+                    # package, so skip per-render staleness checks and reuse compiled bytecode
+                    # across CLI runs
+                    template_dir = Path(__file__).parent / "templates"
+                    jinja_env = Environment(
+                        loader=FileSystemLoader(str(template_dir)),
+                        trim_blocks=True,
+                        lstrip_blocks=True,
+                        auto_reload=False,
+                        bytecode_cache=_create_bytecode_cache(),
+                    )
+                    template = jinja_env.get_template("python_class.j2")
+                    cls._shared_template = template
+        return template
+
+    def _get_batch_template(self) -> Template:
+        """
+        Return the multi-class batch template from the shared environment.
+
+        Returns:
+            Compiled python_classes_batch.j2 template (cached by the environment)
+        """
+        return self.jinja_env.get_template(_BATCH_TEMPLATE_NAME)
 
     @property
     def parser(self) -> SqlParser:
@@ -66,7 +256,7 @@ class PythonCodeGenerator:
     @property
     def jinja_env(self) -> Environment:
         """Public read-only access to the Jinja environment."""
-        return self._jinja_env
+        return self._get_template().environment
 
     def generate_class(
         self,
@@ -112,7 +302,7 @@ class PythonCodeGenerator:
         if output_file_path:
             try:
                 file_io = SafeTextFileIoAdapter()
-                file_io.write_text(output_file_path, python_code)
+                file_io.write_bytes(output_file_path, python_code.encode("utf-8"))
             except SplurgeSqlGeneratorFileError:
                 # Re-raise SplurgeSqlGeneratorFileError as-is (already has proper formatting)
                 raise
@@ -135,50 +325,41 @@ class PythonCodeGenerator:
         Returns:
             Generated Python code
         """
-        # Prepare methods data for template
-        methods: list[dict[str, Any]] = []
-        for method_name, sql_query in method_queries.items():
-            method_info = self.parser.get_method_info(sql_query)
-            method_data = self._prepare_method_data(method_name, sql_query, method_info, file_path)
-            methods.append(method_data)
+        methods = self._prepare_methods(method_queries, file_path)
+
+        if self._template is None:
+            return _render_python_class_fast(class_name, methods)
 
         # Render template (preloaded)
         return str(self._template.render(class_name=class_name, methods=methods))
 
-    @dataclass
-    class _MethodData:
-        """
-        Internal dataclass for organizing method data for template rendering.
-
-        Attributes:
-            name: Method name
-            parameters: Formatted parameter string for method signature
-            parameters_list: List of parameter names
-            param_mapping: Dictionary mapping SQL parameters to Python parameters
-            param_types: Dictionary mapping parameter names to Python types
-            return_type: Python return type annotation
-            type: SQL query type (select, insert, update, delete, etc.)
-            statement_type: Statement type (fetch or execute)
-            is_fetch: Whether the statement returns rows
-            sql_lines: SQL query split into lines for template rendering
+    def _prepare_methods(
+        self,
+        method_queries: dict[str, str],
+        file_path: str | None = None,
+    ) -> list[dict[str, Any]]:
         """
+        Prepare template data for every method of a class.
 
-        name: str
-        parameters: str
-        parameters_list: list[str]
-        param_mapping: dict[str, str]
-        param_types: dict[str, str]
-        return_type: str
-        type: str
-        statement_type: str
-        is_fetch: bool
-        sql_lines: list[str]
+        Args:
+            method_queries: Dictionary mapping method names to SQL queries
+            file_path: Optional file path for error context
+
+        Returns:
+            List of method data dictionaries for the template
+        """
+        methods: list[dict[str, Any]] = []
+        for method_name, sql_query in method_queries.items():
+            method_info = self.parser.get_method_info(sql_query)
+            method_data = self._prepare_method_data(method_name, sql_query, method_info, file_path)
+            methods.append(method_data)
+        return methods
 
     def _prepare_method_data(
         self,
         method_name: str,
         sql_query: str,
-        method_info: dict[str, Any],
+        method_info: MethodInfo,
         file_path: str | None = None,
     ) -> dict[str, Any]:  # Returns MethodInfo plus template-specific fields (parameters_list, param_mapping, etc.)
         """
@@ -193,56 +374,52 @@ class PythonCodeGenerator:
         Returns:
             Dictionary with method data for template
         """
+        # Parse the query's table names once for both validation and type inference. Inference
+        # only needs them when a schema is loaded.
+        needs_table_names = method_info["parameters"] and (
+            self._validate_parameters or self._schema_parser.table_schemas
+        )
+        table_names = self._extract_table_names(sql_query) if needs_table_names else []
+
         # Validate parameters against schema if enabled
         if self._validate_parameters:
-            self._validate_parameters_against_schema(sql_query, method_info["parameters"], file_path)
+            self._validate_parameters_against_schema(
+                sql_query, method_info["parameters"], file_path, table_names=table_names
+            )
 
         # Generate method signature
         parameters = self._generate_method_signature(method_info["parameters"])
 
-        # Prepare SQL lines for template
-        sql_lines = sql_query.split("\n")
-
         # Prepare parameter mapping and types
         param_mapping: dict[str, str] = {}
         param_types: dict[str, str] = {}
         parameters_list: list[str] = []
+        seen_params: set[str] = set()
         if method_info["parameters"]:
+            # Infer parameter types from schema; the query's table names are extracted once
+            param_types = self._type_inferrer.infer_all(sql_query, method_info["parameters"], table_names=table_names)
             for param in method_info["parameters"]:
                 python_param = param  # Preserve original parameter name
                 param_mapping[param] = python_param
 
-                # Infer parameter type from schema
-                param_types[param] = self._type_inferrer.infer(sql_query, param)
-
-                if python_param not in parameters_list:
+                if python_param not in seen_params:
                     parameters_list.append(python_param)
+                    seen_params.add(python_param)
 
-        data = self._MethodData(
-            name=method_name,
-            parameters=parameters,
-            parameters_list=parameters_list,
-            param_mapping=param_mapping,
-            param_types=param_types,
-            return_type="List[Row]" if method_info["is_fetch"] else "Result",
-            type=method_info["type"],
-            statement_type=method_info["statement_type"],
-            is_fetch=method_info["is_fetch"],
-            sql_lines=sql_lines,
-        )
-
-        # Jinja template expects a dict-like object; dataclass is easily serializable
+        is_fetch = method_info["is_fetch"]
+        # Jinja consumes the dict directly
         return {
-            "name": data.name,
-            "parameters": data.parameters,
-            "parameters_list": data.parameters_list,
-            "param_mapping": data.param_mapping,
-            "param_types": data.param_types,
-            "return_type": data.return_type,
-            "type": data.type,
-            "statement_type": data.statement_type,
-            "is_fetch": data.is_fetch,
-            "sql_lines": data.sql_lines,
+            "name": method_name,
+            "parameters": parameters,
+            "parameters_list": parameters_list,
+            "param_mapping": param_mapping,
+            "param_types": param_types,
+            "return_type": "List[Row]" if is_fetch else "Result",
+            "type": method_info["type"],
+            "statement_type": method_info["statement_type"],
+            "is_fetch": is_fetch,
+            # The template indents the raw query with Jinja's indent filter
+            "sql": sql_query,
         }
 
     def _generate_method_signature(self, parameters: list[str]) -> str:
@@ -275,6 +452,8 @@ class PythonCodeGenerator:
         sql_query: str,
         parameters: list[str],
         file_path: str | None = None,
+        *,
+        table_names: list[str] | None = None,
     ) -> None:
         """
         Validate that all SQL parameters exist in the loaded schema.
@@ -283,6 +462,7 @@ class PythonCodeGenerator:
             sql_query: SQL query string
             parameters: List of parameter names to validate
             file_path: Optional file path for error context
+            table_names: Table names already extracted from the query (extracted here if None)
 
         Raises:
             SplurgeSqlGeneratorSqlValidationError: If parameters don't match schema definitions
@@ -290,13 +470,8 @@ class PythonCodeGenerator:
         if not parameters:
             return
 
-        # Extract table names from the SQL query
-        from .sql_helper import extract_table_names
-
-        try:
-            table_names = extract_table_names(sql_query)
-        except Exception:
-            table_names = []
+        if table_names is None:
+            table_names = self._extract_table_names(sql_query)
 
         if not table_names:
             # No tables found in query, can't validate parameters
@@ -327,6 +502,22 @@ class PythonCodeGenerator:
                 f"Available columns: {self._get_available_columns(table_names)}"
             )
 
+    @staticmethod
+    def _extract_table_names(sql_query: str) -> list[str]:
+        """
+        Extract table names from a SQL query with sqlparse.
+
+        Args:
+            sql_query: SQL query string
+
+        Returns:
+            List of table names (in lowercase), or an empty list if none can be extracted
+        """
+        try:
+            return extract_table_names(sql_query)
+        except Exception:
+            return []
+
     def _get_available_columns(self, table_names: list[str]) -> str:
         """
         Get a formatted string of available columns for the given tables.
@@ -351,6 +542,7 @@ class PythonCodeGenerator:
         *,
         output_dir: str | None = None,
         schema_file_path: str,
+        jobs: int = 1,
     ) -> dict[str, str]:
         """
         Generate multiple Python classes from SQL files.
@@ -359,6 +551,11 @@ class PythonCodeGenerator:
             sql_files: List of SQL file paths
             output_dir: Optional directory to save generated files
             schema_file_path: Path to a shared schema file (required)
+            jobs: Number of worker processes used to generate classes (default: 1).
+                Values of 0 or less use one worker per CPU. Files are always written
+                by the calling process, in input order. When a file fails to generate
+                sequentially, the files before it are still written before the error
+                is raised.
 
         Returns:
             Dictionary mapping class names to generated code
@@ -380,21 +577,131 @@ class PythonCodeGenerator:
 
         generated_classes: dict[str, str] = {}
 
-        for sql_file in sql_files:
-            # Parse once per file and render directly to avoid duplicate parsing
-            class_name, method_queries = self.parser.parse_file(sql_file)
-            python_code = self._generate_python_code(class_name, method_queries)
+        # Ensure output directory exists once, before the per-file loop
+        out_path: Path | None = None
+        file_io: SafeTextFileIoAdapter | None = None
+        if output_dir:
+            out_path = Path(output_dir)
+            out_path.mkdir(parents=True, exist_ok=True)
+            file_io = SafeTextFileIoAdapter()
+
+        results: Iterable[tuple[str, str]]
+        max_workers = min(jobs if jobs > 0 else (os.cpu_count() or 1), len(sql_files))
+        if max_workers > 1:
+            # Files are independent, so parse/infer/render them in parallel worker processes
+            worker_jobs = [
+                (
+                    sql_file,
+                    schema_file_path,
+                    self._sql_type_mapping_file,
+                    self._validate_parameters,
+                    self._fast_codegen,
+                )
+                for sql_file in sql_files
+            ]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(_generate_one, worker_jobs, chunksize=_map_chunksize(len(worker_jobs), max_workers))
+                )
+        else:
+            try:
+                results = self._generate_batch(sql_files)
+            except Exception:
+                # The batch renders nothing if any file fails; regenerate lazily file by file so
+                # the files before the failing one are written before its error propagates
+                results = map(self._generate_from_file, sql_files)
+
+        for class_name, python_code in results:
             generated_classes[class_name] = python_code
 
             # Save to file if output directory provided
-            if output_dir:
-                # Ensure output directory exists
-                Path(output_dir).mkdir(parents=True, exist_ok=True)
+            if out_path is not None and file_io is not None:
                 # Convert class name to snake_case for filename
                 snake_case_name = to_snake_case(class_name)
-                output_path = Path(output_dir) / f"{snake_case_name}.py"
-                # Use SafeTextFileIoAdapter to write the file
-                file_io = SafeTextFileIoAdapter()
-                file_io.write_text(output_path, python_code)
+                # Use SafeTextFileIoAdapter to write the file, encoded once as a single write
+                file_io.write_bytes(out_path / f"{snake_case_name}.py", python_code.encode("utf-8"))
 
         return generated_classes
+
+    def _generate_batch(self, sql_files: list[str]) -> list[tuple[str, str]]:
+        """
+        Parse SQL files and render all of their classes in a single template pass.
+
+        Nothing is returned unless every file generates; callers that need the
+        outputs preceding a failing file must regenerate them individually.
+
+        Args:
+            sql_files: List of SQL file paths
+
+        Returns:
+            List of (class_name, generated_code) tuples in input order
+        """
+        classes: list[dict[str, Any]] = []
+        for sql_file in sql_files:
+            class_name, method_queries = self.parser.parse_file(sql_file)
+            classes.append({"class_name": class_name, "methods": self._prepare_methods(method_queries)})
+
+        if not classes:
+            return []
+
+        if self._template is None:
+            return [
+                (item["class_name"], _render_python_class_fast(item["class_name"], item["methods"])) for item in classes
+            ]
+
+        # One render amortizes Jinja's per-render setup; split back into per-class code
+        rendered = self._get_batch_template().render(classes=classes, sentinel=_CLASS_SEPARATOR)
+        codes = rendered.split(_CLASS_SEPARATOR)
+        return [(item["class_name"], code) for item, code in zip(classes, codes, strict=True)]
+
+    def _generate_from_file(self, sql_file: str) -> tuple[str, str]:
+        """
+        Parse a SQL file and render its class using the already loaded schema.
+
+        Args:
+            sql_file: Path to the SQL template file
+
+        Returns:
+            Tuple of (class_name, generated_code)
+        """
+        # Parse once per file and render directly to avoid duplicate parsing
+        class_name, method_queries = self.parser.parse_file(sql_file)
+        return class_name, self._generate_python_code(class_name, method_queries)
+
+
+def _map_chunksize(job_count: int, max_workers: int) -> int:
+    """
+    Choose how many files each worker receives per round trip in parallel runs.
+
+    Uses multiprocessing.Pool's default of about four chunks per worker, so large batches
+    pay fewer pickling/IPC round trips while small ones still spread across all workers.
+
+    Args:
+        job_count: Number of files to generate
+        max_workers: Number of worker processes
+
+    Returns:
+        Chunk size for ProcessPoolExecutor.map (at least 1)
+    """
+    chunksize, extra = divmod(job_count, max_workers * 4)
+    return chunksize + 1 if extra else max(chunksize, 1)
+
+
+def _generate_one(job: tuple[str, str, str | None, bool, bool]) -> tuple[str, str]:
+    """
+    Generate one class in a worker process for parallel generate_multiple_classes runs.
+
+    Args:
+        job: Tuple of (sql_file, schema_file_path, sql_type_mapping_file, validate_parameters, fast_codegen)
+
+    Returns:
+        Tuple of (class_name, generated_code)
+    """
+    sql_file, schema_file_path, sql_type_mapping_file, validate_parameters, fast_codegen = job
+    generator = PythonCodeGenerator(
+        sql_type_mapping_file=sql_type_mapping_file,
+        validate_parameters=validate_parameters,
+        fast_codegen=fast_codegen,
+    )
+    generator._schema_parser.load_schema(schema_file_path)
+    return generator._generate_from_file(sql_file)
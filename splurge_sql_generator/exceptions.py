@@ -14,23 +14,6 @@ from ._vendor.splurge_exceptions.core.exceptions import SplurgeFrameworkError
 DOMAINS = ["exceptions"]
 
 
-def splurge_class_deprecated(reason=None, version=None):  # type: ignore
-    """Decorator to mark a class as deprecated."""
-
-    def decorator(cls):  # type: ignore
-        # Issue a deprecation warning when the class is defined
-        message = f"{cls.__name__} is deprecated"
-        if version:
-            message += f" since version {version}"
-        if reason:
-            message += f": {reason}"
-        warnings.warn(message, category=DeprecationWarning, stacklevel=2)
-        # Return the original class unchanged
-        return cls
-
-    return decorator
-
-
 class SplurgeSqlGeneratorError(SplurgeFrameworkError):
     """Base exception for all errors in the splurge_sql_generator package."""
 
@@ -124,77 +107,78 @@ class SplurgeSqlGeneratorConfigurationError(SplurgeSqlGeneratorError):
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 # the following exceptions are deprecated and will be removed in v2025.7.0.
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorFileError", version="2025.6.0")
-class FileError(SplurgeSqlGeneratorError):
-    """Raised when an error occurs while accessing or reading a file.
-
-    Deprecated: Use SplurgeSqlGeneratorFileError instead."""
-
-    _domain = "splurge-sql-generator.file"
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorSqlValidationError", version="2025.6.0")
-class SqlValidationError(SplurgeSqlGeneratorError):
-    """Raised when provided SQL-related input arguments are invalid."""
-
-    _domain = "splurge-sql-generator.sql-validation"
-
-
-# Parsing-specific exceptions
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorParsingError", version="2025.6.0")
-class ParsingError(SplurgeSqlGeneratorError):
-    """Base exception for parsing-related errors."""
-
-    _domain = "splurge-sql-generator.parsing"
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorSqlParsingError", version="2025.6.0")
-class SqlParsingError(ParsingError):
-    """Raised when SQL parsing via sqlparse fails."""
-
-    _domain = "splurge-sql-generator.parsing"
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorTokenizationError", version="2025.6.0")
-class TokenizationError(ParsingError):
-    """Raised when token processing or traversal fails."""
-
-    _domain = "splurge-sql-generator.tokenization"
-
-
-# Schema-specific exceptions
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorSchemaError", version="2025.6.0")
-class SchemaError(SplurgeSqlGeneratorError):
-    """Base exception for schema processing errors."""
-
-    _domain = "splurge-sql-generator.schema"
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorColumnDefinitionError", version="2025.6.0")
-class ColumnDefinitionError(SchemaError):
-    """Raised when column definition parsing fails."""
-
-    _domain = "splurge-sql-generator.column-definition"
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorTypeInferenceError", version="2025.6.0")
-class TypeInferenceError(SchemaError):
-    """Raised when type inference fails."""
-
-    _domain = "splurge-sql-generator.type-inference"
-
-
-# Configuration exceptions
-
-
-@splurge_class_deprecated(reason="Use SplurgeSqlGeneratorConfigurationError", version="2025.6.0")
-class ConfigurationError(SplurgeSqlGeneratorError):
-    """Raised when configuration is invalid or missing."""
-
-    _domain = "splurge-sql-generator.configuration"
+#
+# They are materialized lazily by the module __getattr__ (PEP 562) so that importing
+# this module does not define them or emit DeprecationWarnings; the warning is issued
+# only when a consumer references a legacy name.
+
+# Legacy name -> (base class name, domain, replacement class name)
+_DEPRECATED_EXCEPTIONS: dict[str, tuple[str, str, str]] = {
+    "FileError": ("SplurgeSqlGeneratorError", "splurge-sql-generator.file", "SplurgeSqlGeneratorFileError"),
+    "SqlValidationError": (
+        "SplurgeSqlGeneratorError",
+        "splurge-sql-generator.sql-validation",
+        "SplurgeSqlGeneratorSqlValidationError",
+    ),
+    # Parsing-specific exceptions
+    "ParsingError": ("SplurgeSqlGeneratorError", "splurge-sql-generator.parsing", "SplurgeSqlGeneratorParsingError"),
+    "SqlParsingError": ("ParsingError", "splurge-sql-generator.parsing", "SplurgeSqlGeneratorSqlParsingError"),
+    "TokenizationError": ("ParsingError", "splurge-sql-generator.tokenization", "SplurgeSqlGeneratorTokenizationError"),
+    # Schema-specific exceptions
+    "SchemaError": ("SplurgeSqlGeneratorError", "splurge-sql-generator.schema", "SplurgeSqlGeneratorSchemaError"),
+    "ColumnDefinitionError": (
+        "SchemaError",
+        "splurge-sql-generator.column-definition",
+        "SplurgeSqlGeneratorColumnDefinitionError",
+    ),
+    "TypeInferenceError": (
+        "SchemaError",
+        "splurge-sql-generator.type-inference",
+        "SplurgeSqlGeneratorTypeInferenceError",
+    ),
+    # Configuration exceptions
+    "ConfigurationError": (
+        "SplurgeSqlGeneratorError",
+        "splurge-sql-generator.configuration",
+        "SplurgeSqlGeneratorConfigurationError",
+    ),
+}
+_DEPRECATED_VERSION = "2025.6.0"
+_deprecated_classes: dict[str, type[SplurgeSqlGeneratorError]] = {}
+
+
+def _deprecated_class(name: str) -> type[SplurgeSqlGeneratorError]:
+    """Create (once) and return the legacy exception class for ``name``."""
+    cls = _deprecated_classes.get(name)
+    if cls is None:
+        base_name, domain, replacement = _DEPRECATED_EXCEPTIONS[name]
+        base = _deprecated_class(base_name) if base_name in _DEPRECATED_EXCEPTIONS else globals()[base_name]
+        cls = type(
+            name,
+            (base,),
+            {
+                "__module__": __name__,
+                "__doc__": f"Deprecated: Use {replacement} instead.",
+                "_domain": domain,
+            },
+        )
+        _deprecated_classes[name] = cls
+    return cls
+
+
+def __getattr__(name: str) -> type[SplurgeSqlGeneratorError]:
+    """Resolve deprecated exception names on access, warning the caller."""
+    if name in _DEPRECATED_EXCEPTIONS:
+        replacement = _DEPRECATED_EXCEPTIONS[name][2]
+        warnings.warn(
+            f"{name} is deprecated since version {_DEPRECATED_VERSION}: Use {replacement}",
+            category=DeprecationWarning,
+            stacklevel=2,
+        )
+        return _deprecated_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include the lazily created deprecated exception names in dir()."""
+    return sorted([*globals(), *_DEPRECATED_EXCEPTIONS])
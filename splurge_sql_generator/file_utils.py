@@ -9,14 +9,20 @@ Copyright (c) 2025, Jim Schilling
 This module is licensed under the MIT License.
 """
 
+import io
 import logging
+import mmap
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import yaml  # type: ignore[import-untyped]
 
 from ._vendor.splurge_safe_io.exceptions import (
+    SplurgeSafeIoError,
     SplurgeSafeIoFileNotFoundError,
     SplurgeSafeIoLookupError,
     SplurgeSafeIoOSError,
@@ -25,12 +31,130 @@ from ._vendor.splurge_safe_io.exceptions import (
     SplurgeSafeIoRuntimeError,
     SplurgeSafeIoUnicodeError,
 )
+from ._vendor.splurge_safe_io.path_validator import PathValidator
 from ._vendor.splurge_safe_io.safe_text_file_reader import SafeTextFileReader
 from ._vendor.splurge_safe_io.safe_text_file_writer import open_safe_text_writer
 from .exceptions import SplurgeSqlGeneratorConfigurationError, SplurgeSqlGeneratorFileError
 
 DOMAINS = ["file", "utilities"]
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlSafeLoader
+
+# Messages for safe-io errors, keyed by error type; the most specific type in an error's MRO wins
+_READ_ERROR_MESSAGES: dict[type[SplurgeSafeIoError], str] = {
+    SplurgeSafeIoPathValidationError: "Invalid file path: {path}",
+    SplurgeSafeIoFileNotFoundError: "File not found: {path}",
+    SplurgeSafeIoPermissionError: "Permission denied reading {path}",
+    SplurgeSafeIoLookupError: "Lookup error reading {path}",
+    SplurgeSafeIoUnicodeError: "Encoding error reading {path}",
+    SplurgeSafeIoOSError: "OS error reading {path}",
+    SplurgeSafeIoRuntimeError: "Runtime error reading {path}",
+}
+
+_WRITE_ERROR_MESSAGES: dict[type[SplurgeSafeIoError], str] = {
+    SplurgeSafeIoPathValidationError: "Invalid file path: {path}",
+    SplurgeSafeIoUnicodeError: "Encoding error writing to {path}",
+    SplurgeSafeIoPermissionError: "Permission denied writing to {path}",
+    SplurgeSafeIoOSError: "OS error writing to {path}",
+    SplurgeSafeIoLookupError: "Lookup error writing to {path}",
+    SplurgeSafeIoRuntimeError: "Runtime error writing to {path}",
+}
+
+# Builtin errors raised by direct file access, mapped to the safe-io type whose message they share
+_BUILTIN_TO_SAFE_IO_ERROR: dict[type[Exception], type[SplurgeSafeIoError]] = {
+    FileNotFoundError: SplurgeSafeIoFileNotFoundError,
+    PermissionError: SplurgeSafeIoPermissionError,
+    UnicodeError: SplurgeSafeIoUnicodeError,
+    LookupError: SplurgeSafeIoLookupError,
+    OSError: SplurgeSafeIoOSError,
+}
+
+
+# Line boundaries other than LF recognized by str.splitlines(), which SafeTextFileReader.read() relies on
+_NON_LF_LINE_BOUNDARY_PATTERN: re.Pattern[str] = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _normalize_newlines(text: str) -> str:
+    """
+    Normalize line endings exactly as SafeTextFileReader.read() does.
+
+    The reader joins ``str.splitlines()`` with LF, so every line boundary becomes LF and one
+    trailing boundary is dropped. Text whose only boundaries are LF skips the split and join.
+
+    Args:
+        text: Decoded file content
+
+    Returns:
+        Content with reader-identical newline normalization
+    """
+    if _NON_LF_LINE_BOUNDARY_PATTERN.search(text) is None:
+        return text[:-1] if text.endswith("\n") else text
+    return "\n".join(text.replace("\r\n", "\n").replace("\r", "\n").splitlines())
+
+
+def _file_error_for(
+    error_type: type[SplurgeSafeIoError], messages: dict[type[SplurgeSafeIoError], str], path: str | Path, details: str
+) -> SplurgeSqlGeneratorFileError | None:
+    """
+    Build a SplurgeSqlGeneratorFileError from the message of the most specific known type.
+
+    Args:
+        error_type: Safe-io error type whose MRO selects the message
+        messages: Message templates keyed by error type
+        path: File path the operation was applied to
+        details: Description of the underlying error
+
+    Returns:
+        Translated error, or None if no type in the MRO has a message
+    """
+    for candidate in error_type.__mro__:
+        message = messages.get(candidate)
+        if message is not None:
+            return SplurgeSqlGeneratorFileError(message.format(path=path), details={"details": details})
+    return None
+
+
+def _translate_safe_io_error(
+    error: SplurgeSafeIoError, messages: dict[type[SplurgeSafeIoError], str], path: str | Path
+) -> SplurgeSqlGeneratorFileError | None:
+    """
+    Translate a safe-io error into a SplurgeSqlGeneratorFileError with a contextual message.
+
+    Args:
+        error: Error raised by the vendored safe-io package
+        messages: Message templates keyed by error type
+        path: File path the operation was applied to
+
+    Returns:
+        Translated error, or None if the error's type has no message (re-raise it unchanged)
+    """
+    return _file_error_for(type(error), messages, path, str(error.message))
+
+
+def _translate_builtin_error(
+    error: Exception, messages: dict[type[SplurgeSafeIoError], str], path: str | Path
+) -> SplurgeSqlGeneratorFileError | None:
+    """
+    Translate a builtin I/O error through the same message table as the equivalent safe-io error.
+
+    Args:
+        error: Builtin error raised by direct file access (OSError, LookupError, UnicodeError)
+        messages: Message templates keyed by safe-io error type
+        path: File path the operation was applied to
+
+    Returns:
+        Translated error, or None if the error has no message (re-raise it unchanged)
+    """
+    for error_type in type(error).__mro__:
+        safe_io_type = _BUILTIN_TO_SAFE_IO_ERROR.get(error_type)
+        if safe_io_type is not None:
+            return _file_error_for(safe_io_type, messages, path, str(error))
+    return None
+
 
 class FileIoAdapter(ABC):
     """Abstract interface for file I/O operations."""
@@ -51,6 +175,25 @@ class FileIoAdapter(ABC):
             SplurgeSqlGeneratorFileError: If file cannot be read
         """
 
+    def open_text(self, path: str | Path, *, encoding: str = "utf-8") -> AbstractContextManager[TextIO]:
+        """
+        Open file as a readable text stream.
+
+        The default implementation wraps read_text in an in-memory stream; adapters
+        backed by real files should override it to stream from the file instead.
+
+        Args:
+            path: File path to read
+            encoding: Text encoding (default: utf-8)
+
+        Returns:
+            Context manager yielding a text stream
+
+        Raises:
+            SplurgeSqlGeneratorFileError: If file cannot be read
+        """
+        return io.StringIO(self.read_text(path, encoding=encoding))
+
     @abstractmethod
     def write_text(self, path: str | Path, content: str, *, encoding: str = "utf-8") -> None:
         """
@@ -85,6 +228,39 @@ class SafeTextFileIoAdapter(FileIoAdapter):
         """Initialize the adapter."""
         self._logger = logging.getLogger(__name__)
 
+    def read_utf8_text_direct(self, path: str | Path, *, use_mmap: bool = False) -> str:
+        """
+        Read a UTF-8 file with one bytes read (or a memory map), returning what read_text would.
+
+        The path is validated as SafeTextFileReader validates it, and newlines are normalized
+        the same way. Any validation, OS or decoding failure is reported by read_text, so the
+        content and error messages do not depend on which path served the file.
+
+        Args:
+            path: File path to read
+            use_mmap: Decode straight from a read-only memory map, skipping the intermediate
+                bytes copy (worthwhile for large files)
+
+        Returns:
+            File contents as string
+
+        Raises:
+            SplurgeSqlGeneratorFileError: If file cannot be read
+        """
+        try:
+            validated_path = PathValidator.get_validated_path(
+                path, must_exist=True, must_be_file=True, must_be_readable=True
+            )
+            if use_mmap:
+                with open(validated_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content = str(mapped, "utf-8")
+            else:
+                content = validated_path.read_bytes().decode("utf-8")
+        except (SplurgeSafeIoError, OSError, ValueError):
+            # UnicodeDecodeError is a ValueError, as is mapping an empty file
+            return self.read_text(path)
+        return _normalize_newlines(content)
+
     def read_text(self, path: str | Path, *, encoding: str = "utf-8") -> str:
         """
         Read file as text using SafeTextFileReader.
@@ -105,28 +281,51 @@ class SafeTextFileIoAdapter(FileIoAdapter):
             if not isinstance(content, str):
                 raise SplurgeSqlGeneratorFileError(f"Unexpected return type from SafeTextFileReader: {type(content)}")
             return content
-        except SplurgeSafeIoPathValidationError as e:
-            raise SplurgeSqlGeneratorFileError(f"Invalid file path: {path}", details={"details": str(e.message)}) from e
-        except SplurgeSafeIoFileNotFoundError as e:
-            raise SplurgeSqlGeneratorFileError(f"File not found: {path}", details={"details": str(e.message)}) from e
-        except SplurgeSafeIoPermissionError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Permission denied reading {path}", details={"details": str(e.message)}
-            ) from e
-        except SplurgeSafeIoLookupError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Lookup error reading {path}", details={"details": str(e.message)}
-            ) from e
-        except SplurgeSafeIoUnicodeError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Encoding error reading {path}", details={"details": str(e.message)}
-            ) from e
-        except SplurgeSafeIoOSError as e:
-            raise SplurgeSqlGeneratorFileError(f"OS error reading {path}", details={"details": str(e.message)}) from e
-        except SplurgeSafeIoRuntimeError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Runtime error reading {path}", details={"details": str(e.message)}
-            ) from e
+        except SplurgeSafeIoError as e:
+            file_error = _translate_safe_io_error(e, _READ_ERROR_MESSAGES, path)
+            if file_error is None:
+                raise
+            raise file_error from e
+
+    @contextmanager
+    def open_text(self, path: str | Path, *, encoding: str = "utf-8") -> Iterator[TextIO]:
+        """
+        Open file as a text stream so callers can parse it without holding a full copy in memory.
+
+        Decoding errors raised while the caller reads the stream are translated as well.
+
+        Args:
+            path: File path to read
+            encoding: Text encoding (default: utf-8)
+
+        Yields:
+            Text stream with universal newline handling
+
+        Raises:
+            SplurgeSqlGeneratorFileError: If file cannot be opened or decoded
+        """
+        try:
+            validated_path = PathValidator.get_validated_path(path, must_exist=True, must_be_file=True)
+            stream = open(validated_path, encoding=encoding)
+        except SplurgeSafeIoError as e:
+            file_error = _translate_safe_io_error(e, _READ_ERROR_MESSAGES, path)
+            if file_error is None:
+                raise
+            raise file_error from e
+        except (OSError, LookupError) as e:
+            file_error = _translate_builtin_error(e, _READ_ERROR_MESSAGES, path)
+            if file_error is None:
+                raise
+            raise file_error from e
+
+        with stream:
+            try:
+                yield stream
+            except UnicodeDecodeError as e:
+                file_error = _translate_builtin_error(e, _READ_ERROR_MESSAGES, path)
+                if file_error is None:
+                    raise
+                raise file_error from e
 
     def write_text(self, path: str | Path, content: str, *, encoding: str = "utf-8") -> None:
         """
@@ -143,28 +342,40 @@ class SafeTextFileIoAdapter(FileIoAdapter):
         try:
             with open_safe_text_writer(path, encoding=encoding) as writer:
                 writer.write(content)
-        except SplurgeSafeIoPathValidationError as e:
-            raise SplurgeSqlGeneratorFileError(f"Invalid file path: {path}", details={"details": str(e.message)}) from e
-        except SplurgeSafeIoUnicodeError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Encoding error writing to {path}", details={"details": str(e.message)}
-            ) from e
-        except SplurgeSafeIoPermissionError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Permission denied writing to {path}", details={"details": str(e.message)}
-            ) from e
-        except SplurgeSafeIoOSError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"OS error writing to {path}", details={"details": str(e.message)}
-            ) from e
-        except SplurgeSafeIoLookupError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Lookup error writing to {path}", details={"details": str(e.message)}
-            ) from e
-        except SplurgeSafeIoRuntimeError as e:
-            raise SplurgeSqlGeneratorFileError(
-                f"Runtime error writing to {path}", details={"details": str(e.message)}
-            ) from e
+        except SplurgeSafeIoError as e:
+            file_error = _translate_safe_io_error(e, _WRITE_ERROR_MESSAGES, path)
+            if file_error is None:
+                raise
+            raise file_error from e
+
+    def write_bytes(self, path: str | Path, data: bytes) -> None:
+        """
+        Write already-encoded content to a file.
+
+        Intended for generated output whose text is already LF-normalized, avoiding the
+        text writer's incremental encoding and newline normalization.
+
+        Args:
+            path: File path to write to
+            data: Encoded content to write
+
+        Raises:
+            SplurgeSqlGeneratorFileError: If file cannot be written
+        """
+        try:
+            validated_path = PathValidator.get_validated_path(path, must_exist=False, must_be_file=False)
+            # Buffered write: loops until all of data is written, unlike a raw FileIO.write()
+            validated_path.write_bytes(data)
+        except SplurgeSafeIoError as e:
+            file_error = _translate_safe_io_error(e, _WRITE_ERROR_MESSAGES, path)
+            if file_error is None:
+                raise
+            raise file_error from e
+        except OSError as e:
+            file_error = _translate_builtin_error(e, _WRITE_ERROR_MESSAGES, path)
+            if file_error is None:
+                raise
+            raise file_error from e
 
     def exists(self, path: str | Path) -> bool:
         """
@@ -207,8 +418,9 @@ class YamlConfigReader:
             SplurgeSqlGeneratorConfigurationError: If YAML is invalid or not a dictionary
         """
         try:
-            content = self._file_io.read_text(path)
-            parsed = yaml.safe_load(content)
+            # Parse straight from the stream rather than materializing the whole file first
+            with self._file_io.open_text(path) as stream:
+                parsed = yaml.load(stream, Loader=_YamlSafeLoader)
 
             if not isinstance(parsed, dict):
                 self._logger.warning(
@@ -10,7 +10,13 @@ This module is licensed under the MIT License.
 """
 
 import logging
+import os
+import sys
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml  # type: ignore
 
@@ -29,6 +35,17 @@ from .utils import clean_sql_type
 
 DOMAINS = ["schema", "parser"]
 
+_LOGGER = logging.getLogger(__name__)
+
+# Schema files at least this large are decoded directly from a memory map (see _read_schema_text)
+_MMAP_THRESHOLD_BYTES = 256 * 1024
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlSafeLoader
+
 
 # Module-level constant: Default SQL type to Python type mapping
 _DEFAULT_SQL_TYPE_MAPPING: dict[str, str] = {
@@ -93,6 +110,92 @@ _DEFAULT_SQL_TYPE_MAPPING: dict[str, str] = {
     "DEFAULT": "Any",
 }
 
+# Shared read-only view handed out when no custom mapping file is used
+_DEFAULT_SQL_TYPE_MAPPING_VIEW: Mapping[str, str] = MappingProxyType(_DEFAULT_SQL_TYPE_MAPPING)
+
+
+# Sections of the generated types file, grouped by database (derived from _DEFAULT_SQL_TYPE_MAPPING)
+_TYPES_FILE_SECTIONS: tuple[tuple[str, dict[str, str]], ...] = (
+    (
+        "SQLite",
+        {
+            "INTEGER": "int",
+            "INT": "int",
+            "BIGINT": "int",
+            "TEXT": "str",
+            "VARCHAR": "str",
+            "CHAR": "str",
+            "DECIMAL": "float",
+            "REAL": "float",
+            "FLOAT": "float",
+            "DOUBLE": "float",
+            "BOOLEAN": "bool",
+            "BOOL": "bool",
+            "TIMESTAMP": "str",
+            "DATETIME": "str",
+            "DATE": "str",
+            "BLOB": "bytes",
+        },
+    ),
+    (
+        "PostgreSQL",
+        {
+            "JSON": "dict",
+            "JSONB": "dict",
+            "UUID": "str",
+            "SERIAL": "int",
+            "BIGSERIAL": "int",
+        },
+    ),
+    (
+        "MySQL",
+        {
+            "TINYINT": "int",
+            "SMALLINT": "int",
+            "MEDIUMINT": "int",
+            "LONGTEXT": "str",
+            "ENUM": "str",
+        },
+    ),
+    (
+        "MSSQL",
+        {
+            "BIT": "bool",
+            "NUMERIC": "float",
+            "MONEY": "float",
+            "SMALLMONEY": "float",
+            "NCHAR": "str",
+            "NVARCHAR": "str",
+            "NTEXT": "str",
+            "BINARY": "bytes",
+            "VARBINARY": "bytes",
+            "IMAGE": "bytes",
+            "DATETIME2": "str",
+            "SMALLDATETIME": "str",
+            "TIME": "str",
+            "DATETIMEOFFSET": "str",
+            "ROWVERSION": "str",
+            "UNIQUEIDENTIFIER": "str",
+            "XML": "str",
+            "SQL_VARIANT": "Any",
+        },
+    ),
+    (
+        "Oracle",
+        {
+            "NUMBER": "float",
+            "VARCHAR2": "str",
+            "NVARCHAR2": "str",
+            "CLOB": "str",
+            "NCLOB": "str",
+            "LONG": "str",
+            "RAW": "bytes",
+            "ROWID": "str",
+            "INTERVAL": "str",
+        },
+    ),
+)
+
 
 class SchemaParser:
     """Parser for SQL schema files to extract column type information."""
@@ -113,61 +216,36 @@ class SchemaParser:
         """Public read-only access to the table schemas."""
         return self._table_schemas
 
-    def _load_sql_type_mapping(self, mapping_file: str) -> dict[str, str]:
+    @property
+    def default_python_type(self) -> str:
+        """Python type get_python_type() falls back to for SQL types missing from the mapping."""
+        return self._sql_type_mapping.get("DEFAULT", "Any")
+
+    def _load_sql_type_mapping(self, mapping_file: str) -> Mapping[str, str]:
         """
         Load SQL type to Python type mapping from YAML file.
 
+        Parsed mappings are shared across parser instances until the file changes.
+
         Args:
             mapping_file: Path to the mapping file
 
         Returns:
-            Dictionary mapping SQL types to Python types
-
-        Raises:
-            ValueError: If the loaded YAML is not a dictionary or is missing required keys
+            Read-only mapping of SQL types to Python types
         """
         mapping_path = None
         try:
             mapping_path = Path(mapping_file)
-            if mapping_path.exists():
-                file_io = SafeTextFileIoAdapter()
-                content = file_io.read_text(mapping_path, encoding="utf-8")
-                loaded_mapping = yaml.safe_load(content)
-
-                # Validate the loaded mapping
-                if not isinstance(loaded_mapping, dict):
-                    raise SplurgeSqlGeneratorValueError(
-                        f"YAML file '{mapping_file}' must contain a dictionary, got {type(loaded_mapping).__name__}"
-                    )
-
-                # Validate that all values are strings
-                invalid_entries: list[str] = []
-                for key, value in loaded_mapping.items():
-                    if not isinstance(value, str):
-                        invalid_entries.append(f"{key}: {type(value).__name__}")
-
-                if invalid_entries:
-                    self._logger.warning(
-                        f"YAML file '{mapping_file}' contains non-string values: {', '.join(invalid_entries)}. "
-                        "These entries will be ignored."
-                    )
-                    # Filter out non-string values
-                    loaded_mapping = {k: v for k, v in loaded_mapping.items() if isinstance(v, str)}
-
-                # Ensure DEFAULT key exists
-                if "DEFAULT" not in loaded_mapping:
-                    self._logger.warning(
-                        f"YAML file '{mapping_file}' is missing 'DEFAULT' key. "
-                        "Adding 'DEFAULT: Any' as fallback for unknown types."
-                    )
-                    loaded_mapping["DEFAULT"] = "Any"
-
-                self._logger.info(f"Successfully loaded {len(loaded_mapping)} type mappings from '{mapping_file}'")
-                return loaded_mapping
-            else:
+            # A single stat() both checks existence and identifies the file version for the cache
+            try:
+                stat = mapping_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 # Return default mapping if file doesn't exist
                 self._logger.info(f"Type mapping file '{mapping_file}' not found, using default mappings")
                 return self._get_default_mapping()
+            return _load_sql_type_mapping_cached(
+                str(mapping_path), stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+            )
 
         except SplurgeSqlGeneratorFileError as e:
             path_str = str(mapping_path) if mapping_path else mapping_file
@@ -177,19 +255,23 @@ class SchemaParser:
             path_str = str(mapping_path) if mapping_path else mapping_file
             self._logger.warning(f"Invalid YAML syntax in SQL type mapping file: {path_str}: {str(e)}")
             return self._get_default_mapping()
-        except Exception as e:
+        except SplurgeSqlGeneratorValueError as e:
             path_str = str(mapping_path) if mapping_path else mapping_file
-            self._logger.warning(f"Unexpected error reading SQL type mapping file: {path_str}: {str(e)}")
+            self._logger.warning(f"Invalid SQL type mapping file: {path_str}: {str(e.message)}")
+            return self._get_default_mapping()
+        except OSError as e:
+            path_str = str(mapping_path) if mapping_path else mapping_file
+            self._logger.warning(f"Error accessing SQL type mapping file: {path_str}: {str(e)}")
             return self._get_default_mapping()
 
-    def _get_default_mapping(self) -> dict[str, str]:
+    def _get_default_mapping(self) -> Mapping[str, str]:
         """
         Get default SQL type to Python type mapping.
 
         Returns:
-            Copy of default mapping dictionary to prevent external mutation
+            Read-only view of the default mapping to prevent external mutation
         """
-        return _DEFAULT_SQL_TYPE_MAPPING.copy()
+        return _DEFAULT_SQL_TYPE_MAPPING_VIEW
 
     def _parse_schema_file(self, schema_file_path: Path | str) -> dict[str, dict[str, str]]:
         """
@@ -208,9 +290,19 @@ class SchemaParser:
             If the schema file does not exist, an empty dictionary is returned.
         """
         try:
-            file_io = SafeTextFileIoAdapter()
-            schema_content = file_io.read_text(schema_file_path)
-            return self._parse_schema_content(schema_content)
+            path = Path(schema_file_path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Missing schema files are common in batch runs; skip the adapter's error path
+                return {}
+            except OSError:
+                # Let the file adapter report unreadable files
+                return self._read_and_parse_schema(schema_file_path)
+
+            # The stat result already identifies the file version; no resolve() path walk needed
+            tables = _parse_schema_file_cached(str(path), stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            return {table_name: dict(columns) for table_name, columns in tables}
 
         except SplurgeSqlGeneratorFileError as e:
             # Check if it's a "not found" error - we return empty dict for those
@@ -219,6 +311,24 @@ class SchemaParser:
             # Re-raise other FileErrors
             raise
 
+    def _read_and_parse_schema(self, schema_file_path: Path | str) -> dict[str, dict[str, str]]:
+        """
+        Read a schema file and parse its content without memoization.
+
+        Args:
+            schema_file_path: Path to the schema file
+
+        Returns:
+            Dictionary mapping table names to column type mappings
+
+        Raises:
+            SplurgeSqlGeneratorFileError: If the schema file cannot be read
+            SplurgeSqlGeneratorSqlValidationError: If the SQL content is malformed and cannot be parsed
+        """
+        file_io = SafeTextFileIoAdapter()
+        schema_content = file_io.read_text(schema_file_path)
+        return self._parse_schema_content(schema_content)
+
     def _parse_schema_content(self, content: str) -> dict[str, dict[str, str]]:
         """
         Parse schema content and extract table column information.
@@ -240,7 +350,7 @@ class SchemaParser:
         for table_name, table_body in create_tables:
             # Parse column definitions
             columns = self._parse_table_columns(table_body)
-            tables[table_name] = columns
+            tables[sys.intern(table_name)] = columns
 
         return tables
 
@@ -254,8 +364,7 @@ class SchemaParser:
         Returns:
             Dictionary mapping column names to SQL types
         """
-        # Use the sqlparse-based column parsing function
-        return parse_table_columns(table_body)
+        return _parse_interned_table_columns(table_body)
 
     def get_python_type(self, sql_type: str) -> str:
         """
@@ -267,20 +376,16 @@ class SchemaParser:
         Returns:
             Python type annotation
         """
-        # Clean up the type by removing size specifications and normalizing case
-        clean_type = clean_sql_type(sql_type).upper().strip()
-
-        # Try exact match first
-        if clean_type in self._sql_type_mapping:
-            return self._sql_type_mapping[clean_type]
+        # Clean up the type by removing size specifications and normalizing case (memoized per raw type)
+        clean_type = _normalize_sql_type(sql_type)
 
-        # Try case insensitive lookup
-        for key, value in self._sql_type_mapping.items():
-            if key.upper() == clean_type:
-                return value
+        # Mapping keys are upper-cased at load time, so one lookup covers every spelling
+        python_type = self._sql_type_mapping.get(clean_type)
+        if python_type is not None:
+            return python_type
 
         # Fallback to default
-        default_type = self._sql_type_mapping.get("DEFAULT", "Any")
+        default_type = self.default_python_type
         if default_type == "Any":
             self._logger.debug(f"Unknown SQL type '{sql_type}' (cleaned: '{clean_type}'), using 'Any'")
         else:
@@ -358,6 +463,35 @@ class SchemaParser:
                 f"Unexpected error loading schema from '{str(schema_file_path)}': {type(e).__name__}: {str(e)}"
             ) from e
 
+    def preload_many(self, schema_file_paths: Iterable[Path | str]) -> int:
+        """
+        Read and parse several schema files concurrently to warm the schema cache.
+
+        Files are read on a thread pool so their I/O overlaps; later load_schema or
+        load_schema_for_sql_file calls for the same unchanged files are served from
+        the cache. This does not change the currently loaded table schemas.
+
+        Args:
+            schema_file_paths: Schema file paths to preload
+
+        Returns:
+            Number of schema files that were parsed into the cache
+
+        Note:
+            Missing, unreadable or malformed files are skipped here; the error is
+            raised when the file is actually loaded.
+        """
+        unique_paths = list(dict.fromkeys(str(path) for path in schema_file_paths))
+        if not unique_paths:
+            return 0
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(unique_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = sum(executor.map(_preload_schema_file, unique_paths))
+
+        self._logger.debug(f"Preloaded {loaded} of {len(unique_paths)} schema files")
+        return loaded
+
     def generate_types_file(self, *, output_path: Path | str | None = None) -> str:
         """
         Generate the default SQL type mapping YAML file.
@@ -386,95 +520,13 @@ class SchemaParser:
 
 """
 
-        # Group types by database for better organization (derived from _DEFAULT_SQL_TYPE_MAPPING)
-        sqlite_types = {
-            "INTEGER": "int",
-            "INT": "int",
-            "BIGINT": "int",
-            "TEXT": "str",
-            "VARCHAR": "str",
-            "CHAR": "str",
-            "DECIMAL": "float",
-            "REAL": "float",
-            "FLOAT": "float",
-            "DOUBLE": "float",
-            "BOOLEAN": "bool",
-            "BOOL": "bool",
-            "TIMESTAMP": "str",
-            "DATETIME": "str",
-            "DATE": "str",
-            "BLOB": "bytes",
-        }
-
-        postgresql_types = {
-            "JSON": "dict",
-            "JSONB": "dict",
-            "UUID": "str",
-            "SERIAL": "int",
-            "BIGSERIAL": "int",
-        }
-
-        mysql_types = {
-            "TINYINT": "int",
-            "SMALLINT": "int",
-            "MEDIUMINT": "int",
-            "LONGTEXT": "str",
-            "ENUM": "str",
-        }
-
-        mssql_types = {
-            "BIT": "bool",
-            "NUMERIC": "float",
-            "MONEY": "float",
-            "SMALLMONEY": "float",
-            "NCHAR": "str",
-            "NVARCHAR": "str",
-            "NTEXT": "str",
-            "BINARY": "bytes",
-            "VARBINARY": "bytes",
-            "IMAGE": "bytes",
-            "DATETIME2": "str",
-            "SMALLDATETIME": "str",
-            "TIME": "str",
-            "DATETIMEOFFSET": "str",
-            "ROWVERSION": "str",
-            "UNIQUEIDENTIFIER": "str",
-            "XML": "str",
-            "SQL_VARIANT": "Any",
-        }
-
-        oracle_types = {
-            "NUMBER": "float",
-            "VARCHAR2": "str",
-            "NVARCHAR2": "str",
-            "CLOB": "str",
-            "NCLOB": "str",
-            "LONG": "str",
-            "RAW": "bytes",
-            "ROWID": "str",
-            "INTERVAL": "str",
-        }
-
-        # Add SQLite types
-        yaml_content += "# SQLite types\n"
-        for sql_type, python_type in sorted(sqlite_types.items()):
-            yaml_content += f"{sql_type}: {python_type}\n"
-
-        yaml_content += "\n# PostgreSQL types\n"
-        for sql_type, python_type in sorted(postgresql_types.items()):
-            yaml_content += f"{sql_type}: {python_type}\n"
-
-        yaml_content += "\n# MySQL types\n"
-        for sql_type, python_type in sorted(mysql_types.items()):
-            yaml_content += f"{sql_type}: {python_type}\n"
-
-        yaml_content += "\n# MSSQL types\n"
-        for sql_type, python_type in sorted(mssql_types.items()):
-            yaml_content += f"{sql_type}: {python_type}\n"
-
-        yaml_content += "\n# Oracle types\n"
-        for sql_type, python_type in sorted(oracle_types.items()):
-            yaml_content += f"{sql_type}: {python_type}\n"
+        for index, (database, section_types) in enumerate(_TYPES_FILE_SECTIONS):
+            if index:
+                yaml_content += "\n"
+            yaml_content += f"# {database} types\n"
+            yaml_content += "".join(
+                f"{sql_type}: {python_type}\n" for sql_type, python_type in sorted(section_types.items())
+            )
 
         yaml_content += "\n# Default fallback for unknown types\nDEFAULT: Any\n"
 
@@ -531,3 +583,182 @@ class SchemaParser:
                 f"Failed to load schema from '{str(schema_path)}' for SQL file '{str(sql_file_path)}': {str(e)}"
             )
             raise
+
+
+@lru_cache(maxsize=512)
+def _normalize_sql_type(sql_type: str) -> str:
+    """
+    Strip size specifications from a SQL type and upper-case it for mapping lookups.
+
+    The set of distinct raw column types is small, so the result is memoized. It does
+    not depend on the type mapping, so the cache never goes stale when a mapping changes.
+
+    Args:
+        sql_type: Raw SQL column type, e.g. ``varchar(255)``
+
+    Returns:
+        Normalized SQL type, e.g. ``VARCHAR``
+    """
+    return clean_sql_type(sql_type).upper().strip()
+
+
+@lru_cache(maxsize=64)
+def _parse_schema_file_cached(
+    path: str, device: int, inode: int, mtime_ns: int, size: int
+) -> tuple[tuple[str, tuple[tuple[str, str], ...]], ...]:
+    """
+    Read and parse a schema file, memoized on its path and the identity fields of one stat().
+
+    Keying on device and inode lets callers use the path as given instead of resolving it,
+    which costs a stat per path component. Table and column mappings are returned as
+    immutable tuples of items so the cached entry cannot be mutated by callers.
+
+    Args:
+        path: Schema file path, as given by the caller
+        device: File device number (part of the cache key)
+        inode: File inode number (part of the cache key)
+        mtime_ns: File modification time in nanoseconds (part of the cache key)
+        size: File size in bytes (part of the cache key)
+
+    Returns:
+        Tuple of ((table_name, ((column_name, sql_type), ...)), ...)
+
+    Raises:
+        SplurgeSqlGeneratorFileError: If the schema file cannot be read
+        SplurgeSqlGeneratorSqlValidationError: If the SQL content is malformed and cannot be parsed
+    """
+    content = _read_schema_text(path, size)
+    return tuple(
+        (sys.intern(table_name), tuple(_parse_interned_table_columns(table_body).items()))
+        for table_name, table_body in extract_create_table_statements(content)
+    )
+
+
+def _parse_interned_table_columns(table_body: str) -> dict[str, str]:
+    """
+    Parse column definitions from a table body, interning column names and SQL types.
+
+    The same few names and types repeat across tables and schemas, so interning shares
+    one string object per distinct value and lets dict lookups short-circuit on identity.
+
+    Args:
+        table_body: Table body content between parentheses
+
+    Returns:
+        Dictionary mapping column names to SQL types
+    """
+    # Use the sqlparse-based column parsing function
+    return {
+        sys.intern(column_name): sys.intern(sql_type)
+        for column_name, sql_type in parse_table_columns(table_body).items()
+    }
+
+
+def _preload_schema_file(schema_file_path: str) -> bool:
+    """
+    Parse one schema file into the schema cache for SchemaParser.preload_many.
+
+    Args:
+        schema_file_path: Path to the schema file
+
+    Returns:
+        True if the file was parsed (or already cached), False if it was skipped
+    """
+    try:
+        path = Path(schema_file_path)
+        stat = path.stat()
+        _parse_schema_file_cached(str(path), stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    except (OSError, SplurgeSqlGeneratorFileError, SplurgeSqlGeneratorSqlValidationError):
+        return False
+    return True
+
+
+def _read_schema_text(path: str, size: int) -> str:
+    """
+    Read a schema file as text, decoding large files straight from a read-only memory map.
+
+    Decoding from the map skips the intermediate bytes copy of the whole file, so peak
+    memory for large schemas is roughly the decoded text alone. Paths are validated and
+    newlines normalized exactly as for small files.
+
+    Args:
+        path: Schema file path
+        size: File size in bytes
+
+    Returns:
+        File content with newlines normalized as SafeTextFileReader normalizes them
+
+    Raises:
+        SplurgeSqlGeneratorFileError: If the schema file cannot be read
+    """
+    file_io = SafeTextFileIoAdapter()
+    if size >= _MMAP_THRESHOLD_BYTES:
+        return file_io.read_utf8_text_direct(path, use_mmap=True)
+    return file_io.read_text(path)
+
+
+@lru_cache(maxsize=8)
+def _load_sql_type_mapping_cached(path: str, device: int, inode: int, mtime_ns: int, size: int) -> Mapping[str, str]:
+    """
+    Read and validate a SQL type mapping YAML file, memoized on its path and the identity fields of one stat().
+
+    Args:
+        path: Mapping file path, as given by the caller
+        device: File device number (part of the cache key)
+        inode: File inode number (part of the cache key)
+        mtime_ns: File modification time in nanoseconds (part of the cache key)
+        size: File size in bytes (part of the cache key)
+
+    Returns:
+        Read-only mapping of SQL types to Python types
+
+    Raises:
+        SplurgeSqlGeneratorFileError: If the mapping file cannot be read
+        SplurgeSqlGeneratorValueError: If the loaded YAML is not a dictionary
+        yaml.YAMLError: If the YAML syntax is invalid
+    """
+    file_io = SafeTextFileIoAdapter()
+    with file_io.open_text(path, encoding="utf-8") as stream:
+        loaded_mapping = yaml.load(stream, Loader=_YamlSafeLoader)
+
+    # Validate the loaded mapping
+    if not isinstance(loaded_mapping, dict):
+        raise SplurgeSqlGeneratorValueError(
+            f"YAML file '{path}' must contain a dictionary, got {type(loaded_mapping).__name__}"
+        )
+
+    # Validate that all values are strings
+    invalid_entries: list[str] = []
+    for key, value in loaded_mapping.items():
+        if not isinstance(value, str):
+            invalid_entries.append(f"{key}: {type(value).__name__}")
+
+    if invalid_entries:
+        _LOGGER.warning(
+            f"YAML file '{path}' contains non-string values: {', '.join(invalid_entries)}. "
+            "These entries will be ignored."
+        )
+
+    # Filter out non-string values, upper-case the SQL type keys so lookups are a single dict
+    # probe, and intern the Python type names: the same few are shared by every inferred
+    # parameter of every generated method. An exactly upper-case key wins over other spellings.
+    normalized_mapping: dict[str, str] = {}
+    for key, value in loaded_mapping.items():
+        if not isinstance(value, str):
+            continue
+        upper_key = str(key).upper()
+        if key == upper_key:
+            normalized_mapping[upper_key] = sys.intern(value)
+        else:
+            normalized_mapping.setdefault(upper_key, sys.intern(value))
+    loaded_mapping = normalized_mapping
+
+    # Ensure DEFAULT key exists
+    if "DEFAULT" not in loaded_mapping:
+        _LOGGER.warning(
+            f"YAML file '{path}' is missing 'DEFAULT' key. Adding 'DEFAULT: Any' as fallback for unknown types."
+        )
+        loaded_mapping["DEFAULT"] = "Any"
+
+    _LOGGER.info(f"Successfully loaded {len(loaded_mapping)} type mappings from '{path}'")
+    return MappingProxyType(loaded_mapping)
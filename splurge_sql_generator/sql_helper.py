@@ -14,8 +14,11 @@ from functools import lru_cache
 from pathlib import Path
 
 import sqlparse
+from sqlparse.engine import StatementSplitter
+from sqlparse.lexer import tokenize as sqlparse_tokenize
 from sqlparse.sql import Statement, Token
-from sqlparse.tokens import Comment, Literal, Name
+from sqlparse.tokens import Comment, Literal, Name, Whitespace
+from sqlparse.utils import split_unquoted_newlines
 
 from .exceptions import (
     SplurgeSqlGeneratorFileError,
@@ -63,11 +66,36 @@ _CONSTRAINT_KEYWORDS: set[str] = {
     "NULL",
     "REFERENCES",
 }
+# Constraint keywords left inside a parsed column type, removed in one pass (sorted for a stable alternation)
+_CONSTRAINT_KEYWORD_PATTERN: re.Pattern[str] = re.compile("|".join(sorted(_CONSTRAINT_KEYWORDS)))
 
 # Private constants for SQL type suffixes
 _TYPE_SUFFIX: str = "_TYPE"
 _TYPE_SUFFIX_LENGTH: int = 5
 
+# Private compiled patterns for table names referenced by a statement.
+# DELETE FROM and LEFT/RIGHT/INNER/OUTER JOIN need no patterns of their own: every
+# such match is also found, with the same table name, by the FROM or JOIN pattern.
+_TABLE_NAME_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # FROM clause (including DELETE FROM)
+        r"FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)",
+        # INSERT INTO
+        r"INSERT\s+INTO\s+([a-zA-Z_][a-zA-Z0-9_]*)",
+        # UPDATE
+        r"UPDATE\s+([a-zA-Z_][a-zA-Z0-9_]*)",
+        # JOIN clauses (including LEFT/RIGHT/INNER/OUTER JOIN)
+        r"JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)",
+        # CTE names
+        r"WITH\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+AS",
+    )
+)
+
+# Text that may hold a comment token ("--", "# " and "/* */" forms, hints included) or be split
+# into several statements (a ";" before the end of the text or the GO batch separator)
+_COMMENT_OR_SPLIT_PATTERN: re.Pattern[str] = re.compile(r"--|#|/\*|;(?!\Z)|\bGO\b")
+
 # Public constants for statement type return values
 EXECUTE_STATEMENT: str = "execute"
 FETCH_STATEMENT: str = "fetch"
@@ -103,6 +131,12 @@ def remove_sql_comments(sql_text: str | None) -> str:
     if sql_text is None:
         return ""
 
+    # A single statement without comments is only rstripped line by line, which needs no lexing
+    if sql_text.isspace():
+        return ""
+    if not _COMMENT_OR_SPLIT_PATTERN.search(sql_text):
+        return "\n".join(line.rstrip() for line in split_unquoted_newlines(sql_text))
+
     result = sqlparse.format(sql_text, strip_comments=True)
     return str(result) if result is not None else ""
 
@@ -262,7 +296,6 @@ def find_main_statement_after_with(tokens: list[Token]) -> str | None:
 
     while i < n:
         token = tokens[i]
-        token_value = normalize_token(token)
 
         # Skip whitespace and comments
         if token.is_whitespace or token.ttype in Comment:
@@ -270,7 +303,7 @@ def find_main_statement_after_with(tokens: list[Token]) -> str | None:
             continue
 
         # Look for AS keyword (start of CTE definition)
-        if token_value == _AS_KEYWORD:
+        if normalize_token(token) == _AS_KEYWORD:
             # Skip AS keyword
             i += 1
 
@@ -328,7 +361,6 @@ def find_main_statement_after_with(tokens: list[Token]) -> str | None:
     return None
 
 
-@lru_cache(maxsize=512)
 def detect_statement_type(sql: str) -> str:
     """
     Detect if a SQL statement returns rows using advanced sqlparse analysis.
@@ -407,25 +439,40 @@ def detect_statement_type(sql: str) -> str:
         - Complex nested CTEs are supported through unified scanner analysis
         - Database-specific syntax (PRAGMA, SHOW) is recognized
         - Thread-safe: Can be called concurrently from multiple threads
+        - Results are memoized on the stripped statement text
     """
-    if not sql or not sql.strip():
+    if not sql:
         return EXECUTE_STATEMENT
 
-    parsed = sqlparse.parse(sql.strip())
-    if not parsed:
+    # Empty statements are answered here so they never take up cache entries
+    stripped_sql = sql.strip()
+    if not stripped_sql:
         return EXECUTE_STATEMENT
 
-    stmt = parsed[0]
-    tokens = list(stmt.flatten())
-    if not tokens:
-        return EXECUTE_STATEMENT
+    return _detect_statement_type_cached(stripped_sql)
 
-    try:
-        _, first_token = require_next_token(tokens, 0, "statement keyword")
-    except SplurgeSqlGeneratorTokenizationError:
+
+@lru_cache(maxsize=1024)
+def _detect_statement_type_cached(sql: str) -> str:
+    """
+    Classify a stripped, non-empty SQL statement for detect_statement_type, memoized on its text.
+
+    Args:
+        sql: SQL statement with surrounding whitespace removed
+
+    Returns:
+        'fetch' or 'execute'
+    """
+    # Only the first significant token is needed unless the statement is a CTE, so lex lazily
+    # and stop there instead of lexing and grouping the whole statement
+    first_value = next(
+        (value for ttype, value in sqlparse_tokenize(sql) if ttype not in Whitespace and ttype not in Comment),
+        None,
+    )
+    if not first_value:
         return EXECUTE_STATEMENT
 
-    token_value = normalize_token(first_token)
+    token_value = first_value.strip().upper()
 
     # DESC/DESCRIBE detection (regardless of token type)
     if token_value in ("DESC", "DESCRIBE"):
@@ -434,6 +481,7 @@ def detect_statement_type(sql: str) -> str:
     # CTE detection: WITH ...
     if token_value == _WITH_KEYWORD:
         # Get all tokens after WITH keyword and use unified scanner
+        tokens = _first_statement_tokens(sql)
         after_with_tokens = tokens[1:]  # Skip the WITH token itself
         main_stmt = find_main_statement_after_with(after_with_tokens)
 
@@ -801,14 +849,11 @@ def parse_table_columns(table_body: str) -> dict[str, str]:
         raise SplurgeSqlGeneratorSqlValidationError("No valid column definitions found in table body")
     columns: dict[str, str] = {}
 
-    # Parse the table body as a SQL fragment
-    parsed = sqlparse.parse(table_body)
-    if not parsed:
+    # Only the flat token stream is needed, so lex the fragment without sqlparse's grouping pass
+    tokens = _first_statement_tokens(table_body)
+    if not tokens:
         raise SplurgeSqlGeneratorSqlValidationError("Failed to parse table body with sqlparse")
 
-    # Get tokens from the parsed statement
-    tokens = list(parsed[0].flatten())
-
     # Split by top-level commas
     column_parts = _split_by_top_level_commas(tokens)
 
@@ -828,6 +873,24 @@ def parse_table_columns(table_body: str) -> dict[str, str]:
     return columns
 
 
+def _first_statement_tokens(sql: str) -> list[Token]:
+    """
+    Lex SQL into the same leaf tokens as ``sqlparse.parse(sql)[0].flatten()``.
+
+    Runs sqlparse's lexer and statement splitter but skips the grouping pass: grouping
+    never changes leaf tokens and ``flatten()`` discards it anyway, so this yields the
+    same stream at a fraction of the cost.
+
+    Args:
+        sql: SQL text, such as a statement or a table body
+
+    Returns:
+        List of sqlparse tokens of the first statement, or an empty list if there is none
+    """
+    statement = next(StatementSplitter().process(sqlparse_tokenize(sql)), None)
+    return list(statement.tokens) if statement is not None else []
+
+
 def _split_by_top_level_commas(tokens: list[Token]) -> list[list[Token]]:
     """
     Split tokens by top-level commas (commas not inside parentheses).
@@ -923,8 +986,7 @@ def _extract_column_name_and_type(tokens: list[Token]) -> tuple[str | None, str
         # First clean size specifications
         sql_type = clean_sql_type(sql_type)
         # Remove any remaining constraint keywords that might have been included
-        for keyword in _CONSTRAINT_KEYWORDS:
-            sql_type = sql_type.replace(keyword, "").strip()
+        sql_type = _CONSTRAINT_KEYWORD_PATTERN.sub("", sql_type).strip()
         # Legacy behavior: strip _TYPE suffix for unknown types
         if sql_type.endswith(_TYPE_SUFFIX):
             sql_type = sql_type[:-_TYPE_SUFFIX_LENGTH]
@@ -1007,31 +1069,12 @@ def _extract_tables_from_statement(statement: Statement) -> set[str]:
     """
     table_names: set[str] = set()
 
-    # Convert statement to string and analyze
-    sql_str = str(statement).upper()
+    # Convert statement to string and analyze; the patterns are case-insensitive, so no upper-cased copy
+    sql_str = str(statement)
 
     # Extract from different SQL patterns
-    patterns = [
-        # FROM clause
-        r"FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        # INSERT INTO
-        r"INSERT\s+INTO\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        # UPDATE
-        r"UPDATE\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        # DELETE FROM
-        r"DELETE\s+FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        # JOIN clauses
-        r"JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        r"LEFT\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        r"RIGHT\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        r"INNER\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        r"OUTER\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)",
-        # CTE names
-        r"WITH\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+AS",
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, sql_str, re.IGNORECASE)
+    for pattern in _TABLE_NAME_PATTERNS:
+        matches = pattern.findall(sql_str)
         # Convert matches to lowercase
         table_names.update(match.lower() for match in matches)
 
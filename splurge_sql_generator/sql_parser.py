@@ -7,13 +7,15 @@ This module is licensed under the MIT License.
 """
 
 import re
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import sqlparse
 from sqlparse import tokens as T
 
-from .exceptions import SplurgeSqlGeneratorFileError, SplurgeSqlGeneratorSqlValidationError
+from .exceptions import SplurgeSqlGeneratorSqlValidationError
 from .file_utils import SafeTextFileIoAdapter
 from .sql_helper import (
     FETCH_STATEMENT,
@@ -21,6 +23,7 @@ from .sql_helper import (
     extract_table_names,
     remove_sql_comments,
 )
+from .type_definitions import MethodInfo
 from .utils import (
     format_error_context,
     validate_python_identifier,
@@ -28,14 +31,25 @@ from .utils import (
 
 DOMAINS = ["parser", "sql"]
 
+# Only allow valid Python identifiers for method names
+_METHOD_PATTERN = re.compile(r"^\s*#\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*$", re.MULTILINE)
+# Only allow valid Python identifiers for parameter names
+_PARAM_PATTERN = re.compile(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)\b")
+# Leading SQL keyword used to classify a statement
+_LEADING_KEYWORD_PATTERN = re.compile(r"\s*([A-Za-z]+)")
+# Case-insensitive RETURNING clause check, avoiding an uppercased copy of the query
+_RETURNING_PATTERN = re.compile(r"\bRETURNING\b", re.IGNORECASE)
+
 
 class SqlParser:
     """Parser for SQL files with method name comments."""
 
-    # Only allow valid Python identifiers for method names
-    _METHOD_PATTERN = re.compile(r"^\s*#\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*$", re.MULTILINE)
-    # Only allow valid Python identifiers for parameter names
-    _PARAM_PATTERN = re.compile(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)\b")
+    # Stateless: no per-instance attributes, so instances carry no __dict__
+    __slots__ = ()
+
+    # Compiled patterns are shared module-level objects, kept here for compatibility
+    _METHOD_PATTERN = _METHOD_PATTERN
+    _PARAM_PATTERN = _PARAM_PATTERN
 
     # Query type constants (private)
     _TYPE_SELECT = "select"
@@ -60,7 +74,23 @@ class SqlParser:
     _KW_EXPLAIN = "EXPLAIN"
     _KW_DESC = "DESC"
     _KW_DESCRIBE = "DESCRIBE"
-    _KW_RETURNING = "RETURNING"
+
+    # Leading keyword to query type, split by fetch/execute statement type (private)
+    _FETCH_QUERY_TYPES = {
+        _KW_SELECT: _TYPE_SELECT,
+        _KW_VALUES: _TYPE_VALUES,
+        _KW_SHOW: _TYPE_SHOW,
+        _KW_EXPLAIN: _TYPE_EXPLAIN,
+        _KW_DESC: _TYPE_DESCRIBE,
+        _KW_DESCRIBE: _TYPE_DESCRIBE,
+        _KW_WITH: _TYPE_CTE,
+    }
+    _EXECUTE_QUERY_TYPES = {
+        _KW_INSERT: _TYPE_INSERT,
+        _KW_UPDATE: _TYPE_UPDATE,
+        _KW_DELETE: _TYPE_DELETE,
+        _KW_WITH: _TYPE_CTE,
+    }
 
     def __init__(self) -> None:
         """
@@ -74,6 +104,9 @@ class SqlParser:
         """
         Parse a SQL file and extract class name and method-query mappings.
 
+        Results are memoized per path (as given), file identity, modification time and
+        size, so unchanged files are not re-read or re-parsed on repeated calls.
+
         Args:
             file_path: Path to the SQL file
 
@@ -84,13 +117,36 @@ class SqlParser:
             SplurgeSqlGeneratorFileError: If the SQL file cannot be read or parsed
             SplurgeSqlGeneratorSqlValidationError: If the file format is invalid
         """
+        path = Path(file_path)
         try:
-            file_io = SafeTextFileIoAdapter()
-            content = file_io.read_text(file_path)
-            return self.parse_string(content, file_path)
-        except SplurgeSqlGeneratorFileError:
-            # Re-raise SplurgeSqlGeneratorFileError as-is (already has proper formatting from adapter)
-            raise
+            stat = path.stat()
+        except OSError:
+            # Let the file adapter report missing or unreadable files
+            return self._read_and_parse(file_path)
+
+        # Key on the caller's path so error messages name the file as the caller passed it
+        class_name, method_items = _parse_file_cached(
+            str(file_path), stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+        )
+        return class_name, dict(method_items)
+
+    def _read_and_parse(self, file_path: str | Path) -> tuple[str, dict[str, str]]:
+        """
+        Read a SQL file and parse its content without memoization.
+
+        Args:
+            file_path: Path to the SQL file
+
+        Returns:
+            Tuple of (class_name, method_queries_dict)
+
+        Raises:
+            SplurgeSqlGeneratorFileError: If the SQL file cannot be read or parsed
+            SplurgeSqlGeneratorSqlValidationError: If the file format is invalid
+        """
+        # One validated bytes read and decode; content and errors match SafeTextFileReader
+        content = SafeTextFileIoAdapter().read_utf8_text_direct(file_path)
+        return self.parse_string(content, file_path)
 
     def parse_string(self, content: str, file_path: str | Path | None = None) -> tuple[str, dict[str, str]]:
         """
@@ -106,23 +162,15 @@ class SqlParser:
         Raises:
             SplurgeSqlGeneratorSqlValidationError: If the content format is invalid
         """
-        # Extract class name from first line comment
-        lines = content.split("\n")
-        if not lines or not lines[0].strip().startswith("#"):
+        # Extract class name from first line comment; the remainder holds the methods
+        first_line, _, rest = content.partition("\n")
+        if not first_line.startswith("#"):
             file_context = format_error_context(file_path)
             raise SplurgeSqlGeneratorSqlValidationError(
                 f"First line must be a class comment starting with #{file_context}"
             )
 
-        # Check if first line starts with "#" (before stripping)
-        if not lines[0].startswith("#"):
-            file_context = format_error_context(file_path)
-            raise SplurgeSqlGeneratorSqlValidationError(
-                f"First line must be a class comment starting with #{file_context}"
-            )
-
-        class_comment = lines[0].strip()
-        class_name = class_comment[1:].strip()  # Remove '#' prefix
+        class_name = first_line[1:].strip()  # Remove '#' prefix
 
         # Validate class name using utility function
         try:
@@ -131,7 +179,7 @@ class SqlParser:
             raise SplurgeSqlGeneratorSqlValidationError(str(e)) from e
 
         # Parse methods and queries
-        method_queries = self._extract_methods_and_queries(content, file_path)
+        method_queries = self._extract_methods_and_queries(rest, file_path)
 
         return class_name, method_queries
 
@@ -149,32 +197,43 @@ class SqlParser:
         Raises:
             SplurgeSqlGeneratorSqlValidationError: If method names are invalid
         """
-        method_queries = {}
-
-        # Split content by method comments
-        parts = self._METHOD_PATTERN.split(content)
+        return dict(self._iter_methods_and_queries(content, file_path))
 
-        # Skip the first part (content before first method)
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                method_name = parts[i].strip()
-                sql_query = parts[i + 1].strip()
-
-                # Clean up the SQL query - remove trailing semicolon if present
-                if sql_query.endswith(";"):
-                    sql_query = sql_query[:-1]
+    def _iter_methods_and_queries(self, content: str, file_path: str | Path | None = None) -> Iterator[tuple[str, str]]:
+        """
+        Yield method names and their corresponding SQL queries in file order.
 
-                # Check for valid Python identifier and not a reserved keyword
-                if method_name and sql_query:
-                    try:
-                        validate_python_identifier(method_name, context="method name", file_path=file_path)
-                        method_queries[method_name] = sql_query
-                    except ValueError as e:
-                        raise SplurgeSqlGeneratorSqlValidationError(str(e)) from e
+        Args:
+            content: SQL file content
+            file_path: Optional file path for error messages (default: None)
 
-        return method_queries
+        Yields:
+            Tuples of (method_name, sql_query)
 
-    def get_method_info(self, sql_query: str, file_path: str | Path | None = None) -> dict[str, Any]:
+        Raises:
+            SplurgeSqlGeneratorSqlValidationError: If method names are invalid
+        """
+        # Walk method comment headers in one pass; each body runs up to the next header.
+        # Content before the first header is skipped.
+        headers = _METHOD_PATTERN.finditer(content)
+        header = next(headers, None)
+        while header is not None:
+            next_header = next(headers, None)
+            body_end = next_header.start() if next_header is not None else len(content)
+            method_name = header.group(1).strip()
+            # Clean up the SQL query - remove a single trailing semicolon if present
+            sql_query = content[header.end() : body_end].strip().removesuffix(";")
+            header = next_header
+
+            # Check for valid Python identifier and not a reserved keyword
+            if method_name and sql_query:
+                try:
+                    validate_python_identifier(method_name, context="method name", file_path=file_path)
+                except ValueError as e:
+                    raise SplurgeSqlGeneratorSqlValidationError(str(e)) from e
+                yield method_name, sql_query
+
+    def get_method_info(self, sql_query: str, file_path: str | Path | None = None) -> MethodInfo:
         """
         Analyze SQL query to determine method type and parameters.
         Uses sql_helper.detect_statement_type() for accurate statement type detection.
@@ -184,106 +243,15 @@ class SqlParser:
             file_path: Optional file path for error messages (default: None)
 
         Returns:
-            Dictionary with method analysis info
+            MethodInfo dictionary with method analysis info
 
         Raises:
             SplurgeSqlGeneratorSqlValidationError: If parameter names are invalid
         """
-        # Guard clause: trivial inputs return default analysis without extra work
-        if not sql_query or not sql_query.strip():
-            return {
-                "type": self._TYPE_OTHER,
-                "is_fetch": False,
-                "statement_type": detect_statement_type(sql_query),
-                "parameters": [],
-                "has_returning": False,
-            }
-
-        # Use sql_helper to determine if this is a fetch or execute statement
-        # This leverages the sophisticated sqlparse-based analysis in sql_helper
-        statement_type = detect_statement_type(sql_query)
-        is_fetch = statement_type == FETCH_STATEMENT
-
-        # Determine query type based on statement type and SQL content
-        # Remove comments first for more accurate analysis
-        clean_sql = remove_sql_comments(sql_query)
-        sql_upper = clean_sql.upper().strip()
-
-        # Use statement_type to determine query type more accurately
-        if statement_type == FETCH_STATEMENT:
-            if sql_upper.startswith(self._KW_SELECT):
-                query_type = self._TYPE_SELECT
-            elif sql_upper.startswith(self._KW_VALUES):
-                query_type = self._TYPE_VALUES
-            elif sql_upper.startswith(self._KW_SHOW):
-                query_type = self._TYPE_SHOW
-            elif sql_upper.startswith(self._KW_EXPLAIN):
-                query_type = self._TYPE_EXPLAIN
-            elif sql_upper.startswith(self._KW_DESC) or sql_upper.startswith(self._KW_DESCRIBE):
-                query_type = self._TYPE_DESCRIBE
-            elif sql_upper.startswith(self._KW_WITH):
-                query_type = self._TYPE_CTE
-            else:
-                query_type = self._TYPE_OTHER
-        else:
-            # Execute statements
-            if sql_upper.startswith(self._KW_INSERT):
-                query_type = self._TYPE_INSERT
-            elif sql_upper.startswith(self._KW_UPDATE):
-                query_type = self._TYPE_UPDATE
-            elif sql_upper.startswith(self._KW_DELETE):
-                query_type = self._TYPE_DELETE
-            elif sql_upper.startswith(self._KW_WITH):
-                query_type = self._TYPE_CTE
-            else:
-                query_type = self._TYPE_OTHER
-
-        # Extract parameters (named parameters like :param_name) ignoring comments and string literals
-        # 1) Remove comments
-        param_scan_sql = remove_sql_comments(sql_query)
-        parameters: list[str] = []
-        seen: set[str] = set()
-        try:
-            parsed_params = sqlparse.parse(param_scan_sql)
-            if parsed_params:
-                tokens = list(parsed_params[0].flatten())
-
-                def next_non_ws(idx: int) -> tuple[int | None, Any]:
-                    j = idx + 1
-                    while j < len(tokens):
-                        t = tokens[j]
-                        # Skip whitespace and comments tokens
-                        if t.is_whitespace or t.ttype in T.Comment:
-                            j += 1
-                            continue
-                        return j, t
-                    return None, None
-
-                for i, tok in enumerate(tokens):
-                    val = str(tok.value)
-                    # Skip anything inside string literals
-                    if tok.ttype in T.Literal.String:
-                        continue
-                    # Direct placeholder like ":param"
-                    if tok.ttype in (T.Name.Placeholder,):
-                        name = val[1:] if val.startswith(":") else val
-                        if name and name not in seen:
-                            seen.add(name)
-                            parameters.append(name)
-                        continue
-                    # Some dialects tokenize ":" and identifier separately
-                    if tok.ttype is T.Punctuation and val == ":":
-                        nxt_idx, nxt_tok = next_non_ws(i)
-                        if nxt_tok and nxt_tok.ttype in (T.Name, T.Name.Placeholder):
-                            name = str(nxt_tok.value)
-                            # Ensure it matches identifier pattern
-                            if self._PARAM_PATTERN.fullmatch(":" + name):
-                                if name not in seen:
-                                    seen.add(name)
-                                    parameters.append(name)
-        except Exception:
-            # Fallback to regex on comment-stripped SQL if sqlparse fails
-            parameters = list(dict.fromkeys(self._PARAM_PATTERN.findall(param_scan_sql)))
+        # Analysis depends only on the SQL text, so it is memoized per query; parameter name
+        # validation runs on every call because its errors mention the caller's file path
+        query_type, statement_type, parameters, has_returning = _analyze_query_cached(sql_query)
+
         # Check for reserved keywords in parameters
         for param in parameters:
             try:
@@ -293,10 +261,10 @@ class SqlParser:
 
         return {
             "type": query_type,
-            "is_fetch": is_fetch,
+            "is_fetch": statement_type == FETCH_STATEMENT,
             "statement_type": statement_type,
-            "parameters": parameters,
-            "has_returning": self._KW_RETURNING in sql_upper,
+            "parameters": list(parameters),
+            "has_returning": has_returning,
         }
 
     def get_table_names(self, sql_query: str) -> list[str]:
@@ -310,3 +278,125 @@ class SqlParser:
             List of table names referenced in the query
         """
         return extract_table_names(sql_query)
+
+
+@lru_cache(maxsize=256)
+def _parse_file_cached(
+    path: str, device: int, inode: int, mtime_ns: int, size: int
+) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """
+    Read and parse a SQL file, memoized on its path and the identity fields of one stat().
+
+    The method-query mapping is returned as an immutable tuple of items so the
+    cached entry cannot be mutated by callers.
+
+    Args:
+        path: SQL file path, as given by the caller (used in error messages)
+        device: File device number (part of the cache key)
+        inode: File inode number (part of the cache key)
+        mtime_ns: File modification time in nanoseconds (part of the cache key)
+        size: File size in bytes (part of the cache key)
+
+    Returns:
+        Tuple of (class_name, ((method_name, sql_query), ...))
+
+    Raises:
+        SplurgeSqlGeneratorFileError: If the SQL file cannot be read or parsed
+        SplurgeSqlGeneratorSqlValidationError: If the file format is invalid
+    """
+    class_name, method_queries = SqlParser()._read_and_parse(path)
+    return class_name, tuple(method_queries.items())
+
+
+@lru_cache(maxsize=512)
+def _analyze_query_cached(sql_query: str) -> tuple[str, str, tuple[str, ...], bool]:
+    """
+    Classify a SQL query and collect its parameter names, memoized on the query text.
+
+    Parameter names are returned unvalidated; SqlParser.get_method_info validates them
+    on every call so error messages can name the caller's file.
+
+    Args:
+        sql_query: SQL query string
+
+    Returns:
+        Tuple of (query_type, statement_type, parameter_names, has_returning)
+    """
+    # Use sql_helper to determine if this is a fetch or execute statement
+    # This leverages the sophisticated sqlparse-based analysis in sql_helper.
+    statement_type = detect_statement_type(sql_query)
+    is_fetch = statement_type == FETCH_STATEMENT
+
+    # Guard clause: trivial inputs return default analysis without extra work
+    if not sql_query or not sql_query.strip():
+        return SqlParser._TYPE_OTHER, statement_type, (), False
+
+    # Determine query type based on statement type and SQL content
+    # Remove comments first for more accurate analysis
+    clean_sql = remove_sql_comments(sql_query)
+
+    # Classify by the leading keyword with a single lookup in the matching table
+    query_types = SqlParser._FETCH_QUERY_TYPES if is_fetch else SqlParser._EXECUTE_QUERY_TYPES
+    keyword_match = _LEADING_KEYWORD_PATTERN.match(clean_sql)
+    keyword = keyword_match.group(1).upper() if keyword_match else ""
+    query_type = query_types.get(keyword, SqlParser._TYPE_OTHER)
+
+    # Extract parameters (named parameters like :param_name) ignoring comments and string literals
+    # 1) Reuse the comment-stripped SQL computed above
+    param_scan_sql = clean_sql
+    parameters: list[str] = []
+    seen: set[str] = set()
+    try:
+        parsed_params = sqlparse.parse(param_scan_sql)
+        if parsed_params:
+            tokens = list(parsed_params[0].flatten())
+
+            def next_non_ws(idx: int) -> tuple[int | None, Any]:
+                j = idx + 1
+                while j < len(tokens):
+                    t = tokens[j]
+                    # Skip whitespace and comments tokens
+                    if t.is_whitespace or t.ttype in T.Comment:
+                        j += 1
+                        continue
+                    return j, t
+                return None, None
+
+            for i, tok in enumerate(tokens):
+                val = str(tok.value)
+                # Skip anything inside string literals
+                if tok.ttype in T.Literal.String:
+                    continue
+                # Direct placeholder like ":param"
+                if tok.ttype in (T.Name.Placeholder,):
+                    name = val[1:] if val.startswith(":") else val
+                    if name and name not in seen:
+                        seen.add(name)
+                        parameters.append(name)
+                    continue
+                # Some dialects tokenize ":" and identifier separately
+                if tok.ttype is T.Punctuation and val == ":":
+                    nxt_idx, nxt_tok = next_non_ws(i)
+                    if nxt_tok and nxt_tok.ttype in (T.Name, T.Name.Placeholder):
+                        name = str(nxt_tok.value)
+                        # Ensure it matches identifier pattern
+                        if _PARAM_PATTERN.fullmatch(":" + name):
+                            if name not in seen:
+                                seen.add(name)
+                                parameters.append(name)
+    except Exception:
+        # Fallback to regex on comment-stripped SQL if sqlparse fails (single ordered-dedup pass)
+        parameters = []
+        seen = set()
+        for match in _PARAM_PATTERN.finditer(param_scan_sql):
+            name = match.group(1)
+            if name not in seen:
+                seen.add(name)
+                parameters.append(name)
+
+    return (
+        query_type,
+        statement_type,
+        tuple(parameters),
+        _RETURNING_PATTERN.search(clean_sql) is not None,
+    )
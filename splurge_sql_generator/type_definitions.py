@@ -36,6 +36,9 @@ class MethodInfo(TypedDict, total=False):
     name: str
     """Method name extracted from SQL comment"""
 
+    type: str
+    """Query type from the leading keyword (select, insert, update, delete, cte, other, etc.)"""
+
     sql_type: str
     """SQL statement type (SELECT, INSERT, UPDATE, DELETE, etc.)"""
 
@@ -10,9 +10,29 @@ This module is licensed under the MIT License.
 """
 
 import re
+from functools import lru_cache
 
 DOMAINS = ["type", "inference"]
 
+# Single-pass scan for "WHERE column <op> :param" and "SET column = :param" contexts.
+# Each alternative captures the column name; the trailing group captures the parameter name.
+_CONTEXT_PATTERN = re.compile(
+    r"\b(?:WHERE\s+(\w+)\s*(?:<=|>=|=|<|>)\s*|WHERE\s+(\w+)\s+(?:LIKE|IN)\s+|SET\s+(\w+)\s*=\s*):(\w+)\b",
+    re.IGNORECASE,
+)
+
+
+# Parameter-name heuristics, tried in priority order. Each alternative is a zero-width
+# lookahead for a substring anywhere in the (lowercased) name, and each group is named
+# after the Python type it implies.
+_NAME_HEURISTIC_PATTERN = re.compile(
+    r"(?P<int>(?=.*(?:id|quantity|count|amount|number|threshold)))"
+    r"|(?P<float>(?=.*(?:price|cost|rate)))"
+    r"|(?P<str>(?=.*(?:name|title|label|description|text|content|term|search|query)))"
+    r"|(?P<bool>(?=.*(?:active|enabled|is_)))",
+    re.DOTALL,
+)
+
 
 class ParameterTypeInferrer:
     """Infers Python types for SQL parameters."""
@@ -32,9 +52,12 @@ class ParameterTypeInferrer:
 
         Tries three strategies in order:
         1. Exact match with column names in schema
-        2. SQL context matching (WHERE/SET clauses)
+        2. SQL context matching (WHERE/SET clauses), skipped when the matched column's
+           SQL type maps to the default (Any) type
         3. Parameter name heuristics
 
+        With no schema loaded only the name heuristics are applied.
+
         Args:
             sql_query: SQL query string
             parameter: Parameter name to infer type for
@@ -49,9 +72,61 @@ class ParameterTypeInferrer:
             >>> inferrer.infer("SELECT * FROM users WHERE name = :name", "name")
             'str'
         """
-        # Extract table names from the SQL query
-        table_names = self._get_table_names_from_sql(sql_query)
+        if not self._schema_parser.table_schemas:
+            # Without a schema only the name heuristics can apply, so skip parsing the query
+            return self._name_heuristics(parameter)
+        return self._infer_with_tables(sql_query, parameter, self._get_table_names_from_sql(sql_query))
+
+    def infer_all(
+        self, sql_query: str, parameters: list[str], *, table_names: list[str] | None = None
+    ) -> dict[str, str]:
+        """
+        Infer Python types for several parameters of the same SQL query.
+
+        Table names are extracted from the query once and shared by every parameter, and
+        WHERE/SET context matches for all parameters are resolved against the schema in a
+        single pass over the referenced tables' columns.
+
+        Args:
+            sql_query: SQL query string
+            parameters: Parameter names to infer types for
+            table_names: Table names already extracted from the query (extracted here if None)
+
+        Returns:
+            Dictionary mapping each parameter name to its Python type annotation
+        """
+        if not self._schema_parser.table_schemas:
+            # Without a schema only the name heuristics can apply, so skip parsing the query
+            return {parameter: self._name_heuristics(parameter) for parameter in parameters}
+        if table_names is None:
+            table_names = self._get_table_names_from_sql(sql_query)
+        # One WHERE/SET context scan of the query and one pass over the schema serve every parameter
+        context_types = self._context_types_by_parameter(sql_query, table_names, parameters) if table_names else {}
+        return {
+            parameter: self._infer_with_tables(sql_query, parameter, table_names, context_types=context_types)
+            for parameter in parameters
+        }
+
+    def _infer_with_tables(
+        self,
+        sql_query: str,
+        parameter: str,
+        table_names: list[str],
+        *,
+        context_types: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Infer Python type for a SQL parameter given the query's table names.
 
+        Args:
+            sql_query: SQL query string
+            parameter: Parameter name to infer type for
+            table_names: Table names referenced by the query
+            context_types: Precomputed SQL context matches for the query's parameters (matched here if None)
+
+        Returns:
+            Python type annotation (str, int, float, bool, dict, Any)
+        """
         if not table_names:
             return "Any"
 
@@ -60,7 +135,11 @@ class ParameterTypeInferrer:
             return type_result
 
         # Second, try SQL context match
-        if type_result := self._sql_context_match(sql_query, parameter, table_names):
+        if context_types is not None:
+            type_result = context_types.get(parameter)
+        else:
+            type_result = self._sql_context_match(sql_query, parameter, table_names)
+        if type_result:
             return type_result
 
         # Finally, try name heuristics
@@ -84,11 +163,18 @@ class ParameterTypeInferrer:
             ):
                 sql_type = self._schema_parser.table_schemas[table_name][parameter]
                 python_type = self._schema_parser.get_python_type(sql_type)
-                return str(python_type) if python_type else None
+                return python_type or None
 
         return None
 
-    def _sql_context_match(self, sql_query: str, parameter: str, table_names: list[str]) -> str | None:
+    def _sql_context_match(
+        self,
+        sql_query: str,
+        parameter: str,
+        table_names: list[str],
+        *,
+        context_columns: dict[str, set[str]] | None = None,
+    ) -> str | None:
         """
         Try to infer type from SQL context (WHERE/SET clauses).
 
@@ -96,42 +182,89 @@ class ParameterTypeInferrer:
             sql_query: SQL query string
             parameter: Parameter name to infer type for
             table_names: List of table names in the query
+            context_columns: Precomputed parameter-to-columns contexts for the query (scanned here if None)
 
         Returns:
             Python type if context match found, None otherwise
         """
-        sql_upper = sql_query.upper()
-        param_placeholder = f":{parameter}"
+        if context_columns is None:
+            context_columns = _context_columns_by_parameter(sql_query)
+
+        # Columns this parameter is compared against or assigned to
+        parameter_columns = context_columns.get(parameter)
+        if not parameter_columns:
+            return None
 
-        # Check if parameter is used in WHERE clause with specific columns
+        # Resolve against the schema in table order, then column order
         for table_name in table_names:
             if table_name not in self._schema_parser.table_schemas:
                 continue
 
             table_schema = self._schema_parser.table_schemas[table_name]
 
-            # Check each column in the table
             for column_name, sql_type in table_schema.items():
-                # Look for patterns like "WHERE column = :parameter" or "SET column = :parameter"
-                # Use regex patterns to handle whitespace variations
-                patterns = [
-                    rf"WHERE\s+{column_name}\s*=\s*{re.escape(param_placeholder)}",
-                    rf"SET\s+{column_name}\s*=\s*{re.escape(param_placeholder)}",
-                    rf"WHERE\s+{column_name}\s*<=\s*{re.escape(param_placeholder)}",
-                    rf"WHERE\s+{column_name}\s*>=\s*{re.escape(param_placeholder)}",
-                    rf"WHERE\s+{column_name}\s*>\s*{re.escape(param_placeholder)}",
-                    rf"WHERE\s+{column_name}\s*<\s*{re.escape(param_placeholder)}",
-                    rf"WHERE\s+{column_name}\s+LIKE\s+{re.escape(param_placeholder)}",
-                    rf"WHERE\s+{column_name}\s+IN\s+{re.escape(param_placeholder)}",
-                ]
-
-                for pattern in patterns:
-                    if re.search(pattern, sql_upper):
-                        python_type = self._schema_parser.get_python_type(sql_type)
-                        return str(python_type) if python_type else None
+                if column_name.lower() in parameter_columns:
+                    return self._informative_python_type(sql_type)
 
         return None
 
+    def _context_types_by_parameter(
+        self, sql_query: str, table_names: list[str], parameters: list[str]
+    ) -> dict[str, str]:
+        """
+        Resolve the SQL context match of every parameter in a query at once.
+
+        Builds a reverse index of column name to its first (table order, then column order)
+        schema type, so each parameter costs a few dict lookups instead of a walk over every
+        column of every table. Results match _sql_context_match for each parameter.
+
+        Args:
+            sql_query: SQL query string
+            table_names: List of table names in the query
+            parameters: Parameter names to resolve
+
+        Returns:
+            Dictionary mapping parameter names to Python types; parameters without a match are omitted
+        """
+        context_columns = _context_columns_by_parameter(sql_query)
+        if not context_columns:
+            return {}
+
+        # Column name -> (position, SQL type) of its first occurrence across the query's tables
+        column_index: dict[str, tuple[int, str]] = {}
+        for table_name in table_names:
+            table_schema = self._schema_parser.table_schemas.get(table_name)
+            if not table_schema:
+                continue
+            for column_name, sql_type in table_schema.items():
+                column_index.setdefault(column_name.lower(), (len(column_index), sql_type))
+
+        context_types: dict[str, str] = {}
+        for parameter in parameters:
+            parameter_columns = context_columns.get(parameter, ())
+            matches = [column_index[column] for column in parameter_columns if column in column_index]
+            if matches and (python_type := self._informative_python_type(min(matches)[1])):
+                context_types[parameter] = python_type
+        return context_types
+
+    def _informative_python_type(self, sql_type: str) -> str | None:
+        """
+        Map a context-matched column's SQL type, ignoring types that carry no information.
+
+        A column whose SQL type is missing from the mapping (or mapped to Any) would otherwise
+        override the name heuristics with the default type, so such matches are dropped.
+
+        Args:
+            sql_type: SQL type of the matched column
+
+        Returns:
+            Python type, or None if it is empty, Any or the mapping's default type
+        """
+        python_type: str = self._schema_parser.get_python_type(sql_type)
+        if not python_type or python_type in ("Any", self._schema_parser.default_python_type):
+            return None
+        return python_type
+
     def _name_heuristics(self, parameter: str) -> str:
         """
         Infer type from common parameter naming patterns.
@@ -142,35 +275,11 @@ class ParameterTypeInferrer:
         Returns:
             Python type annotation (default: "Any")
         """
-        parameter_lower = parameter.lower()
-
-        # Common patterns for different types
-        if any(suffix in parameter_lower for suffix in ["_id", "id"]):
-            return "int"
-        elif any(
-            suffix in parameter_lower
-            for suffix in [
-                "_quantity",
-                "quantity",
-                "count",
-                "amount",
-                "number",
-                "threshold",
-            ]
-        ):
-            return "int"
-        elif any(suffix in parameter_lower for suffix in ["_price", "price", "cost", "rate"]):
-            return "float"
-        elif any(suffix in parameter_lower for suffix in ["_name", "name", "title", "label"]):
-            return "str"
-        elif any(suffix in parameter_lower for suffix in ["_description", "description", "text", "content"]):
-            return "str"
-        elif any(suffix in parameter_lower for suffix in ["_term", "term", "search", "query"]):
-            return "str"
-        elif any(suffix in parameter_lower for suffix in ["_active", "active", "enabled", "is_"]):
-            return "bool"
-
-        return "Any"
+        # One anchored match tries the buckets in priority order; the group name is the type
+        match = _NAME_HEURISTIC_PATTERN.match(parameter.lower())
+        if match is None or match.lastgroup is None:
+            return "Any"
+        return match.lastgroup
 
     def _get_table_names_from_sql(self, sql_query: str) -> list[str]:
         """
@@ -182,10 +291,42 @@ class ParameterTypeInferrer:
         Returns:
             List of table names (in lowercase)
         """
-        from .sql_helper import extract_table_names
+        # Memoized per query: infer() is typically called once per parameter of the same query
+        return list(_table_names_cached(sql_query))
+
+
+def _context_columns_by_parameter(sql_query: str) -> dict[str, set[str]]:
+    """
+    Map each parameter to the columns it is compared against or assigned to, in one scan.
+
+    Args:
+        sql_query: SQL query string
+
+    Returns:
+        Dictionary mapping parameter names to lowercase column names from WHERE/SET contexts
+    """
+    context_columns: dict[str, set[str]] = {}
+    for match in _CONTEXT_PATTERN.finditer(sql_query):
+        where_compare, where_keyword, set_assign, param_name = match.groups()
+        context_columns.setdefault(param_name, set()).add((where_compare or where_keyword or set_assign).lower())
+    return context_columns
+
+
+@lru_cache(maxsize=128)
+def _table_names_cached(sql_query: str) -> tuple[str, ...]:
+    """
+    Extract table names from a SQL query, memoized on the query text.
+
+    Args:
+        sql_query: SQL query string
+
+    Returns:
+        Tuple of table names (in lowercase); empty if extraction fails
+    """
+    from .sql_helper import extract_table_names
 
-        try:
-            return extract_table_names(sql_query)
-        except Exception:
-            # If extraction fails, return empty list
-            return []
+    try:
+        return tuple(extract_table_names(sql_query))
+    except Exception:
+        # If extraction fails, return no table names
+        return ()
@@ -11,6 +11,7 @@ This module is licensed under the MIT License.
 
 import keyword
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -36,10 +37,14 @@ _YAML_EXTENSION = ".yaml"
 _DEFAULT_ENCODING = "utf-8"
 
 
+@lru_cache(maxsize=512)
 def to_snake_case(class_name: str) -> str:
     """
     Convert PascalCase class name to snake_case filename.
 
+    Results are memoized since the same class names are converted repeatedly
+    during generation and reporting.
+
     Args:
         class_name: PascalCase class name (e.g., 'UserRepository')
 
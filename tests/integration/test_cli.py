@@ -4,26 +4,25 @@ import subprocess
 import sys
 import tempfile
 
-from tests.unit.test_utils import create_basic_schema, create_sql_with_schema
+from splurge_sql_generator.cli import _PARSER, _first_schema_in, _iter_sql_files, build_parser
+from tests.unit.test_utils import CliResult, create_basic_schema, create_sql_with_schema, run_cli_in_process
 
 
-def run_cli(args, input_sql=None):
-    """Run the CLI as a module rather than as a script."""
-    cmd = [sys.executable, "-m", "splurge_sql_generator.cli"] + args
+def run_cli(args, input_sql=None) -> CliResult:
+    """Run the CLI entry point in-process."""
     if input_sql:
         with tempfile.NamedTemporaryFile("w+", delete=False, suffix=".sql") as f:
             f.write(input_sql)
             fname = f.name
         args = [fname] + args[1:]
-        cmd = [sys.executable, "-m", "splurge_sql_generator.cli"] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = run_cli_in_process(args)
     if input_sql:
         os.remove(fname)
     return result
 
 
 def test_cli_help():
-    """Test CLI help output."""
+    """Test CLI help output from the module entry point (kept as a subprocess smoke test)."""
     result = subprocess.run(
         [sys.executable, "-m", "splurge_sql_generator.cli", "--help"],
         capture_output=True,
@@ -34,6 +33,31 @@ def test_cli_help():
     assert result.returncode == 0
 
 
+def test_parser_usage_uses_fixed_program_name():
+    """Usage lines name the console script regardless of the importing program's sys.argv[0]."""
+    assert build_parser().format_usage().startswith("usage: splurge-sql-generator ")
+    assert _PARSER.format_usage().startswith("usage: splurge-sql-generator ")
+
+    result = run_cli(["--invalid-option"])
+    assert "usage: splurge-sql-generator " in result.stderr
+
+
+def test_build_parser_help_matches_cli():
+    """Test that build_parser() exposes the same help text as the CLI."""
+    parser = build_parser()
+    help_text = parser.format_help()
+    assert "Generate Python SQLAlchemy classes" in help_text
+    assert "--generate-types" in help_text
+    assert parser.parse_args(["a.sql", "--dry-run"]).dry_run is True
+
+
+def test_build_parser_returns_fresh_instance():
+    """Test that build_parser() does not hand out the shared module-level parser."""
+    parser = build_parser()
+    assert parser is not _PARSER
+    assert parser.format_help() == _PARSER.format_help()
+
+
 def test_cli_missing_file():
     """Test CLI with non-existent file."""
     result = run_cli(["not_a_file.sql"])
@@ -182,6 +206,66 @@ def test_cli_directory_processing(tmp_path):
     assert "class_two.py" in result.stdout
 
 
+def test_iter_sql_files_recurses_nested_directories(tmp_path):
+    """Recursive discovery finds nested .sql files only and matches Path.rglob."""
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (tmp_path / "top.sql").write_text("# Top\n")
+    (nested / "deep.sql").write_text("# Deep\n")
+    (nested / "notes.txt").write_text("ignored")
+
+    discovered = sorted(_iter_sql_files(tmp_path))
+    assert discovered == sorted(str(p) for p in tmp_path.rglob("*.sql"))
+    assert len(discovered) == 2
+
+
+def test_iter_sql_files_skips_unreadable_directories(tmp_path, monkeypatch):
+    """A directory that cannot be listed is skipped instead of aborting discovery."""
+    import splurge_sql_generator.cli as cli_module
+
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "hidden.sql").write_text("# Hidden\n")
+    (tmp_path / "top.sql").write_text("# Top\n")
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.normpath(path) == str(locked):
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(cli_module.os, "scandir", scandir)
+    assert list(_iter_sql_files(tmp_path)) == [str(tmp_path / "top.sql")]
+    assert list(_iter_sql_files(locked)) == []
+
+
+def test_first_schema_in_sees_schema_created_after_lookup(tmp_path, monkeypatch):
+    """Schema lookups are not cached across calls, so new files and chdir are honoured."""
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+
+    assert _first_schema_in(str(first_dir)) is None
+    (first_dir / "late.schema").write_text(create_basic_schema())
+    assert _first_schema_in(str(first_dir)) == str(first_dir / "late.schema")
+
+    (second_dir / "other.schema").write_text(create_basic_schema())
+    monkeypatch.chdir(first_dir)
+    assert _first_schema_in(".") == os.path.join(".", "late.schema")
+    monkeypatch.chdir(second_dir)
+    assert _first_schema_in(".") == os.path.join(".", "other.schema")
+
+
+def test_first_schema_in_matches_glob_for_dotfiles(tmp_path):
+    """Schema discovery keeps pathlib glob semantics, which match names starting with "."."""
+    (tmp_path / ".hidden.schema").write_text(create_basic_schema())
+    (tmp_path / "visible.schema").write_text(create_basic_schema())
+
+    assert _first_schema_in(str(tmp_path)) == min(str(p) for p in tmp_path.glob("*.schema"))
+    assert _first_schema_in(str(tmp_path)) == str(tmp_path / ".hidden.schema")
+
+
 def test_cli_empty_directory(tmp_path):
     """Test CLI with empty directory."""
     empty_dir = tmp_path / "empty_dir"
@@ -377,21 +461,13 @@ def test_cli_large_sql_file(tmp_path):
 
 def test_cli_no_arguments():
     """Test CLI with no arguments."""
-    result = subprocess.run(
-        [sys.executable, "-m", "splurge_sql_generator.cli"],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli([])
     assert result.returncode != 0
     assert "arguments are required" in result.stderr
 
 
 def test_cli_invalid_option():
     """Test CLI with invalid option."""
-    result = subprocess.run(
-        [sys.executable, "-m", "splurge_sql_generator.cli", "--invalid-option"],
-        capture_output=True,
-        text=True,
-    )
+    result = run_cli(["--invalid-option"])
     assert result.returncode != 0
     assert "unrecognized arguments" in result.stderr
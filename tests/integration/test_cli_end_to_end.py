@@ -3,12 +3,12 @@ import subprocess
 import sys
 from pathlib import Path
 
-from tests.unit.test_utils import create_basic_schema, create_sql_with_schema
+from tests.unit.test_utils import CliResult, create_basic_schema, create_sql_with_schema, run_cli_in_process
 
 
-def run_cli(args: list[str]) -> subprocess.CompletedProcess:
-    """Run the CLI as a module rather than as a script."""
-    return subprocess.run([sys.executable, "-m", "splurge_sql_generator.cli", *args], capture_output=True, text=True)
+def run_cli(args: list[str]) -> CliResult:
+    """Run the CLI entry point in-process."""
+    return run_cli_in_process(args)
 
 
 def test_end_to_end_single_file_output_dir(tmp_path: Path):
@@ -26,6 +26,29 @@ SELECT * FROM users WHERE id = :user_id;
     assert "Generated 1 Python classes" in proc.stdout
 
 
+def test_end_to_end_module_entry_point_matches_in_process(tmp_path: Path):
+    """One real ``python -m`` run keeps the entry point covered; it must write what main() writes."""
+    sql = """# UserRepo
+#get_user
+SELECT * FROM users WHERE id = :user_id;
+"""
+    sql_file, schema_file = create_sql_with_schema(tmp_path, "user.sql", sql, create_basic_schema("users"))
+
+    module_out = tmp_path / "module_out"
+    proc = subprocess.run(
+        [sys.executable, "-m", "splurge_sql_generator.cli", str(sql_file), "-o", str(module_out)],
+        capture_output=True,
+        text=True,
+    )
+    in_process_out = tmp_path / "in_process_out"
+    result = run_cli([str(sql_file), "-o", str(in_process_out), "--schema", str(schema_file)])
+
+    assert proc.returncode == 0, proc.stderr
+    assert result.returncode == 0, result.stderr
+    assert proc.stdout.replace(str(module_out), "<out>") == result.stdout.replace(str(in_process_out), "<out>")
+    assert (module_out / "user_repo.py").read_text() == (in_process_out / "user_repo.py").read_text()
+
+
 def test_end_to_end_multiple_files_single_schema(tmp_path: Path):
     # Shared schema referenced via --schema
     shared_schema = tmp_path / "shared.schema"
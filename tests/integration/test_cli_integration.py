@@ -96,3 +96,20 @@ SELECT * FROM users WHERE id = :user_id;
                 assert "def get_user(" in content
             finally:
                 sys.stdout = old_stdout
+
+    def test_cli_with_explicit_argv(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test CLI invoked in-process with an explicit argument list."""
+        sql_content = """# ArgvRepository
+# get_data
+SELECT * FROM test_table WHERE id = :id;
+"""
+
+        with temp_sql_files(sql_content, create_basic_schema("test_table")) as (
+            sql_file,
+            schema_file,
+        ):
+            cli_main([sql_file, "--dry-run", "--schema", str(schema_file)])
+
+            output = capsys.readouterr().out
+            assert "class ArgvRepository:" in output
+            assert "def get_data(" in output
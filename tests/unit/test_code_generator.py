@@ -1,8 +1,5 @@
 import ast
 import os
-import shutil
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -14,6 +11,7 @@ from tests.unit.test_utils import (
     create_basic_schema,
     create_complex_schema,
     create_dummy_schema,
+    create_sql_with_schema,
     temp_multiple_sql_files,
     temp_sql_files,
 )
@@ -44,7 +42,7 @@ INSERT INTO users (name, email) VALUES (:name, :email);
         assert_method_parameters(code, "create_user", ["name", "email"])
 
 
-def test_generate_class_output_file(generator, parser):
+def test_generate_class_output_file(generator, parser, tmp_path):
     sql = """# TestClass
 #get_one
 SELECT 1;
@@ -53,25 +51,14 @@ SELECT 1;
     id INTEGER PRIMARY KEY
 );
         """
-    with tempfile.NamedTemporaryFile("w+", delete=False, suffix=".sql") as f:
-        f.write(sql)
-        sql_fname = f.name
-    schema_fname = Path(sql_fname).with_suffix(".schema")
-    with open(schema_fname, "w") as f:
-        f.write(schema)
-    py_fd, py_fname = tempfile.mkstemp(suffix=".py")
-    os.close(py_fd)
-    try:
-        generator.generate_class(sql_fname, output_file_path=py_fname, schema_file_path=schema_fname)
-        assert os.path.exists(py_fname)
-        with open(py_fname) as f:
-            content = f.read()
-            assert "class TestClass" in content
-            assert "def get_one" in content
-    finally:
-        os.remove(sql_fname)
-        os.remove(schema_fname)
-        os.remove(py_fname)
+    sql_file, schema_file = create_sql_with_schema(tmp_path, "q.sql", sql, schema)
+    py_file = tmp_path / "q.py"
+
+    generator.generate_class(str(sql_file), output_file_path=str(py_file), schema_file_path=str(schema_file))
+    assert py_file.exists()
+    content = py_file.read_text()
+    assert "class TestClass" in content
+    assert "def get_one" in content
 
 
 def test_generate_multiple_classes(generator, parser):
@@ -105,6 +92,120 @@ SELECT 2;
         assert_generated_code_structure(result["ClassB"], "ClassB", ["get_b"])
 
 
+def test_generate_multiple_classes_parallel_matches_sequential(generator):
+    sql_files = [(f"# Class{i}\n#get_{i}\nSELECT {i};\n", create_dummy_schema(f"dummy{i}")) for i in range(3)]
+
+    with temp_multiple_sql_files(sql_files) as file_paths:
+        sql_file_paths = [sql_path for sql_path, _ in file_paths]
+        schema_file_path = file_paths[0][1]
+        sequential = generator.generate_multiple_classes(sql_file_paths, schema_file_path=schema_file_path)
+        parallel = generator.generate_multiple_classes(sql_file_paths, schema_file_path=schema_file_path, jobs=2)
+
+        assert parallel == sequential
+        assert list(parallel) == ["Class0", "Class1", "Class2"]
+
+
+def test_generate_multiple_classes_parallel_chunks_keep_input_order(generator):
+    sql_files = [(f"# Class{i}\n#get_{i}\nSELECT {i};\n", create_dummy_schema(f"dummy{i}")) for i in range(12)]
+
+    with temp_multiple_sql_files(sql_files) as file_paths:
+        sql_file_paths = [sql_path for sql_path, _ in file_paths]
+        parallel = generator.generate_multiple_classes(sql_file_paths, schema_file_path=file_paths[0][1], jobs=2)
+
+        assert list(parallel) == [f"Class{i}" for i in range(12)]
+
+
+@pytest.mark.parametrize(
+    ("job_count", "max_workers", "expected"),
+    [(1, 4, 1), (8, 2, 1), (12, 2, 2), (16, 2, 2), (100, 8, 4)],
+)
+def test_map_chunksize(job_count, max_workers, expected):
+    from splurge_sql_generator.code_generator import _map_chunksize
+
+    assert _map_chunksize(job_count, max_workers) == expected
+
+
+def test_generate_multiple_classes_batch_render_matches_single_class(generator):
+    sql_files = [
+        ("# First\n#get_user\nSELECT * FROM users WHERE id = :user_id;\n", create_dummy_schema("users")),
+        ("# Second\n#delete_user\nDELETE FROM users WHERE id = :user_id;\n", create_dummy_schema("users")),
+    ]
+
+    with temp_multiple_sql_files(sql_files) as file_paths:
+        sql_file_paths = [sql_path for sql_path, _ in file_paths]
+        schema_file_path = file_paths[0][1]
+        batch = generator.generate_multiple_classes(sql_file_paths, schema_file_path=schema_file_path)
+
+        for sql_path, class_name in zip(sql_file_paths, ["First", "Second"], strict=True):
+            assert batch[class_name] == generator.generate_class(sql_path, schema_file_path=schema_file_path)
+
+
+def test_generate_multiple_classes_writes_files_before_failing_file(generator, tmp_path):
+    from splurge_sql_generator.exceptions import SplurgeSqlGeneratorFileError
+
+    sql_files = [
+        ("# First\n#get_user\nSELECT * FROM users WHERE id = :user_id;\n", create_dummy_schema("users")),
+        ("# Second\n#get_user\nSELECT * FROM users WHERE id = :user_id;\n", create_dummy_schema("users")),
+    ]
+
+    with temp_multiple_sql_files(sql_files) as file_paths:
+        sql_file_paths = [sql_path for sql_path, _ in file_paths]
+        sql_file_paths.append(str(tmp_path / "missing.sql"))
+        output_dir = tmp_path / "out"
+
+        with pytest.raises(SplurgeSqlGeneratorFileError):
+            generator.generate_multiple_classes(
+                sql_file_paths,
+                output_dir=str(output_dir),
+                schema_file_path=file_paths[0][1],
+            )
+
+        assert (output_dir / "first.py").exists()
+        assert (output_dir / "second.py").exists()
+
+
+def test_validation_and_inference_share_table_extraction(monkeypatch):
+    import splurge_sql_generator.code_generator as code_generator_module
+
+    calls = []
+    original = code_generator_module.extract_table_names
+
+    def counting_extract(sql_query):
+        calls.append(sql_query)
+        return original(sql_query)
+
+    monkeypatch.setattr(code_generator_module, "extract_table_names", counting_extract)
+    generator = PythonCodeGenerator(validate_parameters=True)
+    sql = "# TestClass\n#get_user\nSELECT * FROM users WHERE id = :id AND name = :name;\n#count\nSELECT 1;\n"
+
+    with temp_sql_files(sql, create_basic_schema()) as (sql_file, schema_file):
+        code = generator.generate_class(sql_file, schema_file_path=schema_file)
+
+    assert "id: int" in code
+    assert "name: str" in code
+    assert len(calls) == 1
+
+
+def test_fast_codegen_matches_template(generator):
+    sql = """# TestClass
+#get_user
+SELECT * FROM users
+WHERE id = :user_id;
+
+#create_user
+INSERT INTO users (name, email) VALUES (:name, :email);
+#count_users
+SELECT COUNT(*) FROM users;
+        """
+    fast_generator = PythonCodeGenerator(fast_codegen=True)
+
+    with temp_sql_files(sql, create_basic_schema()) as (sql_file, schema_file):
+        expected = generator.generate_class(sql_file, schema_file_path=schema_file)
+        assert fast_generator.generate_class(sql_file, schema_file_path=schema_file) == expected
+        batch = fast_generator.generate_multiple_classes([sql_file], schema_file_path=schema_file)
+        assert batch["TestClass"] == expected
+
+
 def test_generate_class_invalid_file(generator, parser):
     from splurge_sql_generator.exceptions import SplurgeSqlGeneratorFileError
 
@@ -112,7 +213,7 @@ def test_generate_class_invalid_file(generator, parser):
         generator.generate_class("nonexistent_file.sql", schema_file_path="nonexistent.schema")
 
 
-def test_method_docstring_generation(generator, parser):
+def test_method_docstring_generation(generator, parser, tmp_path):
     # Test that the template correctly generates docstrings for different method types
     # Create a simple test case and verify the generated code contains expected docstring elements
 
@@ -131,45 +232,34 @@ SELECT * FROM users;
 );
         """
 
-    with tempfile.NamedTemporaryFile("w+", delete=False, suffix=".sql") as f:
-        f.write(sql)
-        fname = f.name
-    schema_fname = Path(fname).with_suffix(".schema")
-    with open(schema_fname, "w") as f:
-        f.write(schema)
-
-    try:
-        code = generator.generate_class(fname, schema_file_path=schema_fname)
-
-        # Test method with parameters
-        assert "Select operation: get_user" in code
-        assert "Statement type: fetch" in code
-        assert "Args:" in code
-        assert "connection: SQLAlchemy database connection" in code
-        assert "user_id: Parameter for user_id" in code
-        assert "List of result rows" in code
-
-        # Test method with multiple parameters
-        assert "Insert operation: create_user" in code
-        assert "Statement type: execute" in code
-        assert "name: Parameter for name" in code
-        assert "email: Parameter for email" in code
-        assert "SQLAlchemy Result object" in code
-
-        # Test method with no SQL parameters (only connection)
-        assert "Select operation: get_all" in code
-        assert "Statement type: fetch" in code
-        assert "Args:" in code
-        assert "connection: SQLAlchemy database connection" in code
-        assert "Returns:" in code
-        assert "List of result rows" in code
-
-    finally:
-        os.remove(fname)
-        os.remove(schema_fname)
-
-
-def test_method_body_generation(generator, parser):
+    sql_file, schema_file = create_sql_with_schema(tmp_path, "q.sql", sql, schema)
+    code = generator.generate_class(str(sql_file), schema_file_path=str(schema_file))
+
+    # Test method with parameters
+    assert "Select operation: get_user" in code
+    assert "Statement type: fetch" in code
+    assert "Args:" in code
+    assert "connection: SQLAlchemy database connection" in code
+    assert "user_id: Parameter for user_id" in code
+    assert "List of result rows" in code
+
+    # Test method with multiple parameters
+    assert "Insert operation: create_user" in code
+    assert "Statement type: execute" in code
+    assert "name: Parameter for name" in code
+    assert "email: Parameter for email" in code
+    assert "SQLAlchemy Result object" in code
+
+    # Test method with no SQL parameters (only connection)
+    assert "Select operation: get_all" in code
+    assert "Statement type: fetch" in code
+    assert "Args:" in code
+    assert "connection: SQLAlchemy database connection" in code
+    assert "Returns:" in code
+    assert "List of result rows" in code
+
+
+def test_method_body_generation(generator, parser, tmp_path):
     # Test that the template correctly generates method bodies for different SQL types
     sql = """# TestClass
 #get_user
@@ -183,36 +273,25 @@ INSERT INTO users DEFAULT VALUES;
 );
         """
 
-    with tempfile.NamedTemporaryFile("w+", delete=False, suffix=".sql") as f:
-        f.write(sql)
-        fname = f.name
-    schema_fname = Path(fname).with_suffix(".schema")
-    with open(schema_fname, "w") as f:
-        f.write(schema)
-
-    try:
-        code = generator.generate_class(fname, schema_file_path=schema_fname)
-
-        # Test class method structure
-        assert "@classmethod" in code
-        assert "def get_user(" in code
-        assert "def create_user(" in code
-
-        # Test fetch statement body
-        assert 'sql = """' in code
-        assert "params = {" in code
-        assert '"user_id": user_id,' in code
-        assert "result = connection.execute(text(sql), params)" in code
-        assert "return rows" in code
+    sql_file, schema_file = create_sql_with_schema(tmp_path, "q.sql", sql, schema)
+    code = generator.generate_class(str(sql_file), schema_file_path=str(schema_file))
 
-        # Test execute statement body (no automatic commit)
-        assert "result = connection.execute(text(sql))" in code
-        assert "Executed non-select operation" in code
-        assert "return result" in code
+    # Test class method structure
+    assert "@classmethod" in code
+    assert "def get_user(" in code
+    assert "def create_user(" in code
 
-    finally:
-        os.remove(fname)
-        os.remove(schema_fname)
+    # Test fetch statement body
+    assert 'sql = """' in code
+    assert "params = {" in code
+    assert '"user_id": user_id,' in code
+    assert "result = connection.execute(text(sql), params)" in code
+    assert "return rows" in code
+
+    # Test execute statement body (no automatic commit)
+    assert "result = connection.execute(text(sql))" in code
+    assert "Executed non-select operation" in code
+    assert "return result" in code
 
 
 def test_complex_sql_generation(generator, parser):
@@ -309,7 +388,7 @@ WITH cte AS (SELECT 1) SELECT * FROM cte;
         ast.parse(code)
 
 
-def test_generate_multiple_classes_with_output_dir(generator, parser):
+def test_generate_multiple_classes_with_output_dir(generator, parser, tmp_path):
     sql_files = [
         (
             """# ClassA
@@ -330,24 +409,21 @@ SELECT 2;
     with temp_multiple_sql_files(sql_files) as file_paths:
         sql_file_paths = [sql_path for sql_path, _ in file_paths]
 
-        output_dir = tempfile.mkdtemp()
-        try:
-            schema_file_paths = [schema_path for _, schema_path in file_paths]
-            result = generator.generate_multiple_classes(
-                sql_file_paths,
-                output_dir=output_dir,
-                schema_file_path=schema_file_paths[0],
-            )
-            assert len(result) == 2
-            assert "ClassA" in result
-            assert "ClassB" in result
-
-            # Check that files were created
-            files = os.listdir(output_dir)
-            assert len(files) == 2
-            assert all(f.endswith(".py") for f in files)
-        finally:
-            shutil.rmtree(output_dir, ignore_errors=True)
+        output_dir = tmp_path / "out"
+        schema_file_paths = [schema_path for _, schema_path in file_paths]
+        result = generator.generate_multiple_classes(
+            sql_file_paths,
+            output_dir=str(output_dir),
+            schema_file_path=schema_file_paths[0],
+        )
+        assert len(result) == 2
+        assert "ClassA" in result
+        assert "ClassB" in result
+
+        # Check that files were created
+        files = os.listdir(output_dir)
+        assert len(files) == 2
+        assert all(f.endswith(".py") for f in files)
 
 
 def test_class_methods_only_generation(generator, parser):
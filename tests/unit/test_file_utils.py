@@ -1,7 +1,7 @@
 import pytest
 import yaml
 
-from splurge_sql_generator.exceptions import SplurgeSqlGeneratorConfigurationError
+from splurge_sql_generator.exceptions import SplurgeSqlGeneratorConfigurationError, SplurgeSqlGeneratorFileError
 from splurge_sql_generator.file_utils import SafeTextFileIoAdapter, YamlConfigReader
 
 
@@ -35,6 +35,100 @@ def test_yaml_config_reader_syntax_error_raises(tmp_path):
         reader.read(p)
 
 
+def test_yaml_config_reader_streams_from_file_handle(tmp_path, monkeypatch):
+    p = tmp_path / "conf.yaml"
+    p.write_text("a: 1\r\nb: two\r\n", encoding="utf-8")
+
+    def fail_read_text(self, path, *, encoding="utf-8"):
+        raise AssertionError("read_text should not be used for YAML configs")
+
+    monkeypatch.setattr(SafeTextFileIoAdapter, "read_text", fail_read_text)
+    assert YamlConfigReader().read(p) == {"a": 1, "b": "two"}
+
+
+def test_yaml_config_reader_file_errors(tmp_path):
+    reader = YamlConfigReader()
+    with pytest.raises(SplurgeSqlGeneratorFileError, match="File not found"):
+        reader.read(tmp_path / "missing.yaml")
+
+    p = tmp_path / "latin1.yaml"
+    p.write_bytes("name: caf\xe9\n".encode("latin-1"))
+    with pytest.raises(SplurgeSqlGeneratorFileError, match="Encoding error"):
+        reader.read(p)
+
+
+@pytest.mark.parametrize(
+    ("error_type", "expected_message"),
+    [
+        ("SplurgeSafeIoFileNotFoundError", "File not found"),
+        ("SplurgeSafeIoFileExistsError", "OS error reading"),
+        ("SplurgeSafeIoUnicodeError", "Encoding error reading"),
+        ("SplurgeSafeIoPathValidationError", "Invalid file path"),
+    ],
+)
+def test_safe_text_file_io_adapter_read_error_translation(tmp_path, monkeypatch, error_type, expected_message):
+    """Safe-io read errors map to the message of their most specific known type."""
+    from splurge_sql_generator import file_utils
+    from splurge_sql_generator._vendor.splurge_safe_io import exceptions as safe_io_exceptions
+
+    error_class = getattr(safe_io_exceptions, error_type)
+
+    class FailingReader:
+        def __init__(self, path, *, encoding="utf-8"):
+            pass
+
+        def read(self):
+            raise error_class("boom")
+
+    monkeypatch.setattr(file_utils, "SafeTextFileReader", FailingReader)
+    with pytest.raises(SplurgeSqlGeneratorFileError, match=expected_message) as exc_info:
+        SafeTextFileIoAdapter().read_text(tmp_path / "any.txt")
+    assert isinstance(exc_info.value.__cause__, error_class)
+
+
+def test_safe_text_file_io_adapter_unmapped_error_propagates(tmp_path, monkeypatch):
+    """Safe-io errors without a read message are re-raised unchanged."""
+    from splurge_sql_generator import file_utils
+    from splurge_sql_generator._vendor.splurge_safe_io.exceptions import SplurgeSafeIoValueError
+
+    class FailingReader:
+        def __init__(self, path, *, encoding="utf-8"):
+            pass
+
+        def read(self):
+            raise SplurgeSafeIoValueError("bad value")
+
+    monkeypatch.setattr(file_utils, "SafeTextFileReader", FailingReader)
+    with pytest.raises(SplurgeSafeIoValueError):
+        SafeTextFileIoAdapter().read_text(tmp_path / "any.txt")
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+@pytest.mark.parametrize(
+    "raw",
+    [b"", b"a\n", b"a\r\nb\rc\n\n", b"x\x0by\x0cz\xc2\x85w", "caf\u00e9\u2028end".encode()],
+)
+def test_safe_text_file_io_adapter_read_utf8_text_direct_matches_read_text(tmp_path, raw, use_mmap):
+    path = tmp_path / "direct.sql"
+    path.write_bytes(raw)
+    adapter = SafeTextFileIoAdapter()
+
+    assert adapter.read_utf8_text_direct(path, use_mmap=use_mmap) == adapter.read_text(path)
+
+
+def test_safe_text_file_io_adapter_read_utf8_text_direct_errors_match_read_text(tmp_path):
+    adapter = SafeTextFileIoAdapter()
+    bad_encoding = tmp_path / "latin1.sql"
+    bad_encoding.write_bytes(b"caf\xe9")
+
+    for path in (tmp_path / "missing.sql", tmp_path, bad_encoding):
+        with pytest.raises(SplurgeSqlGeneratorFileError) as direct_error:
+            adapter.read_utf8_text_direct(path)
+        with pytest.raises(SplurgeSqlGeneratorFileError) as reader_error:
+            adapter.read_text(path)
+        assert direct_error.value.message == reader_error.value.message
+
+
 def test_safe_text_file_io_adapter_write_read(tmp_path):
     adapter = SafeTextFileIoAdapter()
     p = tmp_path / "sample.txt"
@@ -42,3 +136,50 @@ def test_safe_text_file_io_adapter_write_read(tmp_path):
     assert adapter.exists(p)
     content = adapter.read_text(p)
     assert content == "hello world"
+
+
+def test_safe_text_file_io_adapter_write_bytes(tmp_path):
+    adapter = SafeTextFileIoAdapter()
+    p = tmp_path / "sample.py"
+    adapter.write_bytes(p, "x = 1\ny = 'é'\n".encode())
+    assert p.read_bytes() == "x = 1\ny = 'é'\n".encode()
+    assert adapter.exists(p)
+
+
+def test_safe_text_file_io_adapter_write_bytes_error_messages(tmp_path, monkeypatch):
+    """write_bytes reports failures with the same messages as write_text."""
+    from pathlib import Path
+
+    adapter = SafeTextFileIoAdapter()
+    target = tmp_path / "missing_dir" / "out.py"
+    with pytest.raises(SplurgeSqlGeneratorFileError) as bytes_error:
+        adapter.write_bytes(target, b"x = 1\n")
+    with pytest.raises(SplurgeSqlGeneratorFileError) as text_error:
+        adapter.write_text(target, "x = 1\n")
+    assert bytes_error.value.message == text_error.value.message
+
+    def deny(self, data):
+        raise PermissionError(13, "Permission denied", str(self))
+
+    monkeypatch.setattr(Path, "write_bytes", deny)
+    with pytest.raises(SplurgeSqlGeneratorFileError, match="Permission denied writing to"):
+        adapter.write_bytes(tmp_path / "out.py", b"x = 1\n")
+
+
+def test_safe_text_file_io_adapter_open_text_errors_match_read_text(tmp_path):
+    """open_text reports failures with the same messages as read_text."""
+    adapter = SafeTextFileIoAdapter()
+    bad_encoding = tmp_path / "latin1.yaml"
+    bad_encoding.write_bytes(b"caf\xe9")
+
+    for path in (tmp_path / "missing.yaml", bad_encoding):
+        with pytest.raises(SplurgeSqlGeneratorFileError) as stream_error:
+            with adapter.open_text(path) as stream:
+                stream.read()
+        with pytest.raises(SplurgeSqlGeneratorFileError) as reader_error:
+            adapter.read_text(path)
+        assert stream_error.value.message == reader_error.value.message
+
+    with pytest.raises(SplurgeSqlGeneratorFileError, match="Lookup error reading"):
+        with adapter.open_text(bad_encoding, encoding="no-such-codec"):
+            pass
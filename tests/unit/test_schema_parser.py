@@ -7,10 +7,13 @@ focusing on real file operations and SQL parsing.
 
 import os
 import shutil
+import sys
 import tempfile
 
 import pytest
 
+from splurge_sql_generator.exceptions import SplurgeSqlGeneratorFileError
+from splurge_sql_generator.file_utils import SafeTextFileIoAdapter
 from splurge_sql_generator.schema_parser import SchemaParser
 
 
@@ -52,6 +55,76 @@ DEFAULT: Any
     assert mapping["BOOLEAN"] == "bool"
     assert mapping["TIMESTAMP"] == "str"
     assert mapping["DEFAULT"] == "Any"
+    # Loaded type names are interned so equal values share one string object
+    assert mapping["TEXT"] is mapping["TIMESTAMP"]
+    assert mapping["TEXT"] is sys.intern("str")
+
+
+def test_load_sql_type_mapping_shared_until_file_changes(temp_dir):
+    """Parsers share one read-only mapping per file until the file changes."""
+    yaml_file = os.path.join(temp_dir, "shared_types.yaml")
+    with open(yaml_file, "w", encoding="utf-8") as f:
+        f.write("INTEGER: int\nDEFAULT: Any\n")
+
+    first = SchemaParser(sql_type_mapping_file=yaml_file)._sql_type_mapping
+    assert SchemaParser(sql_type_mapping_file=yaml_file)._sql_type_mapping is first
+    with pytest.raises(TypeError):
+        first["INTEGER"] = "str"  # type: ignore[index]
+
+    with open(yaml_file, "w", encoding="utf-8") as f:
+        f.write("INTEGER: str\nDEFAULT: Any\n")
+    os.utime(yaml_file, ns=(0, os.stat(yaml_file).st_mtime_ns + 1_000_000))
+
+    assert SchemaParser(sql_type_mapping_file=yaml_file)._sql_type_mapping["INTEGER"] == "str"
+
+
+def test_load_sql_type_mapping_cached_load_uses_single_stat(temp_dir, monkeypatch):
+    """A cached mapping is found with one stat(), without exists() or a resolve() path walk."""
+    from pathlib import Path
+
+    yaml_file = os.path.join(temp_dir, "stat_only_types.yaml")
+    with open(yaml_file, "w", encoding="utf-8") as f:
+        f.write("INTEGER: int\nDEFAULT: Any\n")
+    first = SchemaParser(sql_type_mapping_file=yaml_file)._sql_type_mapping
+
+    def fail(self, *args, **kwargs):
+        raise AssertionError("only stat() should touch the mapping path on a cache hit")
+
+    monkeypatch.setattr(Path, "resolve", fail)
+    monkeypatch.setattr(Path, "exists", fail)
+    assert SchemaParser(sql_type_mapping_file=yaml_file)._sql_type_mapping is first
+    assert SchemaParser(sql_type_mapping_file=os.path.join(temp_dir, "missing.yaml"))._sql_type_mapping["DEFAULT"]
+
+
+def test_load_sql_type_mapping_normalizes_keys(temp_dir):
+    """Mapping keys are upper-cased at load time; an exactly upper-case key takes precedence."""
+    yaml_file = os.path.join(temp_dir, "mixed_case.yaml")
+    with open(yaml_file, "w", encoding="utf-8") as f:
+        f.write("Text: bytes\nTEXT: str\nvarchar: str\nDefault: Any\n")
+
+    parser = SchemaParser(sql_type_mapping_file=yaml_file)
+
+    assert dict(parser._sql_type_mapping) == {"TEXT": "str", "VARCHAR": "str", "DEFAULT": "Any"}
+    assert parser.get_python_type("text") == "str"
+    assert parser.get_python_type("VarChar(20)") == "str"
+
+
+@pytest.mark.parametrize("sql_type", ["INTEGER", "varchar(255)", "Decimal(10, 2)", "UNKNOWN_THING", ""])
+def test_get_python_type_always_returns_str(parser, sql_type):
+    """Type inference relies on get_python_type returning a str for any input."""
+    assert isinstance(parser.get_python_type(sql_type), str)
+
+
+def test_get_python_type_normalizes_each_raw_type_once(parser):
+    """Repeated lookups of the same raw type reuse the memoized normalization."""
+    from splurge_sql_generator.schema_parser import _normalize_sql_type
+
+    _normalize_sql_type.cache_clear()
+    for _ in range(3):
+        assert parser.get_python_type("varchar(255)") == "str"
+        assert parser.get_python_type("DECIMAL(10, 2)") == "float"
+    assert _normalize_sql_type.cache_info().misses == 2
+    assert _normalize_sql_type.cache_info().hits == 4
 
 
 def test_load_sql_type_mapping_missing_file(parser, temp_dir):
@@ -65,6 +138,16 @@ def test_load_sql_type_mapping_missing_file(parser, temp_dir):
     assert "DEFAULT" in parser._sql_type_mapping
 
 
+def test_default_mapping_shared_and_read_only():
+    """Parsers without a mapping file share one read-only default mapping."""
+    first = SchemaParser(sql_type_mapping_file="nonexistent_file.yaml")
+    second = SchemaParser(sql_type_mapping_file="nonexistent_file.yaml")
+
+    assert first._sql_type_mapping is second._sql_type_mapping
+    with pytest.raises(TypeError):
+        first._sql_type_mapping["INTEGER"] = "str"  # type: ignore[index]
+
+
 def test_custom_yaml_mapping_case_insensitive(parser, temp_dir):
     """Test case insensitive lookups with custom YAML mapping."""
     # Create a custom YAML file with mixed case
@@ -757,6 +840,58 @@ def test_load_schema_for_sql_file_no_schema(parser, temp_dir):
     assert len(parser._table_schemas) == 0
 
 
+def test_load_schema_for_sql_file_shared_schema_parsed_once(temp_dir):
+    """SQL files sharing one schema file reuse a single cached parse across parsers."""
+    from splurge_sql_generator.schema_parser import _parse_schema_file_cached
+
+    schema_file = os.path.join(temp_dir, "shared.schema")
+    with open(schema_file, "w", encoding="utf-8") as f:
+        f.write("CREATE TABLE users (id INTEGER PRIMARY KEY);")
+
+    misses_before = _parse_schema_file_cached.cache_info().misses
+    for name in ("first.sql", "second.sql", "third.sql"):
+        SchemaParser().load_schema_for_sql_file(os.path.join(temp_dir, name), schema_file_path=schema_file)
+    assert _parse_schema_file_cached.cache_info().misses == misses_before + 1
+
+
+def test_preload_many_warms_schema_cache(parser, temp_dir):
+    """preload_many parses each schema once so later loads are cache hits; bad paths are skipped."""
+    from splurge_sql_generator.schema_parser import _parse_schema_file_cached
+
+    schema_files = []
+    for index in range(3):
+        schema_file = os.path.join(temp_dir, f"preload_{index}.schema")
+        with open(schema_file, "w", encoding="utf-8") as f:
+            f.write(f"CREATE TABLE table_{index} (id INTEGER PRIMARY KEY);")
+        schema_files.append(schema_file)
+    missing_file = os.path.join(temp_dir, "missing.schema")
+
+    assert parser.preload_many([*schema_files, schema_files[0], missing_file]) == 3
+    assert parser.table_schemas == {}
+
+    misses_before = _parse_schema_file_cached.cache_info().misses
+    for schema_file in schema_files:
+        parser.load_schema(schema_file)
+    assert _parse_schema_file_cached.cache_info().misses == misses_before
+    assert parser.get_column_type("table_2", "id") == "int"
+
+
+def test_load_schema_interns_names_and_types(parser, temp_dir):
+    """Table names, column names and SQL types are interned so repeats share one string object."""
+    schema_file = os.path.join(temp_dir, "interned.schema")
+    with open(schema_file, "w", encoding="utf-8") as f:
+        f.write(
+            "CREATE TABLE orders (id INTEGER, customer_id INTEGER);\nCREATE TABLE customers (id INTEGER, name TEXT);"
+        )
+
+    parser.load_schema(schema_file)
+    orders = parser.table_schemas["orders"]
+    customers = parser.table_schemas["customers"]
+    assert orders["id"] is customers["id"] is sys.intern("INTEGER")
+    assert next(iter(orders)) is next(iter(customers)) is sys.intern("id")
+    assert next(iter(parser.table_schemas)) is sys.intern("orders")
+
+
 def test_clear_schemas(parser, temp_dir):
     """Test clearing all loaded schemas."""
     # Load some schemas
@@ -874,3 +1009,68 @@ def test_parse_schema_file_with_multiple_statements(parser, temp_dir):
     assert tables["users"]["id"] == "INTEGER"
     assert tables["orders"]["total"] == "DECIMAL"
     assert tables["order_items"]["quantity"] == "INTEGER"
+
+
+def test_load_schema_reparses_after_file_change(parser, temp_dir):
+    """Cached schema parses are keyed on mtime/size and never shared between loads."""
+    schema_file = os.path.join(temp_dir, "cached.schema")
+    with open(schema_file, "w", encoding="utf-8") as f:
+        f.write("CREATE TABLE users (id INTEGER PRIMARY KEY);")
+
+    parser.load_schema(schema_file)
+    parser.table_schemas["users"]["id"] = "TEXT"
+    parser.load_schema(schema_file)
+    assert parser.table_schemas == {"users": {"id": "INTEGER"}}
+
+    with open(schema_file, "w", encoding="utf-8") as f:
+        f.write("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);")
+    os.utime(schema_file, ns=(0, os.stat(schema_file).st_mtime_ns + 1_000_000))
+
+    parser.load_schema(schema_file)
+    assert parser.table_schemas == {"users": {"id": "INTEGER", "name": "TEXT"}}
+
+
+def test_load_schema_does_not_resolve_path(parser, temp_dir, monkeypatch):
+    """Cached schema loads key on one stat() and never walk the path with resolve()."""
+    from pathlib import Path
+
+    schema_file = os.path.join(temp_dir, "no_resolve.schema")
+    with open(schema_file, "w", encoding="utf-8") as f:
+        f.write("CREATE TABLE users (id INTEGER PRIMARY KEY);")
+    parser.load_schema(schema_file)
+
+    def fail_resolve(self, strict=False):
+        raise AssertionError("resolve() should not be called for a cached schema")
+
+    monkeypatch.setattr(Path, "resolve", fail_resolve)
+    cached_parser = SchemaParser()
+    cached_parser.load_schema(schema_file)
+    assert cached_parser.table_schemas == {"users": {"id": "INTEGER"}}
+
+
+def test_load_schema_large_file_uses_memory_map(parser, temp_dir, monkeypatch):
+    """Large schema files are decoded from a memory map with the same result."""
+    import splurge_sql_generator.schema_parser as schema_parser_module
+
+    monkeypatch.setattr(schema_parser_module, "_MMAP_THRESHOLD_BYTES", 1)
+    schema_file = os.path.join(temp_dir, "large.schema")
+    with open(schema_file, "wb") as f:
+        f.write("-- café\r\nCREATE TABLE users (\r\n    id INTEGER PRIMARY KEY,\r\n    name TEXT\r\n);\r\n".encode())
+
+    content = schema_parser_module._read_schema_text(schema_file, os.path.getsize(schema_file))
+    assert content == SafeTextFileIoAdapter().read_text(schema_file)
+    assert content.startswith("-- café\nCREATE TABLE users (\n")
+    parser.load_schema(schema_file)
+    assert parser.table_schemas == {"users": {"id": "INTEGER", "name": "TEXT"}}
+
+
+def test_read_schema_text_large_file_validates_path(temp_dir, monkeypatch):
+    """The memory-map path reports invalid paths with the same error as small files."""
+    import splurge_sql_generator.schema_parser as schema_parser_module
+
+    monkeypatch.setattr(schema_parser_module, "_MMAP_THRESHOLD_BYTES", 1)
+    with pytest.raises(SplurgeSqlGeneratorFileError) as large_error:
+        schema_parser_module._read_schema_text(temp_dir, 4096)
+    with pytest.raises(SplurgeSqlGeneratorFileError) as small_error:
+        SafeTextFileIoAdapter().read_text(temp_dir)
+    assert large_error.value.message == small_error.value.message
@@ -68,6 +68,22 @@ def test_yaml_oserror_fallback():
         assert parser._sql_type_mapping.get("DEFAULT") == "Any"
 
 
+def test_yaml_unexpected_error_propagates(monkeypatch):
+    """Errors other than file, YAML or validation errors are not swallowed by the mapping loader."""
+    from splurge_sql_generator import schema_parser
+
+    def broken_loader(path, device, inode, mtime_ns, size):
+        raise TypeError("bug in mapping loader")
+
+    monkeypatch.setattr(schema_parser, "_load_sql_type_mapping_cached", broken_loader)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yaml_path = Path(temp_dir) / "types.yaml"
+        yaml_path.write_text("INTEGER: int\n", encoding="utf-8")
+
+        with pytest.raises(TypeError, match="bug in mapping loader"):
+            SchemaParser(sql_type_mapping_file=str(yaml_path))
+
+
 def test_yaml_default_override_affects_unknown_types():
     """Custom DEFAULT in YAML should be used for unknown types."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -154,28 +154,32 @@ class TestSqlHelperPublicAPI:
         # Test with None token
         assert normalize_token(None) == ""
 
-    def test_detect_statement_type_comprehensive(self):
+    @pytest.mark.parametrize(
+        ("sql_query", "expected"),
+        [
+            # Fetch statements
+            ("SELECT * FROM users", FETCH_STATEMENT),
+            ("VALUES (1, 'a'), (2, 'b')", FETCH_STATEMENT),
+            ("SHOW TABLES", FETCH_STATEMENT),
+            ("EXPLAIN SELECT * FROM users", FETCH_STATEMENT),
+            ("PRAGMA table_info(users)", FETCH_STATEMENT),
+            ("DESCRIBE users", FETCH_STATEMENT),
+            ("DESC users", FETCH_STATEMENT),
+            # Execute statements
+            ("INSERT INTO users VALUES (1, 'John')", EXECUTE_STATEMENT),
+            ("UPDATE users SET name = 'Jane' WHERE id = 1", EXECUTE_STATEMENT),
+            ("DELETE FROM users WHERE id = 1", EXECUTE_STATEMENT),
+            ("CREATE TABLE users (id INT)", EXECUTE_STATEMENT),
+            ("ALTER TABLE users ADD COLUMN email TEXT", EXECUTE_STATEMENT),
+            ("DROP TABLE users", EXECUTE_STATEMENT),
+            # Edge cases
+            ("", EXECUTE_STATEMENT),
+            ("   \n\t  ", EXECUTE_STATEMENT),
+        ],
+    )
+    def test_detect_statement_type_comprehensive(self, sql_query, expected):
         """Test detect_statement_type with comprehensive SQL examples."""
-        # Fetch statements
-        assert detect_statement_type("SELECT * FROM users") == FETCH_STATEMENT
-        assert detect_statement_type("VALUES (1, 'a'), (2, 'b')") == FETCH_STATEMENT
-        assert detect_statement_type("SHOW TABLES") == FETCH_STATEMENT
-        assert detect_statement_type("EXPLAIN SELECT * FROM users") == FETCH_STATEMENT
-        assert detect_statement_type("PRAGMA table_info(users)") == FETCH_STATEMENT
-        assert detect_statement_type("DESCRIBE users") == FETCH_STATEMENT
-        assert detect_statement_type("DESC users") == FETCH_STATEMENT
-
-        # Execute statements
-        assert detect_statement_type("INSERT INTO users VALUES (1, 'John')") == EXECUTE_STATEMENT
-        assert detect_statement_type("UPDATE users SET name = 'Jane' WHERE id = 1") == EXECUTE_STATEMENT
-        assert detect_statement_type("DELETE FROM users WHERE id = 1") == EXECUTE_STATEMENT
-        assert detect_statement_type("CREATE TABLE users (id INT)") == EXECUTE_STATEMENT
-        assert detect_statement_type("ALTER TABLE users ADD COLUMN email TEXT") == EXECUTE_STATEMENT
-        assert detect_statement_type("DROP TABLE users") == EXECUTE_STATEMENT
-
-        # Edge cases
-        assert detect_statement_type("") == EXECUTE_STATEMENT
-        assert detect_statement_type("   \n\t  ") == EXECUTE_STATEMENT
+        assert detect_statement_type(sql_query) == expected
 
     def test_detect_statement_type_with_cte(self):
         """Test detect_statement_type with Common Table Expressions."""
@@ -1021,6 +1025,134 @@ def test_parse_table_columns_unknown_type_suffix_stripped():
     assert columns["custom"] == "UNKNOWN"
 
 
+def test_parse_table_columns_strips_constraint_keyword_fragments():
+    """Constraint keywords fused into a type token are removed from the column type."""
+    columns = parse_table_columns("id INTEGERNOT NULL, flag CUSTOMKEY_TYPE, name VARCHAR(20) NOT NULL")
+    assert columns == {"id": "INTEGER", "flag": "CUSTOM", "name": "VARCHAR"}
+
+
+@pytest.mark.parametrize(
+    "table_body",
+    [
+        "id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL -- trailing comment",
+        "price DECIMAL(10, 2) DEFAULT 'a;b', /* note */ CONSTRAINT pk PRIMARY KEY (price)",
+        "id INTEGER;  -- ends here\n  name TEXT",
+        "a INT;\n\n b INT",
+    ],
+)
+def test_first_statement_tokens_matches_sqlparse_flatten(table_body):
+    """Lexing without grouping yields the same leaf tokens as sqlparse.parse()."""
+    import sqlparse
+
+    from splurge_sql_generator.sql_helper import _first_statement_tokens
+
+    expected = [(t.ttype, t.value) for t in sqlparse.parse(table_body)[0].flatten()]
+    assert [(t.ttype, t.value) for t in _first_statement_tokens(table_body)] == expected
+
+
+@pytest.mark.parametrize(
+    "sql_text",
+    [
+        "SELECT * FROM users WHERE id = :id;   \nSELECT 1;",
+        "-- header\nSELECT 'a--b' FROM t; /* c */ SELECT 2 -- tail\n",
+        "SELECT /*+ INDEX(t) */ x FROM t\r\n-- note\r\nWHERE y = 1;",
+        "CREATE TABLE t (\n  id INT, -- pk\n  name TEXT /* label */\n);",
+        "SELECT name  \r\n  FROM users\t\nWHERE note = 'a  \n b';",
+        "SELECT 1;\n\n",
+        "SELECT 1 GO 2\n",
+        "   \r\n\t",
+        "SELECT 'multi\r\nline  ' AS s,\r\n  \"quoted\nname\"  \rFROM t",
+        "SELECT x -- a\n-- b\n/* c\n d */\nFROM t # hash\n;",
+        "UPDATE t SET v = '-- not a comment' WHERE id = 1 /* real */;\nDELETE FROM t;",
+        "SELECT 1;\nGO\nSELECT 2; -- after batch\n",
+        "WITH c AS (SELECT 1 /*x*/) SELECT * FROM c\n\n\n",
+        "",
+        "SELECT 1",
+    ],
+)
+def test_remove_sql_comments_matches_sqlparse_format(sql_text):
+    """Comment stripping matches sqlparse.format(strip_comments=True) exactly."""
+    import sqlparse
+
+    assert remove_sql_comments(sql_text) == sqlparse.format(sql_text, strip_comments=True)
+
+
+def test_remove_sql_comments_skips_sqlparse_for_single_statement_without_comments(monkeypatch):
+    """A single statement with no comment marker is rstripped without calling sqlparse.format."""
+    from splurge_sql_generator import sql_helper
+
+    formatted: list[str] = []
+    original_format = sql_helper.sqlparse.format
+    monkeypatch.setattr(
+        sql_helper.sqlparse, "format", lambda sql, **options: formatted.append(sql) or original_format(sql, **options)
+    )
+
+    assert remove_sql_comments("SELECT id  \nFROM users\t\nWHERE id = :id;") == "SELECT id\nFROM users\nWHERE id = :id;"
+    assert formatted == []
+
+    assert remove_sql_comments("SELECT 1; SELECT 2") == "SELECT 1;SELECT 2"
+    assert remove_sql_comments("SELECT 1 # note") == "SELECT 1"
+    assert len(formatted) == 2
+
+
+@pytest.mark.parametrize(
+    ("sql_query", "expected"),
+    [
+        ("DELETE FROM audit_log WHERE id = :id", {"audit_log"}),
+        ("SELECT * FROM a LEFT JOIN b ON a.id = b.id RIGHT JOIN c ON c.id = a.id", {"a", "b", "c"}),
+        ("SELECT * FROM a INNER JOIN b ON a.id = b.id FULL OUTER JOIN c ON c.id = b.id", {"a", "b", "c"}),
+    ],
+)
+def test_extract_table_names_join_and_delete_variants(sql_query, expected):
+    """Qualified JOINs and DELETE FROM are covered by the generic JOIN and FROM patterns."""
+    assert set(extract_table_names(sql_query)) == expected
+
+
+def test_detect_statement_type_memoizes_on_stripped_sql():
+    """Whitespace variants of one statement share a cache entry; empty input is never cached."""
+    from splurge_sql_generator.sql_helper import _detect_statement_type_cached
+
+    _detect_statement_type_cached.cache_clear()
+    assert detect_statement_type("SELECT * FROM users") == FETCH_STATEMENT
+    assert detect_statement_type("  SELECT * FROM users\n") == FETCH_STATEMENT
+    assert detect_statement_type("   ") == EXECUTE_STATEMENT
+    assert detect_statement_type("") == EXECUTE_STATEMENT
+
+    cache_info = _detect_statement_type_cached.cache_info()
+    assert (cache_info.misses, cache_info.hits, cache_info.currsize) == (1, 1, 1)
+
+
+def test_detect_statement_type_lexes_full_statement_only_for_ctes(monkeypatch):
+    """Non-CTE statements are classified from their first significant token alone."""
+    from splurge_sql_generator import sql_helper
+
+    lexed: list[str] = []
+    original = sql_helper._first_statement_tokens
+    monkeypatch.setattr(sql_helper, "_first_statement_tokens", lambda sql: lexed.append(sql) or original(sql))
+    sql_helper._detect_statement_type_cached.cache_clear()
+
+    assert detect_statement_type("-- leading comment\n/* block */ select * from users") == FETCH_STATEMENT
+    assert detect_statement_type("describe users") == FETCH_STATEMENT
+    assert detect_statement_type("UPDATE users SET active = 1") == EXECUTE_STATEMENT
+    assert lexed == []
+
+    assert detect_statement_type("WITH c AS (SELECT 1) DELETE FROM t") == EXECUTE_STATEMENT
+    assert len(lexed) == 1
+
+
+@pytest.mark.parametrize(
+    ("sql_query", "expected"),
+    [
+        ("WITH moved AS (DELETE FROM a RETURNING *) INSERT INTO b SELECT * FROM moved", EXECUTE_STATEMENT),
+        ("WITH recent AS (SELECT * FROM logs WHERE action = 'UPDATE') SELECT * FROM recent", FETCH_STATEMENT),
+        ("WITH a AS (SELECT 1), b AS (SELECT 2) SELECT * FROM a /* then DELETE */", FETCH_STATEMENT),
+    ],
+)
+def test_detect_statement_type_cte_uses_main_statement_not_last_keyword(sql_query, expected):
+    """CTEs are classified by the statement after the CTE list, not by the last DML keyword in the text."""
+    assert detect_statement_type(sql_query) == expected
+
+
 def test_detect_statement_type_with_recursive_cte_and_values():
     """Detect statement type for WITH RECURSIVE and CTE followed by VALUES."""
     sql_recursive = """
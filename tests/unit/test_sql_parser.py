@@ -287,6 +287,35 @@ def test_get_method_info_edge_cases(parser):
     assert info["has_returning"]  # flag still true
 
 
+def test_get_method_info_returning_requires_whole_word(parser):
+    """RETURNING is matched case-insensitively and only as a whole word."""
+    info = parser.get_method_info("insert into t (a) values (:a) returning id")
+    assert info["has_returning"]
+
+    info = parser.get_method_info("SELECT returning_date FROM orders")
+    assert not info["has_returning"]
+
+
+def test_get_method_info_memoizes_analysis_per_query(parser):
+    """Repeated queries reuse one analysis, but each call gets its own dict and validation."""
+    from splurge_sql_generator.sql_parser import _analyze_query_cached
+
+    _analyze_query_cached.cache_clear()
+    sql = "SELECT * FROM users WHERE id = :user_id AND status = :status"
+
+    first = parser.get_method_info(sql)
+    first["parameters"].append("mutated")
+    second = SqlParser().get_method_info(sql)
+
+    assert second["parameters"] == ["user_id", "status"]
+    assert _analyze_query_cached.cache_info().hits == 1
+
+    bad_sql = "SELECT * FROM users WHERE id = :class"
+    for file_path in ("first.sql", "second.sql"):
+        with pytest.raises(SplurgeSqlGeneratorValueError, match=file_path):
+            parser.get_method_info(bad_sql, file_path=file_path)
+
+
 def test_parse_file_not_found(parser):
     from splurge_sql_generator.exceptions import SplurgeSqlGeneratorFileError
 
@@ -294,6 +323,60 @@ def test_parse_file_not_found(parser):
         parser.parse_file("nonexistent_file.sql")
 
 
+def test_parse_file_cache_returns_fresh_dict_and_tracks_changes(parser, tmp_path):
+    sql_file = tmp_path / "cached.sql"
+    sql_file.write_text("# CachedClass\n#get_one\nSELECT 1;\n", encoding="utf-8")
+
+    _, first = parser.parse_file(sql_file)
+    first["injected"] = "SELECT 2"
+    _, second = parser.parse_file(sql_file)
+    assert second == {"get_one": "SELECT 1"}
+
+    sql_file.write_text("# CachedClass\n#get_one\nSELECT 1;\n#get_two\nSELECT 2;\n", encoding="utf-8")
+    os.utime(sql_file, ns=(0, sql_file.stat().st_mtime_ns + 1_000_000))
+    _, third = parser.parse_file(sql_file)
+    assert list(third) == ["get_one", "get_two"]
+
+
+def test_parse_file_normalizes_crlf_newlines(parser, tmp_path):
+    sql_file = tmp_path / "crlf.sql"
+    sql_file.write_bytes(b"# CrlfClass\r\n#get_one\r\nSELECT 1\r\nFROM t;\r\n")
+
+    class_name, methods = parser.parse_file(sql_file)
+    assert class_name == "CrlfClass"
+    assert methods == {"get_one": "SELECT 1\nFROM t"}
+
+
+def test_parse_file_errors_name_the_path_as_given(parser, tmp_path, monkeypatch):
+    """Validation errors name the caller's path, not the resolved absolute path."""
+    (tmp_path / "bad.sql").write_text("SELECT 1;\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    for _ in range(2):  # cache miss, then the same call against the memoized entry
+        with pytest.raises(SplurgeSqlGeneratorSqlValidationError) as exc_info:
+            parser.parse_file("bad.sql")
+        assert str(exc_info.value.message).endswith(" in bad.sql")
+
+
+def test_parse_file_reads_like_safe_text_reader(parser, tmp_path):
+    """Content and read errors match SafeTextFileIoAdapter.read_text."""
+    from splurge_sql_generator.exceptions import SplurgeSqlGeneratorFileError
+    from splurge_sql_generator.file_utils import SafeTextFileIoAdapter
+
+    sql_file = tmp_path / "separators.sql"
+    sql_file.write_bytes(b"# SepClass\x0c#get_one\x0bSELECT 1;\n")
+    class_name, methods = parser.parse_file(sql_file)
+    assert (class_name, methods) == parser.parse_string(SafeTextFileIoAdapter().read_text(sql_file))
+
+    directory = tmp_path / "dir.sql"
+    directory.mkdir()
+    with pytest.raises(SplurgeSqlGeneratorFileError) as parse_error:
+        parser.parse_file(directory)
+    with pytest.raises(SplurgeSqlGeneratorFileError) as read_error:
+        SafeTextFileIoAdapter().read_text(directory)
+    assert parse_error.value.message == read_error.value.message
+
+
 def test_parse_file_encoding(parser):
     # Test with UTF-8 content
     sql = """# TestClass
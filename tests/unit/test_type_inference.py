@@ -97,6 +97,111 @@ class TestParameterTypeInferrer:
         # May be None if no match, or a type string
         assert result is None or isinstance(result, str)
 
+    def test_sql_context_match_set_clause(self, inferrer):
+        """SET/WHERE context is matched case-insensitively and resolves the column type."""
+        sql = "update users set status = :new_status where id = :user_id"
+        assert inferrer._sql_context_match(sql, "new_status", ["users"]) == "str"
+        # A parameter whose name merely starts with another placeholder is not matched
+        assert inferrer._sql_context_match(sql, "new", ["users"]) is None
+
+    def test_context_match_with_default_type_falls_back_to_heuristics(self):
+        """A context column whose SQL type maps to the default type does not override name heuristics."""
+        parser = SchemaParser()
+        parser.load_schema("examples/MSSQLExample.schema")
+        inferrer = ParameterTypeInferrer(parser)
+        # employees.id is declared "INT IDENTITY(1,1)", which has no mapping
+        sql = "SELECT * FROM employees WHERE id = :employee_id"
+
+        assert parser.get_python_type(parser.table_schemas["employees"]["id"]) == "Any"
+        assert inferrer._sql_context_match(sql, "employee_id", ["employees"]) is None
+        assert inferrer.infer(sql, "employee_id") == "int"
+        assert inferrer.infer_all(sql, ["employee_id"]) == {"employee_id": "int"}
+
+    @pytest.mark.parametrize(
+        ("mapping_file", "expected"),
+        [(None, "int"), ("examples/custom_types.yaml", "float")],
+    )
+    def test_context_match_with_custom_type(self, mapping_file, expected):
+        """An unmapped custom column type falls back to name heuristics; a mapped one wins."""
+        parser = SchemaParser(sql_type_mapping_file=mapping_file) if mapping_file else SchemaParser()
+        parser.load_schema("examples/CustomExample.schema")
+        inferrer = ParameterTypeInferrer(parser)
+        sql = "UPDATE custom_items SET amount = :new_amount WHERE id = :id"
+
+        assert inferrer.infer(sql, "new_amount") == expected
+        assert inferrer.infer_all(sql, ["new_amount", "id"])["new_amount"] == expected
+
+    def test_infer_all_extracts_tables_once(self, inferrer, monkeypatch):
+        """infer_all matches per-parameter infer results with a single table-name extraction."""
+        sql = "UPDATE users SET status = :new_status WHERE id = :user_id"
+        expected = {"new_status": inferrer.infer(sql, "new_status"), "user_id": inferrer.infer(sql, "user_id")}
+
+        calls = []
+        original = inferrer._get_table_names_from_sql
+        monkeypatch.setattr(inferrer, "_get_table_names_from_sql", lambda q: calls.append(q) or original(q))
+
+        assert inferrer.infer_all(sql, ["new_status", "user_id"]) == expected
+        assert len(calls) == 1
+
+    def test_infer_all_scans_context_once(self, inferrer, monkeypatch):
+        """infer_all shares one WHERE/SET context scan between parameters."""
+        import splurge_sql_generator.type_inference as type_inference_module
+
+        sql = "UPDATE users SET status = :new_status WHERE id = :target"
+        expected = {"new_status": inferrer.infer(sql, "new_status"), "target": inferrer.infer(sql, "target")}
+        calls = []
+        original = type_inference_module._context_columns_by_parameter
+        monkeypatch.setattr(
+            type_inference_module, "_context_columns_by_parameter", lambda q: calls.append(q) or original(q)
+        )
+
+        assert inferrer.infer_all(sql, ["new_status", "target"]) == expected
+        assert expected["new_status"] == "str"
+        assert len(calls) == 1
+
+    def test_context_types_match_per_parameter_context_match(self):
+        """The per-query context index resolves each parameter like _sql_context_match, first table winning."""
+        parser = SchemaParser()
+        parser._table_schemas = {
+            "orders": {"order_no": "INTEGER", "status": "TEXT", "total": "DECIMAL(10,2)", "code": "GEOMETRY"},
+            "items": {"status": "BOOLEAN", "sku": "VARCHAR(20)"},
+        }
+        inferrer = ParameterTypeInferrer(parser)
+        sql = "UPDATE orders SET total = :amt WHERE status = :st; UPDATE orders SET code = :cd"
+        table_names = ["orders", "items"]
+        parameters = ["amt", "st", "cd", "s", "missing"]
+
+        context_types = inferrer._context_types_by_parameter(sql, table_names, parameters)
+        assert context_types == {"amt": "float", "st": "str"}
+        for parameter in parameters:
+            assert context_types.get(parameter) == inferrer._sql_context_match(sql, parameter, table_names)
+
+    def test_infer_without_schema_skips_table_extraction(self, monkeypatch):
+        """With no schema loaded, inference uses name heuristics and never parses the query."""
+        inferrer = ParameterTypeInferrer(SchemaParser())
+
+        def fail_extraction(sql_query):
+            raise AssertionError("table names should not be extracted without a schema")
+
+        monkeypatch.setattr(inferrer, "_get_table_names_from_sql", fail_extraction)
+        sql = "SELECT * FROM users WHERE id = :user_id AND name = :name"
+
+        assert inferrer.infer(sql, "user_id") == "int"
+        assert inferrer.infer_all(sql, ["user_id", "name", "flag"]) == {"user_id": "int", "name": "str", "flag": "Any"}
+
+    def test_infer_reuses_table_names_per_query(self, inferrer, monkeypatch):
+        """Repeated infer() calls on one query parse its table names once."""
+        import splurge_sql_generator.sql_helper as sql_helper_module
+
+        calls = []
+        original = sql_helper_module.extract_table_names
+        monkeypatch.setattr(sql_helper_module, "extract_table_names", lambda q: calls.append(q) or original(q))
+        sql = "SELECT * FROM users WHERE status = :status AND created_at > :since -- per-query memo"
+
+        assert inferrer.infer(sql, "status") == inferrer.infer(sql, "status")
+        inferrer.infer(sql, "since")
+        assert len(calls) == 1
+
     def test_name_heuristics_method(self, inferrer):
         """Test _name_heuristics method."""
         # Test various patterns
@@ -106,6 +211,13 @@ class TestParameterTypeInferrer:
         assert inferrer._name_heuristics("active") == "bool"
         assert inferrer._name_heuristics("unknown") == "Any"
 
+    def test_name_heuristics_bucket_priority(self, inferrer):
+        """Earlier buckets win even when a later bucket's word appears first in the name."""
+        assert inferrer._name_heuristics("name_id") == "int"
+        assert inferrer._name_heuristics("label_rate") == "float"
+        assert inferrer._name_heuristics("is_search_text") == "str"
+        assert inferrer._name_heuristics("Is_Enabled") == "bool"
+
     def test_get_table_names_from_sql(self, inferrer):
         """Test _get_table_names_from_sql method."""
         sql = "SELECT * FROM users WHERE id = :id"
@@ -4,11 +4,51 @@ Test utilities for splurge-sql-generator tests.
 This module provides common helper functions and fixtures used across multiple test files.
 """
 
+import io
 import re
 import tempfile
 from collections.abc import Generator
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from pathlib import Path
+from typing import NamedTuple
+
+from splurge_sql_generator import cli
+
+
+class CliResult(NamedTuple):
+    """Exit code and captured output of an in-process CLI run."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def run_cli_in_process(args: list[str]) -> CliResult:
+    """
+    Run splurge_sql_generator.cli.main in-process, capturing stdout and stderr.
+
+    Mirrors what a subprocess run of ``python -m splurge_sql_generator.cli`` reports, without
+    paying interpreter startup per call: sys.exit() and argparse exits become the return code.
+
+    Args:
+        args: Command line arguments (excluding the program name)
+
+    Returns:
+        CliResult with returncode, stdout and stderr
+    """
+    with redirect_stdout(io.StringIO()) as out, redirect_stderr(io.StringIO()) as err:
+        try:
+            cli.main(args)
+            returncode = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                returncode = 0
+            elif isinstance(exc.code, int):
+                returncode = exc.code
+            else:
+                print(exc.code, file=err)
+                returncode = 1
+    return CliResult(returncode, out.getvalue(), err.getvalue())
 
 
 @contextmanager